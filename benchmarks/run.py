@@ -0,0 +1,210 @@
+from __future__ import annotations
+import os, sys, json, time, argparse, platform, subprocess
+from pathlib import Path
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1].joinpath("src")))
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from curl_cffi import CurlHttpVersion
+from benchmarks.server import NseStandInServer
+from nse_announcements import Announcement, NseFetch, IssuerCache, RequestScheduler
+from nse_announcements.base import NseFetchBase
+
+RESULTS_DIR: Path = Path(__file__).resolve().parent.joinpath("results")
+
+
+def get_version() -> str:
+    try:
+        from importlib.metadata import version
+
+        return version("nse_announcements")
+    except Exception:
+        return "unknown"
+
+
+def get_git_revision() -> Optional[str]:
+    try:
+        return (
+            subprocess.check_output(
+                ["git", "describe", "--always", "--dirty"],
+                cwd=Path(__file__).resolve().parent,
+                stderr=subprocess.DEVNULL,
+            )
+            .decode()
+            .strip()
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def summarize(samples: List[float], items: int = 1) -> Dict[str, float]:
+    values = sorted(samples)
+    total = sum(values)
+
+    def quantile(q: float) -> float:
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    return {
+        "count": len(values),
+        "mean": total / len(values),
+        "p50": quantile(0.50),
+        "p90": quantile(0.90),
+        "p99": quantile(0.99),
+        "max": values[-1],
+        "throughput": items * len(values) / total if total > 0 else 0.0,
+    }
+
+
+def measure(fn: Callable[[], Any], repeat: int, warmup: int = 1) -> List[float]:
+    for _ in range(warmup):
+        fn()
+    samples: List[float] = []
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started_at)
+    return samples
+
+
+def bench_parse(server: NseStandInServer, repeat: int) -> Dict[str, Dict[str, float]]:
+    return {
+        "parse_json_decode": summarize(
+            measure(lambda: NseFetchBase.loads(server.body), repeat)
+        ),
+        "parse_dataframe_build": summarize(
+            measure(lambda: NseFetchBase.records_to_dataframe(server.records), repeat)
+        ),
+        "parse_records_build": summarize(
+            measure(lambda: Announcement.from_records(server.records), repeat)
+        ),
+    }
+
+
+def bench_client(
+    nsefetch: NseFetch, repeat: int, symbols: List[str], concurrency: int
+) -> Dict[str, Dict[str, float]]:
+    results: Dict[str, Dict[str, float]] = {}
+    results["single_poll"] = summarize(
+        measure(lambda: nsefetch.get_corporate_announcement(), repeat)
+    )
+    days = iter(range(1, 10 * (repeat + 1)))
+
+    def distinct() -> None:
+        day = (date.today() - timedelta(days=next(days))).strftime("%d-%m-%Y")
+        nsefetch.get_corporate_announcement(
+            data_for=NseFetchBase.CUSTOM, from_date=day, to_date=day
+        )
+
+    results["single_distinct"] = summarize(measure(distinct, repeat))
+    results["batched_symbols"] = summarize(
+        measure(
+            lambda: nsefetch.get_corporate_announcements_many(
+                symbols, concurrency=concurrency
+            ),
+            max(1, repeat // 10),
+        ),
+        items=len(symbols),
+    )
+    return results
+
+
+def compare(current: Dict[str, Any], baseline_file: Path) -> None:
+    with open(baseline_file, "r", encoding="utf-8") as fp:
+        baseline = json.load(fp)
+    print(
+        f"\nComparing Against {baseline_file.name} "
+        + f"(version {baseline.get('version')}, git {baseline.get('git')})"
+    )
+    print(f"{'benchmark':<24}{'baseline p50':>16}{'current p50':>16}{'change':>10}")
+    for name, result in current["results"].items():
+        if name not in baseline["results"]:
+            continue
+        before, after = baseline["results"][name]["p50"], result["p50"]
+        change = (after - before) / before * 100.0 if before > 0 else 0.0
+        print(f"{name:<24}{before * 1e3:>14.3f}ms{after * 1e3:>14.3f}ms{change:>9.1f}%")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        description="Benchmark nse_announcements against a local NSE stand-in server."
+    )
+    parser.add_argument("--payload", help="Recorded corporate-announcements JSON to replay")
+    parser.add_argument("--records", type=int, default=2000)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--symbols", type=int, default=100)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--output", type=Path, default=RESULTS_DIR)
+    parser.add_argument("--compare", type=Path, help="Previous results file to diff against")
+    args = parser.parse_args(argv)
+
+    with NseStandInServer(
+        payload=args.payload,
+        records=args.records,
+        latency=args.latency,
+        jitter=args.jitter,
+        error_rate=args.error_rate,
+    ) as server:
+        root, NseFetchBase.ROOT = NseFetchBase.ROOT, server.url
+        try:
+            nsefetch = NseFetch(
+                debug=False,
+                http_version=CurlHttpVersion.V1_1,
+                issuer_cache=IssuerCache(persist=False),
+                scheduler=RequestScheduler(
+                    rate=(1e6, 1_000_000), route_limits={}, backoff_base=0.01
+                ),
+            )
+            try:
+                results = bench_parse(server, args.repeat)
+                results.update(
+                    bench_client(
+                        nsefetch,
+                        args.repeat,
+                        [f"SYM{n}" for n in range(args.symbols)],
+                        args.concurrency,
+                    )
+                )
+            finally:
+                nsefetch.close()
+        finally:
+            NseFetchBase.ROOT = root
+        calls = dict(server.calls)
+
+    current = {
+        "version": get_version(),
+        "git": get_git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "config": {
+            key: str(value) if isinstance(value, Path) else value
+            for key, value in vars(args).items()
+        },
+        "server_calls": calls,
+        "results": results,
+    }
+    print(f"{'benchmark':<24}{'p50':>12}{'p99':>12}{'throughput/s':>16}")
+    for name, result in results.items():
+        print(
+            f"{name:<24}{result['p50'] * 1e3:>10.3f}ms{result['p99'] * 1e3:>10.3f}ms"
+            + f"{result['throughput']:>16.1f}"
+        )
+    os.makedirs(args.output, exist_ok=True)
+    output = args.output.joinpath(
+        f"bench_{current['version']}_{time.strftime('%Y%m%d_%H%M%S')}.json"
+    )
+    with open(output, "w", encoding="utf-8") as fp:
+        json.dump(current, fp, indent=2)
+    print(f"\nResults Saved To {output}")
+    if args.compare is not None:
+        compare(current, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,200 @@
+from __future__ import annotations
+import json, time, random, threading
+from pathlib import Path
+from datetime import datetime as dtdt
+from datetime import timedelta
+from urllib.parse import parse_qs, urlparse
+from typing import Any, Dict, List, Optional, Tuple, Union
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+__all__ = ["NseStandInServer", "generate_announcements"]
+
+INDUSTRIES: Tuple[str, ...] = (
+    "Banks",
+    "Pharmaceuticals",
+    "Computers - Software",
+    "Refineries",
+    "Finance",
+    "Auto Ancillaries",
+)
+
+SUBJECTS: Tuple[str, ...] = (
+    "Outcome of Board Meeting",
+    "Financial Results",
+    "Buyback",
+    "Disclosure under SEBI Takeover Regulations - Pledge",
+    "Analysts/Institutional Investor Meet/Con. Call Updates",
+    "Shareholders meeting",
+    "Updates",
+)
+
+
+def generate_announcements(
+    count: int, symbols: int = 500, start: Optional[dtdt] = None, seed: int = 7
+) -> List[Dict[str, Any]]:
+    rng = random.Random(seed)
+    start = start if start is not None else dtdt.now().replace(microsecond=0)
+    records: List[Dict[str, Any]] = []
+    for i in range(count):
+        an_dt = start - timedelta(seconds=37 * i)
+        n = rng.randrange(symbols)
+        subject = rng.choice(SUBJECTS)
+        records.append(
+            {
+                "symbol": f"SYM{n}",
+                "desc": subject,
+                "dt": an_dt.strftime("%Y%m%d%H%M%S"),
+                "attchmntFile": f"https://nsearchives.nseindia.com/corporate/SYM{n}_{an_dt:%d%m%Y%H%M%S}.pdf",
+                "sm_name": f"Company Number {n} Limited",
+                "sm_isin": f"INE{n:06d}A01{n % 10}",
+                "an_dt": an_dt.strftime("%d-%b-%Y %H:%M:%S"),
+                "sort_date": an_dt.strftime("%Y-%m-%d %H:%M:%S"),
+                "seq_id": str(100000000 + count - i),
+                "smIndustry": INDUSTRIES[n % len(INDUSTRIES)],
+                "orgid": None,
+                "attchmntText": f"Company Number {n} Limited has informed the Exchange about {subject.lower()}. "
+                * rng.randint(1, 4),
+                "bflag": None,
+                "old_new": None,
+                "csvName": None,
+                "exchdisstime": an_dt.strftime("%d-%b-%Y %H:%M:%S"),
+                "difference": f"00:00:{rng.randint(1, 59):02d}",
+                "hasXbrl": rng.random() < 0.3,
+            }
+        )
+    return records
+
+
+class NseStandInServer:
+    def __init__(
+        self,
+        payload: Union[str, Path, List[Dict[str, Any]], None] = None,
+        records: int = 2000,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        if isinstance(payload, (str, Path)):
+            with open(payload, "r", encoding="utf-8") as fp:
+                payload = json.load(fp)
+        self.records: List[Dict[str, Any]] = (
+            payload if payload is not None else generate_announcements(records)
+        )
+        self.body = json.dumps(self.records).encode("utf-8")
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.calls: Dict[str, int] = {"home": 0, "ca": 0, "search": 0, "errors": 0}
+        self.__lock = threading.Lock()
+        self.__rng = random.Random(11)
+        self.__server = ThreadingHTTPServer((host, port), self.__get_handler())
+        self.__server.daemon_threads = True
+        self.__thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.__server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def __enter__(self) -> "NseStandInServer":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+    def start(self) -> None:
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, name="NseStandInServer", daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self) -> None:
+        self.__server.shutdown()
+        self.__server.server_close()
+
+    def count_call(self, route: str) -> bool:
+        with self.__lock:
+            self.calls[route] += 1
+            failed = route != "home" and self.__rng.random() < self.error_rate
+            if failed:
+                self.calls["errors"] += 1
+            delay = self.latency + self.__rng.uniform(0.0, self.jitter)
+        if delay > 0:
+            time.sleep(delay)
+        return failed
+
+    def get_payload(self, query: Dict[str, List[str]]) -> bytes:
+        if "symbol" not in query:
+            return self.body
+        symbol = query["symbol"][0]
+        return json.dumps(
+            [record for record in self.records if record["symbol"] == symbol]
+        ).encode("utf-8")
+
+    def __get_handler(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def __send(
+                self,
+                status: int,
+                body: bytes,
+                content_type: str = "application/json",
+                headers: Optional[Dict[str, str]] = None,
+            ) -> None:
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                for key, value in (headers or {}).items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_GET(self) -> None:
+                url = urlparse(self.path)
+                query = parse_qs(url.query)
+                if url.path == "/":
+                    server.count_call("home")
+                    self.__send(
+                        200,
+                        b"<html><body>NSE Stand-In</body></html>",
+                        "text/html",
+                        {"Set-Cookie": "nsit=standin; Path=/"},
+                    )
+                elif url.path == "/api/corporate-announcements":
+                    if server.count_call("ca"):
+                        self.__send(server.error_status, b"{}")
+                    else:
+                        self.__send(200, server.get_payload(query))
+                elif url.path == "/api/search/autocomplete":
+                    if server.count_call("search"):
+                        self.__send(server.error_status, b"{}")
+                    else:
+                        symbol = query.get("q", [""])[0]
+                        self.__send(
+                            200,
+                            json.dumps(
+                                {
+                                    "symbols": [
+                                        {
+                                            "symbol": symbol,
+                                            "symbol_info": f"{symbol} Limited",
+                                        }
+                                    ]
+                                }
+                            ).encode("utf-8"),
+                        )
+                else:
+                    self.__send(404, b"{}")
+
+            def log_message(self, format: str, *args) -> None:
+                return
+
+        return Handler
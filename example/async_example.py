@@ -0,0 +1,14 @@
+import asyncio
+from nse_announcements import AsyncNseFetch
+
+
+async def main() -> None:
+    async with AsyncNseFetch() as nsefetch:
+        async for df in nsefetch.stream_new_corporate_announcement(
+            index="equities", interval=3.0
+        ):
+            print(df)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
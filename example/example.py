@@ -1,17 +1,20 @@
-import signal, time, pandas as pd
-from nse_announcements import NseFetch
+import os, signal, time, pandas as pd
+from nse_announcements import NseFetch, AnnouncementStore
 
 nsefetch = NseFetch()
+store = AnnouncementStore("equities_corporate_announcements_store")
 
 if __name__ == "__main__":
     signal.signal(signal.SIGINT, nsefetch.handle_stop_signals)
     signal.signal(signal.SIGTERM, nsefetch.handle_stop_signals)
+    csv_file = "equities_corporate_announcements"
     while True:
         try:
-            df = nsefetch.get_corporate_announcement(index="equities")
-            if df is not None and isinstance(df, pd.DataFrame):
-                df.to_csv("equities_corporate_announcements")
-            print(df)
+            df = nsefetch.get_new_corporate_announcement(index="equities")
+            if df is not None and isinstance(df, pd.DataFrame) and not df.empty:
+                df.to_csv(csv_file, mode="a", header=not os.path.exists(csv_file))
+                store.append(df, index="equities")
+                print(df)
         except KeyboardInterrupt:
             nsefetch.handle_stop_signals
             break
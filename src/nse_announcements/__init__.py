@@ -1,6 +1,48 @@
 from .main import NseFetch, ProgramKilled
+from .client import AsyncNseFetch
+from .announcement import Announcement
+from .watermark import AnnouncementWatermark
+from .issuer_cache import IssuerCache
+from .store import AnnouncementStore
+from .search_index import AnnouncementIndex
+from .alerts import Alert, AlertEngine, AlertRule
+from .sinks import Sink, JsonLinesSink, CsvSink, ParquetSink, SocketSink
+from .daemon import AnnouncementDaemon, PollSchedule
+from .broadcaster import AnnouncementBroadcaster
+from .downloader import AttachmentDownloader
+from .response_cache import ResponseCache
+from .session_pool import SessionPool
+from .shared import SharedTransport
+from .scheduler import RequestScheduler
+from .metrics import Metrics
 
-__all__ = ["NseFetch", "ProgramKilled"]
+__all__ = [
+    "NseFetch",
+    "AsyncNseFetch",
+    "ProgramKilled",
+    "Announcement",
+    "AnnouncementWatermark",
+    "IssuerCache",
+    "AnnouncementStore",
+    "AnnouncementIndex",
+    "Alert",
+    "AlertEngine",
+    "AlertRule",
+    "Sink",
+    "JsonLinesSink",
+    "CsvSink",
+    "ParquetSink",
+    "SocketSink",
+    "AnnouncementDaemon",
+    "PollSchedule",
+    "AnnouncementBroadcaster",
+    "AttachmentDownloader",
+    "ResponseCache",
+    "SessionPool",
+    "SharedTransport",
+    "RequestScheduler",
+    "Metrics",
+]
 
 
 def hello():
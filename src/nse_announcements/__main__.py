@@ -0,0 +1,4 @@
+import sys
+from .daemon import main
+
+sys.exit(main())
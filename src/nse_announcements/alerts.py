@@ -0,0 +1,428 @@
+from __future__ import annotations
+import re, time, asyncio, inspect, logging
+from datetime import datetime as dtdt
+from datetime import timedelta, timezone
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Pattern,
+    Set,
+    Tuple,
+    Union,
+)
+from .announcement import Announcement
+from .watermark import AnnouncementWatermark
+
+__all__ = ["AlertRule", "Alert", "AlertEngine"]
+
+AlertCallback = Callable[["Alert"], Any]
+
+
+class AlertRule:
+    TEXT_FIELDS: Tuple[str, ...] = ("desc", "attchmntText")
+
+    def __init__(
+        self,
+        name: str,
+        symbols: Optional[Iterable[str]] = None,
+        isins: Optional[Iterable[str]] = None,
+        keywords: Optional[Iterable[str]] = None,
+        patterns: Optional[Iterable[Union[str, Pattern]]] = None,
+        fields: Tuple[str, ...] = TEXT_FIELDS,
+        callback: Optional[AlertCallback] = None,
+    ) -> None:
+        if not set(fields) <= set(AlertRule.TEXT_FIELDS):
+            raise ValueError(f"Fields Should Be Among {AlertRule.TEXT_FIELDS}")
+        self.name = name
+        self.symbols = frozenset(symbol.upper() for symbol in symbols or ())
+        self.isins = frozenset(isin.upper() for isin in isins or ())
+        self.keywords = tuple(dict.fromkeys(keywords or ()))
+        self.patterns = tuple(
+            pattern if isinstance(pattern, re.Pattern) else re.compile(pattern, re.I)
+            for pattern in patterns or ()
+        )
+        self.fields = tuple(fields)
+        self.callback = callback
+        if not (self.symbols or self.isins or self.keywords or self.patterns):
+            raise ValueError(
+                f"Alert Rule: {name} Needs Symbols, ISINs, Keywords Or Patterns"
+            )
+
+    @property
+    def scoped(self) -> bool:
+        return len(self.symbols) > 0 or len(self.isins) > 0
+
+    def __repr__(self) -> str:
+        return (
+            f"AlertRule(name={self.name!r}, symbols={len(self.symbols)}, "
+            + f"isins={len(self.isins)}, keywords={len(self.keywords)}, "
+            + f"patterns={len(self.patterns)})"
+        )
+
+
+class Alert:
+    __slots__ = ("rule", "announcement", "matched", "latency", "processing")
+
+    def __init__(
+        self,
+        rule: AlertRule,
+        announcement: Announcement,
+        matched: Tuple[str, ...],
+        latency: Optional[float],
+        processing: Optional[float],
+    ) -> None:
+        self.rule = rule
+        self.announcement = announcement
+        self.matched = matched
+        self.latency = latency
+        self.processing = processing
+
+    def __repr__(self) -> str:
+        return (
+            f"Alert(rule={self.rule.name!r}, symbol={self.announcement.symbol!r}, "
+            + f"matched={self.matched!r}, latency={self.latency!r})"
+        )
+
+
+class KeywordAutomaton:
+    WORD_PATTERN = re.compile(r"\w+", re.UNICODE)
+
+    @staticmethod
+    def tokenize(text: str) -> List[str]:
+        return KeywordAutomaton.WORD_PATTERN.findall(text.lower())
+
+    def __init__(self, keywords: Iterable[str]) -> None:
+        self.keywords: List[str] = []
+        self.__goto: List[Dict[str, int]] = [{}]
+        self.__fail: List[int] = [0]
+        self.__out: List[Tuple[int, ...]] = [()]
+        for keyword in keywords:
+            self.__insert(keyword)
+        self.__link()
+
+    def __insert(self, keyword: str) -> None:
+        tokens = KeywordAutomaton.tokenize(keyword)
+        if len(tokens) == 0:
+            return
+        state = 0
+        for token in tokens:
+            if token not in self.__goto[state]:
+                self.__goto.append({})
+                self.__fail.append(0)
+                self.__out.append(())
+                self.__goto[state][token] = len(self.__goto) - 1
+            state = self.__goto[state][token]
+        self.__out[state] += (len(self.keywords),)
+        self.keywords.append(keyword)
+
+    def __link(self) -> None:
+        queue = list(self.__goto[0].values())
+        for state in queue:
+            for token, child in self.__goto[state].items():
+                queue.append(child)
+                fallback = self.__fail[state]
+                while fallback and token not in self.__goto[fallback]:
+                    fallback = self.__fail[fallback]
+                self.__fail[child] = self.__goto[fallback].get(token, 0)
+                self.__out[child] += self.__out[self.__fail[child]]
+
+    def find(self, text: str) -> Set[int]:
+        goto, fail, out = self.__goto, self.__fail, self.__out
+        root = goto[0]
+        found: Set[int] = set()
+        state = 0
+        for token in KeywordAutomaton.tokenize(text):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0) if state else root.get(token, 0)
+            if out[state]:
+                found.update(out[state])
+        return found
+
+
+class AlertEngine:
+    IST = timezone(timedelta(hours=5, minutes=30))
+    OPTIONAL_QUANTIFIERS: str = "?*"
+    CLASS_ESCAPES: str = "dDwWsSbBAZ"
+    BRACE_QUANTIFIER = re.compile(r"\{\d*(?:,\d*)?\}")
+
+    @staticmethod
+    def get_literal(pattern: Pattern) -> Optional[str]:
+        source = pattern.pattern
+        if not isinstance(source, str) or pattern.flags & re.X:
+            return None
+        runs: List[str] = []
+        run, depth, index = "", 0, 0
+        while index < len(source):
+            char = source[index]
+            if char == "\\":
+                escaped = source[index + 1 : index + 2]
+                if (
+                    depth == 0
+                    and escaped.isalnum()
+                    and escaped not in AlertEngine.CLASS_ESCAPES
+                ):
+                    return None
+                runs.append(run)
+                run, index = "", index + 2
+                continue
+            if char == "[":
+                runs.append(run)
+                run, index = "", index + 1
+                if source[index : index + 1] == "^":
+                    index += 1
+                if source[index : index + 1] == "]":
+                    index += 1
+                while index < len(source) and source[index] != "]":
+                    index += 2 if source[index] == "\\" else 1
+                if index >= len(source):
+                    return None
+                index += 1
+                continue
+            if char == "{":
+                quantifier = AlertEngine.BRACE_QUANTIFIER.match(source, index)
+                if quantifier is not None:
+                    runs.append(run)
+                    run, index = "", quantifier.end()
+                    continue
+            if char == "|" and depth == 0:
+                return None
+            if char in "()":
+                runs.append(run)
+                run, depth = "", depth + (1 if char == "(" else -1)
+            elif depth == 0 and (char.isalnum() or char == "_"):
+                following = source[index + 1 : index + 2]
+                if following != "" and following in AlertEngine.OPTIONAL_QUANTIFIERS:
+                    runs.append(run)
+                    run = ""
+                elif following == "{" and AlertEngine.BRACE_QUANTIFIER.match(
+                    source, index + 1
+                ):
+                    runs.append(run)
+                    run = ""
+                else:
+                    run += char
+            else:
+                runs.append(run)
+                run = ""
+            index += 1
+        runs.append(run)
+        literal = max(runs, key=len).lower()
+        return literal if len(literal) >= 2 else None
+
+    @staticmethod
+    def get_latency(record: Dict[str, Any]) -> Optional[float]:
+        published_at = Announcement.parse_an_dt(
+            record.get("exchdisstime")
+        ) or Announcement.parse_an_dt(record.get("an_dt"))
+        if published_at is None:
+            return None
+        return (
+            dtdt.now(AlertEngine.IST).replace(tzinfo=None) - published_at
+        ).total_seconds()
+
+    def __init__(
+        self,
+        rules: Optional[Iterable[AlertRule]] = None,
+        callbacks: Optional[Iterable[AlertCallback]] = None,
+        max_keys: int = AnnouncementWatermark.DEFAULT_MAX_KEYS,
+        log: Optional[logging.Logger] = None,
+        seed: bool = True,
+    ) -> None:
+        self.log = log if log is not None else logging.getLogger("NseFetch")
+        self.callbacks: List[AlertCallback] = list(callbacks or ())
+        self.watermark = AnnouncementWatermark(max_keys=max_keys)
+        self.seed = seed
+        self.seeded = 0
+        self.evaluated = 0
+        self.alerts = 0
+        self.callback_errors = 0
+        self.last_latency: Optional[float] = None
+        self.__rules: Dict[str, AlertRule] = {}
+        self.__tasks: Set[asyncio.Future] = set()
+        self.__compiled = False
+        for rule in rules or ():
+            self.add_rule(rule)
+
+    def __len__(self) -> int:
+        return len(self.__rules)
+
+    def add_rule(self, rule: AlertRule) -> None:
+        self.__rules[rule.name] = rule
+        self.__compiled = False
+
+    def remove_rule(self, name: str) -> Optional[AlertRule]:
+        self.__compiled = False
+        return self.__rules.pop(name, None)
+
+    def on_alert(self, callback: AlertCallback) -> None:
+        self.callbacks.append(callback)
+
+    def compile(self) -> None:
+        rules = list(self.__rules.values())
+        self.__ordered = rules
+        self.__by_symbol: Dict[str, List[int]] = {}
+        self.__by_isin: Dict[str, List[int]] = {}
+        self.__by_keyword: List[List[Tuple[int, Tuple[str, ...]]]] = []
+        self.__by_literal: Dict[str, Dict[str, List[Tuple[int, Pattern]]]] = {
+            field: {} for field in AlertRule.TEXT_FIELDS
+        }
+        self.__unfiltered: Dict[str, List[Tuple[int, Pattern]]] = {
+            field: [] for field in AlertRule.TEXT_FIELDS
+        }
+        keyword_ids: Dict[str, int] = {}
+        for rule_id, rule in enumerate(rules):
+            for symbol in rule.symbols:
+                self.__by_symbol.setdefault(symbol, []).append(rule_id)
+            for isin in rule.isins:
+                self.__by_isin.setdefault(isin, []).append(rule_id)
+            for keyword in rule.keywords:
+                normalized = " ".join(KeywordAutomaton.tokenize(keyword))
+                if normalized not in keyword_ids:
+                    keyword_ids[normalized] = len(keyword_ids)
+                    self.__by_keyword.append([])
+                self.__by_keyword[keyword_ids[normalized]].append(
+                    (rule_id, rule.fields)
+                )
+            for pattern in rule.patterns:
+                literal = AlertEngine.get_literal(pattern)
+                for field in rule.fields:
+                    if literal is None:
+                        self.__unfiltered[field].append((rule_id, pattern))
+                    else:
+                        self.__by_literal[field].setdefault(literal, []).append(
+                            (rule_id, pattern)
+                        )
+        self.__automaton = KeywordAutomaton(keyword_ids)
+        literals = sorted(
+            {literal for field in self.__by_literal.values() for literal in field},
+            key=len,
+            reverse=True,
+        )
+        self.__literal_filter: Optional[Pattern] = (
+            re.compile("|".join(map(re.escape, literals))) if literals else None
+        )
+        self.__compiled = True
+        self.log.info(
+            "Compiled %d Alert Rules With %d Keywords And %d Patterns",
+            len(rules),
+            len(keyword_ids),
+            sum(len(rule.patterns) for rule in rules),
+        )
+
+    def match(self, record: Dict[str, Any]) -> List[Tuple[AlertRule, Tuple[str, ...]]]:
+        if not self.__compiled:
+            self.compile()
+        scoped: Set[int] = set()
+        symbol, isin = record.get("symbol"), record.get("sm_isin")
+        if isinstance(symbol, str):
+            scoped.update(self.__by_symbol.get(symbol.upper(), ()))
+        if isinstance(isin, str):
+            scoped.update(self.__by_isin.get(isin.upper(), ()))
+        keyword_hits: Dict[int, List[str]] = {}
+        pattern_hits: Dict[int, List[str]] = {}
+        for field in AlertRule.TEXT_FIELDS:
+            text = record.get(field)
+            if not isinstance(text, str) or text == "":
+                continue
+            if len(self.__by_keyword) > 0:
+                for keyword_id in self.__automaton.find(text):
+                    for rule_id, fields in self.__by_keyword[keyword_id]:
+                        if field in fields:
+                            keyword_hits.setdefault(rule_id, []).append(
+                                self.__automaton.keywords[keyword_id]
+                            )
+            candidates = self.__unfiltered[field]
+            by_literal = self.__by_literal[field]
+            if len(by_literal) > 0:
+                lowered = text.lower()
+                if self.__literal_filter.search(lowered) is not None:
+                    candidates = candidates + [
+                        entry
+                        for literal, entries in by_literal.items()
+                        if literal in lowered
+                        for entry in entries
+                    ]
+            for rule_id, pattern in candidates:
+                if rule_id in pattern_hits:
+                    continue
+                found = pattern.search(text)
+                if found is not None:
+                    pattern_hits[rule_id] = [found.group(0)]
+        results: List[Tuple[AlertRule, Tuple[str, ...]]] = []
+        for rule_id in scoped.union(keyword_hits, pattern_hits):
+            rule = self.__ordered[rule_id]
+            if (
+                (rule.scoped and rule_id not in scoped)
+                or (len(rule.keywords) > 0 and rule_id not in keyword_hits)
+                or (len(rule.patterns) > 0 and rule_id not in pattern_hits)
+            ):
+                continue
+            hits = keyword_hits.get(rule_id, []) + pattern_hits.get(rule_id, [])
+            results.append((rule, tuple(dict.fromkeys(hits))))
+        return results
+
+    def evaluate(
+        self, records: Iterable[Dict[str, Any]], received_at: Optional[float] = None
+    ) -> List[Alert]:
+        alerts: List[Alert] = []
+        if self.seed:
+            self.seed = False
+            self.seeded = len(self.watermark.filter_new(records))
+            self.log.info(
+                "Seeded Alert Watermark With %d Existing Announcements", self.seeded
+            )
+            return alerts
+        for record in self.watermark.filter_new(records):
+            self.evaluated += 1
+            for rule, matched in self.match(record):
+                alert = Alert(
+                    rule,
+                    Announcement.from_record(record),
+                    matched,
+                    AlertEngine.get_latency(record),
+                    time.perf_counter() - received_at if received_at is not None else None,
+                )
+                alerts.append(alert)
+                self.__fire(alert)
+        return alerts
+
+    def __fire(self, alert: Alert) -> None:
+        self.alerts += 1
+        self.last_latency = alert.latency
+        callbacks = self.callbacks + (
+            [alert.rule.callback] if alert.rule.callback is not None else []
+        )
+        for callback in callbacks:
+            try:
+                result = callback(alert)
+                if inspect.isawaitable(result):
+                    task = asyncio.ensure_future(result)
+                    self.__tasks.add(task)
+                    task.add_done_callback(self.__done)
+            except Exception:
+                self.callback_errors += 1
+                self.log.exception("Alert Callback For Rule: %s Failed", alert.rule.name)
+
+    def __done(self, task: asyncio.Future) -> None:
+        self.__tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            self.callback_errors += 1
+            self.log.error("Alert Callback Failed With: %r", task.exception())
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        stats: Dict[str, Union[int, float]] = {
+            "rules": len(self.__rules),
+            "seeded": self.seeded,
+            "evaluated": self.evaluated,
+            "alerts": self.alerts,
+            "callback_errors": self.callback_errors,
+            "pending_callbacks": len(self.__tasks),
+        }
+        if self.last_latency is not None:
+            stats["last_latency"] = self.last_latency
+        return stats
@@ -0,0 +1,162 @@
+from __future__ import annotations
+import sys
+from datetime import datetime as dtdt
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
+
+__all__ = ["Announcement"]
+
+
+class Announcement:
+    FIELDS: Tuple[str, ...] = (
+        "seq_id",
+        "symbol",
+        "sm_name",
+        "sm_isin",
+        "smIndustry",
+        "desc",
+        "an_dt",
+        "sort_date",
+        "exchdisstime",
+        "difference",
+        "attchmntText",
+        "attchmntFile",
+        "hasXbrl",
+        "dt",
+        "orgid",
+        "bflag",
+        "old_new",
+        "csvName",
+    )
+    INTERNED_FIELDS: Tuple[str, ...] = (
+        "symbol",
+        "sm_name",
+        "sm_isin",
+        "smIndustry",
+        "desc",
+    )
+    AN_DT_FORMAT: str = "%d-%b-%Y %H:%M:%S"
+    MONTHS: Dict[str, int] = {
+        "Jan": 1,
+        "Feb": 2,
+        "Mar": 3,
+        "Apr": 4,
+        "May": 5,
+        "Jun": 6,
+        "Jul": 7,
+        "Aug": 8,
+        "Sep": 9,
+        "Oct": 10,
+        "Nov": 11,
+        "Dec": 12,
+    }
+
+    __slots__ = FIELDS + ("extra",)
+
+    @staticmethod
+    def parse_an_dt(value: Any) -> Optional[dtdt]:
+        if isinstance(value, dtdt) or value is None:
+            return value
+        try:
+            return dtdt(
+                int(value[7:11]),
+                Announcement.MONTHS[value[3:6]],
+                int(value[0:2]),
+                int(value[12:14]),
+                int(value[15:17]),
+                int(value[18:20]),
+            )
+        except (KeyError, TypeError, ValueError):
+            pass
+        try:
+            return dtdt.strptime(value, Announcement.AN_DT_FORMAT)
+        except (TypeError, ValueError):
+            return None
+
+    @classmethod
+    def from_record(cls, record: Dict[str, Any]) -> "Announcement":
+        announcement = cls.__new__(cls)
+        get, intern = record.get, sys.intern
+        for field in Announcement.INTERNED_FIELDS:
+            value = get(field)
+            setattr(
+                announcement, field, intern(value) if type(value) is str else value
+            )
+        announcement.seq_id = get("seq_id")
+        announcement.an_dt = Announcement.parse_an_dt(get("an_dt"))
+        announcement.sort_date = get("sort_date")
+        announcement.exchdisstime = get("exchdisstime")
+        announcement.difference = get("difference")
+        announcement.attchmntText = get("attchmntText")
+        announcement.attchmntFile = get("attchmntFile")
+        announcement.hasXbrl = get("hasXbrl")
+        announcement.dt = get("dt")
+        announcement.orgid = get("orgid")
+        announcement.bflag = get("bflag")
+        announcement.old_new = get("old_new")
+        announcement.csvName = get("csvName")
+        extra = None
+        if len(record) > len(Announcement.FIELDS) or not record.keys() <= FIELD_SET:
+            extra = {
+                key: value
+                for key, value in record.items()
+                if value is not None and key not in FIELD_SET
+            }
+        announcement.extra = extra if extra else None
+        return announcement
+
+    @classmethod
+    def iter_records(cls, records: Iterable[Dict[str, Any]]) -> Iterator["Announcement"]:
+        for record in records:
+            yield cls.from_record(record)
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]]) -> List["Announcement"]:
+        return Announcement.sort(cls.iter_records(records))
+
+    @staticmethod
+    def sort(announcements: Iterable["Announcement"]) -> List["Announcement"]:
+        return sorted(
+            announcements,
+            key=lambda announcement: announcement.an_dt
+            if announcement.an_dt is not None
+            else dtdt.min,
+        )
+
+    @staticmethod
+    def merge(groups: Iterable[List["Announcement"]]) -> List["Announcement"]:
+        merged: Dict[Any, Announcement] = {}
+        for announcement in (item for group in groups for item in group):
+            key = (
+                announcement.seq_id
+                if announcement.seq_id not in (None, "")
+                else (announcement.an_dt, announcement.symbol, id(announcement))
+            )
+            merged.pop(key, None)
+            merged[key] = announcement
+        return Announcement.sort(merged.values())
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {field: getattr(self, field) for field in Announcement.FIELDS}
+        if self.extra is not None:
+            data.update(self.extra)
+        return data
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Announcement):
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field)
+            for field in Announcement.__slots__
+        )
+
+    def __hash__(self) -> int:
+        return hash(self.seq_id)
+
+    def __repr__(self) -> str:
+        return (
+            f"Announcement(seq_id={self.seq_id!r}, symbol={self.symbol!r}, "
+            + f"an_dt={self.an_dt!r}, desc={self.desc!r})"
+        )
+
+
+FIELD_SET: FrozenSet[str] = frozenset(Announcement.FIELDS)
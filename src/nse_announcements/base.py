@@ -0,0 +1,380 @@
+from __future__ import annotations
+import os, sys, copy, json, queue, atexit, platform, logging, threading
+from datetime import datetime as dtdt
+from datetime import date
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from dateutil.relativedelta import relativedelta as rtd
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["NseFetchBase"]
+
+_STRING_DTYPE: Optional[str] = None
+_LOADS: Optional[Callable[[Union[bytes, str]], Any]] = None
+_LISTENERS: Dict[str, QueueListener] = {}
+_LISTENERS_LOCK = threading.Lock()
+
+
+def _restart_listeners_after_fork() -> None:
+    global _LISTENERS_LOCK
+    _LISTENERS_LOCK = threading.Lock()
+    for listener in _LISTENERS.values():
+        listener._thread = None
+        listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listeners_after_fork)
+
+
+class LazyRotatingFileHandler(RotatingFileHandler):
+    def __init__(self, filename: Union[str, os.PathLike], **kwargs: Any) -> None:
+        super().__init__(filename, delay=True, **kwargs)
+
+    def _open(self):
+        os.makedirs(os.path.dirname(self.baseFilename), exist_ok=True)
+        return super()._open()
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "module": record.module,
+            "function": record.funcName,
+            "line": record.lineno,
+            "message": record.getMessage(),
+        }
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            data["exception"] = record.exc_text
+        return json.dumps(data, default=str)
+
+
+class LogQueueHandler(QueueHandler):
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        record.msg, record.args = record.getMessage(), None
+        if record.exc_info and not record.exc_text:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+        record.exc_info = None
+        return record
+
+
+class NseFetchBase:
+    LOGGING_FORMAT: str = "[%(levelname)s]|[%(asctime)s]|[%(name)s::%(module)s::%(funcName)s::%(lineno)d]|=> %(message)s"
+    TODAY: str = "Today"
+    LAST1WEEK: str = "Last1Week"
+    NEXT1WEEK: str = "Next1Week"
+    LAST15DAYS: str = "Last15Days"
+    NEXT15DAYS: str = "Next15Days"
+    LAST1MONTH: str = "Last1Month"
+    NEXT1MONTH: str = "Next1Month"
+    NEXT3MONTHS: str = "Next3Months"
+    LAST3MONTHS: str = "Last3Months"
+    LAST6MONTHS: str = "Last6Months"
+    LAST1YEAR: str = "Last1Year"
+    CUSTOM: str = "Custom"
+    ALLFORTHCOMING: str = "AllForthcoming"
+    INDEXES: Tuple[str, ...] = (
+        "equities",
+        "sme",
+        "sse",
+        "debt",
+        "municipalBond",
+        "invitsreits",
+        "mf",
+    )
+    CHUNKED_MODES: Tuple[str, ...] = (LAST6MONTHS, LAST1YEAR, CUSTOM)
+    CHUNK_WINDOWS: Dict[str, rtd] = {
+        "week": rtd(weeks=1),
+        "fortnight": rtd(days=15),
+        "month": rtd(months=1),
+    }
+    MAX_CACHED_FRAMES: int = 16
+    OUTPUTS: Tuple[str, ...] = ("dataframe", "records")
+    WARMUPS: Tuple[str, ...] = ("lazy", "background", "eager")
+    NSE_DATETIME_FORMAT: str = "%d-%b-%Y %H:%M:%S"
+    ISO_DATETIME_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+    DATETIME_FORMATS: Dict[str, str] = {
+        "an_dt": NSE_DATETIME_FORMAT,
+        "sort_date": ISO_DATETIME_FORMAT,
+        "exchdisstime": NSE_DATETIME_FORMAT,
+    }
+    MONTHS: Dict[str, str] = {
+        "Jan": "01",
+        "Feb": "02",
+        "Mar": "03",
+        "Apr": "04",
+        "May": "05",
+        "Jun": "06",
+        "Jul": "07",
+        "Aug": "08",
+        "Sep": "09",
+        "Oct": "10",
+        "Nov": "11",
+        "Dec": "12",
+    }
+    CATEGORICAL_COLUMNS: Tuple[str, ...] = (
+        "symbol",
+        "sm_name",
+        "smIndustry",
+        "sm_isin",
+        "desc",
+        "difference",
+    )
+    TEXT_COLUMNS: Tuple[str, ...] = ("attchmntText", "attchmntFile", "seq_id")
+    ROOT: str = "https://www.nseindia.com"
+    APIBASE: str = "/api"
+    ROUTES: Dict[str, str] = {
+        "ca": "/corporate-announcements",
+        "search": "/search/autocomplete",
+    }
+
+    @staticmethod
+    def get_route_url(route: str) -> str:
+        if route in NseFetchBase.ROUTES:
+            return "".join([NseFetchBase.ROOT, NseFetchBase.APIBASE, NseFetchBase.ROUTES[route]])
+        else:
+            return "".join([NseFetchBase.ROOT, NseFetchBase.APIBASE, route])
+
+    @staticmethod
+    def get_now_date_time_with_microseconds_string() -> str:
+        return dtdt.now().strftime("%d_%b_%Y_%H_%M_%S_%f")
+
+    @staticmethod
+    def is_windows() -> bool:
+        return (
+            os.name == "nt"
+            and sys.platform == "win32"
+            and platform.system() == "Windows"
+        )
+
+    @staticmethod
+    def is_linux() -> bool:
+        return (
+            os.name == "posix"
+            and platform.system() == "Linux"
+            and sys.platform in {"linux", "linux2"}
+        )
+
+    @staticmethod
+    def is_mac() -> bool:
+        return (
+            os.name == "posix"
+            and sys.platform == "darwin"
+            and platform.system() == "Darwin"
+        )
+
+    @staticmethod
+    def get_logger(
+        name, filename, level=logging.WARNING, json_format=False
+    ) -> logging.Logger:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        with _LISTENERS_LOCK:
+            if name in _LISTENERS:
+                return logger
+            formatter = (
+                JsonFormatter()
+                if json_format
+                else logging.Formatter(NseFetchBase.LOGGING_FORMAT)
+            )
+            stream = logging.StreamHandler()
+            stream.setFormatter(formatter)
+            fh = LazyRotatingFileHandler(
+                filename, maxBytes=100 * 1024 * 1024, backupCount=25
+            )
+            fh.setFormatter(formatter)
+            records: queue.SimpleQueue = queue.SimpleQueue()
+            listener = QueueListener(records, stream, fh, respect_handler_level=True)
+            listener.start()
+            atexit.register(listener.stop)
+            _LISTENERS[name] = listener
+            logger.addHandler(LogQueueHandler(records))
+            logger.propagate = False
+        return logger
+
+    @staticmethod
+    def get_log_body(
+        text: Optional[str], limit: Optional[int] = None
+    ) -> Optional[str]:
+        if text is None or limit is None or len(text) <= limit:
+            return text
+        return f"{text[:limit]}...Truncated From {len(text)} Chars"
+
+    @staticmethod
+    def is_closed_date_range(params: Dict[str, Any]) -> bool:
+        to_date = params.get("to_date")
+        if not isinstance(to_date, str):
+            return False
+        try:
+            return dtdt.strptime(to_date, "%d-%m-%Y").date() < date.today()
+        except ValueError:
+            return False
+
+    @staticmethod
+    def get_date_windows(
+        from_date: str, to_date: str, window: str = "month"
+    ) -> List[Tuple[str, str]]:
+        start = dtdt.strptime(from_date, "%d-%m-%Y").date()
+        end = dtdt.strptime(to_date, "%d-%m-%Y").date()
+        step = NseFetchBase.CHUNK_WINDOWS[window]
+        windows: List[Tuple[str, str]] = []
+        while start <= end:
+            window_end = min(start + step - rtd(days=1), end)
+            windows.append(
+                (start.strftime("%d-%m-%Y"), window_end.strftime("%d-%m-%Y"))
+            )
+            start = window_end + rtd(days=1)
+        return windows
+
+    @staticmethod
+    def get_from_to_dates(
+        mode: str = ALLFORTHCOMING,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+    ) -> Tuple[Union[str, None], Union[str, None]]:
+        if mode == NseFetchBase.ALLFORTHCOMING:
+            return None, None
+        if (
+            mode not in {NseFetchBase.ALLFORTHCOMING, NseFetchBase.CUSTOM}
+            and from_date is None
+            and to_date is None
+        ):
+            ((from_date, to_date)) = (
+                (date.today() - rtd(days=1), date.today())
+                if mode == NseFetchBase.TODAY
+                else (date.today(), date.today() + rtd(weeks=1))
+                if mode == NseFetchBase.NEXT1WEEK
+                else (date.today() - rtd(weeks=1), date.today())
+                if mode == NseFetchBase.LAST1WEEK
+                else (date.today(), date.today() + rtd(days=15))
+                if mode == NseFetchBase.NEXT15DAYS
+                else (date.today() - rtd(days=15), date.today())
+                if mode == NseFetchBase.LAST15DAYS
+                else (date.today(), date.today() + rtd(months=1))
+                if mode == NseFetchBase.NEXT1MONTH
+                else (date.today() - rtd(months=1), date.today())
+                if mode == NseFetchBase.LAST1MONTH
+                else (date.today(), date.today() + rtd(months=3))
+                if mode == NseFetchBase.NEXT3MONTHS
+                else (date.today() - rtd(months=3), date.today())
+                if mode == NseFetchBase.LAST3MONTHS
+                else (date.today() - rtd(months=6), date.today())
+                if mode == NseFetchBase.LAST6MONTHS
+                else (date.today() - rtd(years=1), date.today())
+            )
+            return from_date.strftime("%d-%m-%Y"), to_date.strftime("%d-%m-%Y")
+        if mode == NseFetchBase.CUSTOM and from_date is not None and to_date is not None:
+            if isinstance(from_date, date) and isinstance(to_date, date):
+                return from_date.strftime("%d-%m-%Y"), to_date.strftime("%d-%m-%Y")
+            if isinstance(from_date, str) and isinstance(to_date, str):
+                return from_date, to_date
+            else:
+                raise Exception(
+                    "From Date and To Date Can Not Be Empty and Should be of Either Date Type or a String in `dd-mm-YYYY` Format"
+                )
+        else:
+            raise Exception(
+                "From Date and To Date Can Not Be Empty"
+                + " When Mode is Custom with `from_date` and `to_date`"
+            )
+
+    @staticmethod
+    def import_pandas() -> Any:
+        try:
+            import pandas as pd
+        except ImportError as err:
+            raise ImportError(
+                "DataFrame Output Requires `pandas`, Install It With "
+                + "`pip install nse_announcements[pandas]` Or Use `output=\"records\"`"
+            ) from err
+        return pd
+
+    @staticmethod
+    def loads(content: Union[bytes, str]) -> Any:
+        global _LOADS
+        if _LOADS is None:
+            try:
+                import orjson
+            except ImportError:
+                _LOADS = json.loads
+            else:
+                _LOADS = orjson.loads
+        return _LOADS(content)
+
+    @staticmethod
+    def get_string_dtype() -> Union[str, None]:
+        global _STRING_DTYPE
+        if _STRING_DTYPE is None:
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                _STRING_DTYPE = "object"
+            else:
+                _STRING_DTYPE = "string[pyarrow]"
+        return None if _STRING_DTYPE == "object" else _STRING_DTYPE
+
+    @staticmethod
+    def parse_datetime(values: pd.Series, fmt: str) -> pd.Series:
+        pd = NseFetchBase.import_pandas()
+        if fmt != NseFetchBase.NSE_DATETIME_FORMAT:
+            return pd.to_datetime(values, format=fmt, errors="coerce")
+        text = values.astype(str)
+        parsed = pd.to_datetime(
+            text.str.slice(7, 11)
+            + "-"
+            + text.str.slice(3, 6).map(NseFetchBase.MONTHS)
+            + "-"
+            + text.str.slice(0, 2)
+            + text.str.slice(11),
+            format=NseFetchBase.ISO_DATETIME_FORMAT,
+            errors="coerce",
+        )
+        failed = parsed.isna() & values.notna()
+        if failed.any():
+            parsed[failed] = pd.to_datetime(values[failed], format=fmt, errors="coerce")
+        return parsed
+
+    @staticmethod
+    def optimize_dtypes(df: pd.DataFrame) -> pd.DataFrame:
+        for column in NseFetchBase.CATEGORICAL_COLUMNS:
+            if column in df.columns and df[column].dtype != "category":
+                df[column] = df[column].astype("category")
+        string_dtype = NseFetchBase.get_string_dtype()
+        if string_dtype is not None:
+            for column in NseFetchBase.TEXT_COLUMNS:
+                if column in df.columns and df[column].dtype == object:
+                    df[column] = df[column].astype(string_dtype)
+        return df
+
+    @staticmethod
+    def records_to_dataframe(
+        records: List[Dict[str, Any]], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        if columns is not None:
+            columns = list(dict.fromkeys(["an_dt", *columns]))
+        pd = NseFetchBase.import_pandas()
+        df = pd.DataFrame(records, columns=columns)
+        for column, fmt in NseFetchBase.DATETIME_FORMATS.items():
+            if column in df.columns:
+                df[column] = NseFetchBase.parse_datetime(df[column], fmt)
+        df = NseFetchBase.optimize_dtypes(df)
+        return df.set_index("an_dt").sort_index(kind="stable")
+
+    @staticmethod
+    def merge_dataframes(frames: List[pd.DataFrame]) -> pd.DataFrame:
+        pd = NseFetchBase.import_pandas()
+        frames = [df for df in frames if df is not None and not df.empty]
+        if len(frames) == 0:
+            return pd.DataFrame()
+        df = pd.concat(frames)
+        if "seq_id" in df.columns:
+            df = df[~df["seq_id"].duplicated(keep="last")]
+        return NseFetchBase.optimize_dtypes(df).sort_index(kind="stable")
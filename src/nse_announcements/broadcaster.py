@@ -0,0 +1,320 @@
+from __future__ import annotations
+import json, asyncio, contextlib
+from pathlib import Path
+from collections import deque
+from urllib.parse import parse_qs, urlparse
+from typing import (
+    Any,
+    AsyncIterator,
+    Deque,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+from .base import NseFetchBase
+from .announcement import Announcement
+from .client import AsyncNseFetch
+
+__all__ = ["AnnouncementBroadcaster"]
+
+Event = Tuple[int, bytes, bytes]
+
+
+class AnnouncementBroadcaster:
+    DEFAULT_REPLAY_SIZE: int = 1024
+    DEFAULT_QUEUE_SIZE: int = 256
+    HANDSHAKE_TIMEOUT: float = 5.0
+    RECONNECT_DELAY: float = 1.0
+    SSE_HEADERS: bytes = (
+        b"HTTP/1.1 200 OK\r\n"
+        + b"Content-Type: text/event-stream\r\n"
+        + b"Cache-Control: no-cache\r\n"
+        + b"Connection: keep-alive\r\n\r\n"
+    )
+
+    @staticmethod
+    def encode(event_id: int, announcement: Announcement) -> Event:
+        payload = json.dumps(announcement.to_dict(), default=str)
+        return (
+            event_id,
+            f'{{"id": {event_id}, "announcement": {payload}}}\n'.encode("utf-8"),
+            f"id: {event_id}\ndata: {payload}\n\n".encode("utf-8"),
+        )
+
+    @staticmethod
+    async def subscribe(
+        path: Union[str, Path, None] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        last_id: Optional[int] = None,
+        replay: bool = True,
+        reconnect: bool = True,
+    ) -> AsyncIterator[Tuple[int, Dict[str, Any]]]:
+        while True:
+            try:
+                if path is not None:
+                    reader, writer = await asyncio.open_unix_connection(str(path))
+                else:
+                    reader, writer = await asyncio.open_connection(host, port)
+            except OSError:
+                if not reconnect:
+                    raise
+                await asyncio.sleep(AnnouncementBroadcaster.RECONNECT_DELAY)
+                continue
+            try:
+                writer.write(
+                    (json.dumps({"last_id": last_id, "replay": replay}) + "\n").encode(
+                        "utf-8"
+                    )
+                )
+                await writer.drain()
+                while True:
+                    line = await reader.readline()
+                    if not line:
+                        break
+                    message = json.loads(line)
+                    last_id, replay = message["id"], True
+                    yield message["id"], message["announcement"]
+            except (ConnectionError, asyncio.IncompleteReadError):
+                pass
+            finally:
+                writer.close()
+                with contextlib.suppress(Exception):
+                    await writer.wait_closed()
+            if not reconnect:
+                return
+            await asyncio.sleep(AnnouncementBroadcaster.RECONNECT_DELAY)
+
+    def __init__(
+        self,
+        client: Optional[AsyncNseFetch] = None,
+        path: Union[str, Path, None] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        index: str = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        interval: float = 3.0,
+        replay_size: int = DEFAULT_REPLAY_SIZE,
+        queue_size: int = DEFAULT_QUEUE_SIZE,
+        overflow: Literal["disconnect", "drop_oldest"] = "disconnect",
+    ) -> None:
+        if path is None and port is None:
+            raise ValueError("Either A Unix Socket `path` Or A TCP `port` Is Required")
+        if overflow not in ("disconnect", "drop_oldest"):
+            raise ValueError("Overflow Should Be Either `disconnect` Or `drop_oldest`")
+        self.__owns_client = client is None
+        self.client = client if client is not None else AsyncNseFetch(debug=False)
+        self.path = Path(path) if path is not None else None
+        self.host = host
+        self.port = port
+        self.index = index
+        self.data_for = data_for
+        self.symbol = symbol
+        self.interval = interval
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self.log = self.client.log
+        self.last_id = 0
+        self.published = 0
+        self.dropped = 0
+        self.disconnected = 0
+        self.__ring: Deque[Event] = deque(maxlen=replay_size)
+        self.__queues: Dict[asyncio.Queue, asyncio.StreamWriter] = {}
+        self.__handlers: Set[asyncio.Task] = set()
+        self.__server: Optional[asyncio.AbstractServer] = None
+        self.__poller: Optional[asyncio.Task] = None
+        self.client.register_collector("broadcaster", self.stats)
+
+    async def __aenter__(self) -> "AnnouncementBroadcaster":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.close()
+
+    async def start(self) -> None:
+        if self.__server is not None:
+            return
+        if self.path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                self.path.unlink()
+            self.__server = await asyncio.start_unix_server(
+                self.__handle, path=str(self.path)
+            )
+            self.log.info("Broadcasting Announcements On Unix Socket: %s", self.path)
+        else:
+            self.__server = await asyncio.start_server(
+                self.__handle, self.host, self.port
+            )
+            self.port = self.__server.sockets[0].getsockname()[1]
+            self.log.info(
+                "Broadcasting Announcements On: %s:%d", self.host, self.port
+            )
+        self.__poller = asyncio.create_task(self.__poll_forever())
+
+    async def serve_forever(self) -> None:
+        await self.start()
+        await self.__poller
+
+    def publish(self, announcements: List[Announcement]) -> int:
+        events: List[Event] = []
+        for announcement in announcements:
+            self.last_id += 1
+            events.append(AnnouncementBroadcaster.encode(self.last_id, announcement))
+        if len(events) == 0:
+            return 0
+        self.__ring.extend(events)
+        self.published += len(events)
+        for queue in list(self.__queues):
+            self.__offer(queue, events)
+        return len(events)
+
+    def __offer(self, queue: asyncio.Queue, events: List[Event]) -> None:
+        try:
+            queue.put_nowait(events)
+            return
+        except asyncio.QueueFull:
+            pass
+        if self.overflow == "drop_oldest":
+            self.dropped += len(queue.get_nowait())
+            queue.put_nowait(events)
+            return
+        self.__disconnect(queue)
+        self.disconnected += 1
+        self.log.warning(
+            "Disconnecting Slow Subscriber After %d Pending Batches", self.queue_size
+        )
+
+    def __disconnect(self, queue: asyncio.Queue) -> None:
+        writer = self.__queues.pop(queue, None)
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+        if writer is not None:
+            writer.transport.abort()
+
+    async def __poll_forever(self) -> None:
+        while True:
+            try:
+                announcements = await self.client.get_new_corporate_announcement(
+                    self.index, self.data_for, self.symbol, output="records"
+                )
+            except Exception:
+                self.log.exception("Polling Corporate Announcements Failed")
+                announcements = None
+            if announcements:
+                self.log.info(
+                    "Broadcasting %d New Announcements To %d Subscribers",
+                    len(announcements),
+                    len(self.__queues),
+                )
+                self.publish(announcements)
+            await asyncio.sleep(self.interval)
+
+    async def __handshake(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> Tuple[bool, Optional[int], bool]:
+        line = await asyncio.wait_for(
+            reader.readline(), AnnouncementBroadcaster.HANDSHAKE_TIMEOUT
+        )
+        if not line.startswith(b"GET "):
+            request: Any = None
+            with contextlib.suppress(ValueError):
+                request = json.loads(line) if line.strip() else None
+            if not isinstance(request, dict):
+                request = {}
+            last_id = request.get("last_id")
+            return False, last_id if isinstance(last_id, int) else None, bool(
+                request.get("replay", True)
+            )
+        query = parse_qs(urlparse(line.split()[1].decode("latin-1")).query)
+        last_id, replay = None, query.get("replay", ["1"])[0] not in ("0", "false")
+        with contextlib.suppress(ValueError):
+            last_id = int(query["last_id"][0]) if "last_id" in query else None
+        while True:
+            header = await reader.readline()
+            if header in (b"\r\n", b"\n", b""):
+                break
+            name, _, value = header.decode("latin-1").partition(":")
+            if name.strip().lower() == "last-event-id":
+                with contextlib.suppress(ValueError):
+                    last_id = int(value.strip())
+        writer.write(AnnouncementBroadcaster.SSE_HEADERS)
+        return True, last_id, replay
+
+    async def __handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        task = asyncio.current_task()
+        self.__handlers.add(task)
+        task.add_done_callback(self.__handlers.discard)
+        try:
+            sse, last_id, replay = await self.__handshake(reader, writer)
+        except (asyncio.TimeoutError, ConnectionError, IndexError):
+            writer.close()
+            return
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        backlog = [
+            event
+            for event in self.__ring
+            if replay and (last_id is None or event[0] > last_id)
+        ]
+        self.__queues[queue] = writer
+        self.log.info(
+            "Subscriber Connected, Replaying %d Announcements, %d Subscribers Now",
+            len(backlog),
+            len(self.__queues),
+        )
+        try:
+            writer.writelines(event[2] if sse else event[1] for event in backlog)
+            await writer.drain()
+            while True:
+                events = await queue.get()
+                if events is None:
+                    break
+                writer.writelines(event[2] if sse else event[1] for event in events)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.__queues.pop(queue, None)
+            writer.close()
+            with contextlib.suppress(Exception):
+                await writer.wait_closed()
+            self.log.info("Subscriber Disconnected, %d Subscribers Now", len(self.__queues))
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "subscribers": len(self.__queues),
+            "last_id": self.last_id,
+            "buffered": len(self.__ring),
+            "published": self.published,
+            "dropped": self.dropped,
+            "disconnected": self.disconnected,
+        }
+
+    async def close(self) -> None:
+        if self.__poller is not None:
+            self.__poller.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__poller
+            self.__poller = None
+        for queue in list(self.__queues):
+            self.__disconnect(queue)
+        if len(self.__handlers) > 0:
+            await asyncio.wait(set(self.__handlers), timeout=1.0)
+        if self.__server is not None:
+            self.__server.close()
+            with contextlib.suppress(Exception):
+                await self.__server.wait_closed()
+            self.__server = None
+        if self.path is not None:
+            with contextlib.suppress(FileNotFoundError):
+                self.path.unlink()
+        if self.__owns_client:
+            await self.client.aclose()
@@ -0,0 +1,867 @@
+from __future__ import annotations
+import time, random, asyncio, logging, itertools, contextlib
+from collections import deque
+from pathlib import Path
+from http import HTTPMethod
+from datetime import date
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Callable,
+    Deque,
+    Iterator,
+    Dict,
+    Optional,
+    Union,
+    Tuple,
+    Literal,
+    List,
+)
+from .base import NseFetchBase
+from .announcement import Announcement
+from .watermark import AnnouncementWatermark
+from .issuer_cache import IssuerCache
+from .response_cache import ResponseCache
+from .fingerprint import PayloadFingerprints
+from .session_pool import SessionPool
+from .scheduler import RequestScheduler
+from .metrics import Metrics
+from .downloader import AttachmentDownloader
+from .search_index import AnnouncementIndex
+from .alerts import AlertEngine
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from curl_cffi import CurlHttpVersion
+    from curl_cffi.requests import Response
+
+__all__ = ["AsyncNseFetch"]
+
+
+class AsyncNseFetch(NseFetchBase):
+    CLIENT_IDS: Iterator[int] = itertools.count(1)
+
+    async def __aenter__(self) -> "AsyncNseFetch":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.aclose()
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        debug: bool = True,
+        debug_verbose: bool = False,
+        http_version: Optional[CurlHttpVersion] = None,
+        issuer_cache: Optional[IssuerCache] = None,
+        chunk_window: Optional[str] = "month",
+        chunk_concurrency: int = 4,
+        chunk_retries: int = 1,
+        response_cache: Optional[ResponseCache] = None,
+        session_pool: Optional[SessionPool] = None,
+        session_pool_size: int = 2,
+        session_refresh_interval: Optional[float] = SessionPool.DEFAULT_REFRESH_INTERVAL,
+        cookie_file: Union[str, Path, None] = None,
+        scheduler: Optional[RequestScheduler] = None,
+        metrics: Optional[Metrics] = None,
+        log_body_limit: Optional[int] = 500,
+        log_body_sample: float = 1.0,
+        log_json: bool = False,
+        search_index: Optional[AnnouncementIndex] = None,
+        alert_engine: Optional[AlertEngine] = None,
+    ) -> None:
+        self.max_retries = max_retries
+        self.debug = debug
+        self.debug_verbose = debug_verbose
+        self.http_version = http_version
+        self.log_body_limit = log_body_limit
+        self.log_body_sample = log_body_sample
+        self.log_json = log_json
+        self.issuer_cache = issuer_cache if issuer_cache is not None else IssuerCache()
+        if (
+            chunk_window is not None
+            and chunk_window not in NseFetchBase.CHUNK_WINDOWS
+        ):
+            raise ValueError(
+                f"Chunk Window Should Be One Of {tuple(NseFetchBase.CHUNK_WINDOWS)} Or None"
+            )
+        self.chunk_window = chunk_window
+        self.chunk_concurrency = chunk_concurrency
+        self.chunk_retries = chunk_retries
+        self.response_cache = response_cache
+        self.search_index = search_index
+        self.alert_engine = alert_engine
+        self.__indexed: Deque[List[Dict[str, Any]]] = deque(maxlen=8)
+        self.payload_fingerprints = PayloadFingerprints()
+        self.scheduler = scheduler if scheduler is not None else RequestScheduler()
+        self.__rewarm_task: Optional[asyncio.Task] = None
+        self.__issuer_save_task: Optional[asyncio.Task] = None
+        self.__owns_metrics = metrics is None
+        self.metrics = metrics if metrics is not None else Metrics()
+        self.__collector_labels: Dict[str, str] = (
+            {} if self.__owns_metrics else {"client": str(next(AsyncNseFetch.CLIENT_IDS))}
+        )
+        self.__collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+        self.__frames: Dict[
+            Tuple[Any, ...],
+            Tuple[List[Dict[str, Any]], Union[pd.DataFrame, List[Announcement]]],
+        ] = {}
+        self.__watermarks: Dict[
+            Tuple[str, str, Union[str, None]], AnnouncementWatermark
+        ] = {}
+        self.log = logging.getLogger("NseFetch")
+        if self.debug or self.debug_verbose:
+            self.log_level = (
+                logging.INFO
+                if self.debug
+                else logging.DEBUG
+                if self.debug_verbose
+                else logging.WARNING
+            )
+            self.logfile = Path.cwd().joinpath(
+                f"logs/NseFetch_{NseFetchBase.get_now_date_time_with_microseconds_string()}.log"
+            )
+            self.log = NseFetchBase.get_logger(
+                "NseFetch",
+                filename=self.logfile,
+                level=self.log_level,
+                json_format=self.log_json,
+            )
+            logging.basicConfig(
+                format=NseFetchBase.LOGGING_FORMAT, level=self.log_level
+            )
+        self.__owns_session_pool = session_pool is None
+        self.session_pool = (
+            session_pool
+            if session_pool is not None
+            else SessionPool(
+                NseFetchBase.ROOT,
+                size=session_pool_size,
+                http_version=self.http_version,
+                refresh_interval=session_refresh_interval,
+                cookie_file=cookie_file,
+                scheduler=self.scheduler,
+                metrics=self.metrics,
+                log=self.log,
+            )
+        )
+        for name, collector in self.__get_transport_collectors():
+            if self.__owns_metrics or not self.metrics.is_registered(name):
+                self.metrics.register(name, collector)
+        self.register_collector("payloads", self.payload_fingerprints.stats)
+        if self.response_cache is not None:
+            self.register_collector("response_cache", self.response_cache.stats)
+        if self.search_index is not None:
+            self.register_collector("search_index", self.search_index.stats)
+        if self.alert_engine is not None:
+            self.register_collector("alerts", self.alert_engine.stats)
+        self.__start_lock: Optional[asyncio.Lock] = None
+        self.__downloaders: Dict[Path, AttachmentDownloader] = {}
+
+    async def start(self) -> None:
+        if len(self.session_pool) > 0:
+            return
+        if self.__start_lock is None:
+            self.__start_lock = asyncio.Lock()
+        async with self.__start_lock:
+            await self.session_pool.start()
+
+    async def restart(self) -> None:
+        self.log.info("Restarting All Requests Sessions")
+        await self.session_pool.restart()
+
+    def stats(self) -> Dict[str, Any]:
+        return self.metrics.stats()
+
+    def serve_metrics(self, host: str = "127.0.0.1", port: int = 9464) -> Tuple[str, int]:
+        return self.metrics.serve(host, port)
+
+    def register_collector(
+        self, name: str, collector: Callable[[], Dict[str, Any]]
+    ) -> None:
+        self.__collectors[name] = collector
+        self.metrics.register(name, collector, **self.__collector_labels)
+
+    def register_collectors(self) -> None:
+        for name, collector in self.__collectors.items():
+            self.metrics.register(name, collector, **self.__collector_labels)
+
+    def unregister_collectors(self) -> None:
+        for name in self.__collectors:
+            self.metrics.unregister(name, **self.__collector_labels)
+
+    def __get_transport_collectors(
+        self,
+    ) -> Tuple[Tuple[str, Callable[[], Dict[str, Any]]], ...]:
+        return (
+            ("scheduler", self.scheduler.stats),
+            ("sessions", self.session_pool.stats),
+            ("issuer_cache", self.issuer_cache.stats),
+        )
+
+    def bind_transport(
+        self,
+        session_pool: SessionPool,
+        scheduler: Optional[RequestScheduler] = None,
+        metrics: Optional[Metrics] = None,
+        issuer_cache: Optional[IssuerCache] = None,
+    ) -> None:
+        self.unregister_collectors()
+        self.session_pool = session_pool
+        if scheduler is not None:
+            self.scheduler = scheduler
+        if issuer_cache is not None:
+            self.issuer_cache = issuer_cache
+        if metrics is not None:
+            self.metrics = metrics
+        else:
+            for name, collector in self.__get_transport_collectors():
+                self.metrics.register(name, collector)
+        self.__start_lock = None
+        self.__rewarm_task = None
+        self.__issuer_save_task = None
+        self.register_collectors()
+
+    def __build_dataframe(
+        self, records: List[Dict[str, Any]], columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        with self.metrics.timer("request", route="ca", phase="dataframe_build"):
+            return NseFetchBase.records_to_dataframe(records, columns)
+
+    def __build(
+        self,
+        records: List[Dict[str, Any]],
+        columns: Optional[List[str]] = None,
+        output: str = "dataframe",
+    ) -> Union[pd.DataFrame, List[Announcement]]:
+        if output == "records":
+            with self.metrics.timer("request", route="ca", phase="records_build"):
+                return Announcement.from_records(records)
+        return self.__build_dataframe(records, columns)
+
+    @staticmethod
+    def __empty(output: str) -> Union[pd.DataFrame, List[Announcement]]:
+        if output == "records":
+            return []
+        return NseFetchBase.import_pandas().DataFrame()
+
+    @staticmethod
+    def __check_output(output: str) -> None:
+        if output not in NseFetchBase.OUTPUTS:
+            raise ValueError(f"Output Should Be One Of {NseFetchBase.OUTPUTS}")
+
+    async def aclose(self) -> None:
+        if self.__issuer_save_task is not None and not self.__issuer_save_task.done():
+            self.__issuer_save_task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__issuer_save_task
+        with contextlib.suppress(OSError):
+            await asyncio.to_thread(self.issuer_cache.save)
+        for downloader in self.__downloaders.values():
+            with contextlib.suppress(OSError):
+                downloader.save()
+        if not self.__owns_metrics:
+            self.unregister_collectors()
+        if self.__owns_session_pool:
+            await self.session_pool.close()
+
+    def get_attachment_downloader(
+        self, root: Union[str, Path] = "nse_attachments"
+    ) -> AttachmentDownloader:
+        root = Path(root)
+        if root not in self.__downloaders:
+            self.__downloaders[root] = AttachmentDownloader(self, root)
+        return self.__downloaders[root]
+
+    async def download_attachments(
+        self,
+        items: Any,
+        root: Union[str, Path] = "nse_attachments",
+        concurrency: int = AttachmentDownloader.DEFAULT_CONCURRENCY,
+    ) -> Tuple[Dict[str, Path], Dict[str, str]]:
+        return await self.get_attachment_downloader(root).download_many(
+            items, concurrency
+        )
+
+    async def __search_issuer(self, query: str) -> Optional[str]:
+        data = await self.__get("search", params={"q": query})
+        if data is not None and isinstance(data, dict) and "symbols" in data:
+            for item in data["symbols"]:
+                if isinstance(item, dict) and item.get("symbol") == query:
+                    return item.get("symbol_info")
+
+    async def __get_issuer(self, query: str) -> Optional[str]:
+        issuer = self.issuer_cache.get(query)
+        if issuer is not None:
+            return issuer
+        issuer = await self.__search_issuer(query)
+        if issuer is not None:
+            self.issuer_cache.set(query, issuer)
+            if self.__issuer_save_task is None or self.__issuer_save_task.done():
+                self.__issuer_save_task = asyncio.create_task(self.__save_issuer_cache())
+        return issuer
+
+    async def __save_issuer_cache(self) -> None:
+        await asyncio.sleep(IssuerCache.SAVE_DELAY)
+        while self.issuer_cache.dirty:
+            try:
+                await asyncio.to_thread(self.issuer_cache.save)
+            except OSError:
+                self.log.exception("Saving Issuer Cache Failed")
+                return
+
+    async def prewarm_issuers(
+        self, symbols: List[str], concurrency: int = 8
+    ) -> Dict[str, Optional[str]]:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def resolve(symbol: str) -> Optional[str]:
+            async with semaphore:
+                issuer = await self.__search_issuer(symbol)
+                if issuer is not None:
+                    self.issuer_cache.set(symbol, issuer)
+                return issuer
+
+        missing = self.issuer_cache.missing(symbols)
+        self.log.info(
+            "Prewarming Issuer Cache For %d Symbols, %d Are Not Cached",
+            len(symbols),
+            len(missing),
+        )
+        try:
+            await asyncio.gather(*(resolve(symbol) for symbol in missing))
+        finally:
+            await asyncio.to_thread(self.issuer_cache.save)
+        return {symbol: self.issuer_cache.get(symbol) for symbol in symbols}
+
+    async def __get_corporate_announcement_records(
+        self,
+        index: str = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        data = await self.__fetch_corporate_announcement_records(
+            index, data_for, symbol, from_date, to_date
+        )
+        received_at = time.perf_counter()
+        if data is not None and self.alert_engine is not None:
+            self.__evaluate_alerts(data, received_at)
+        if data is not None and self.search_index is not None:
+            await self.__index_records(data, index)
+        return data
+
+    def __evaluate_alerts(self, data: List[Dict[str, Any]], received_at: float) -> None:
+        try:
+            alerts = self.alert_engine.evaluate(data, received_at)
+        except Exception:
+            self.log.exception("Evaluating Alerts For %d Announcements Failed", len(data))
+            return
+        for alert in alerts:
+            if alert.latency is not None:
+                self.metrics.observe("alert_latency", alert.latency, phase="published")
+            if alert.processing is not None:
+                self.metrics.observe("alert_latency", alert.processing, phase="received")
+        if len(alerts) > 0:
+            self.log.info("Fired %d Alerts", len(alerts))
+
+    async def __index_records(self, data: List[Dict[str, Any]], index: str) -> None:
+        if any(item is data for item in self.__indexed):
+            return
+        self.__indexed.append(data)
+        try:
+            added = await asyncio.to_thread(self.search_index.add, data, index)
+        except Exception:
+            self.log.exception("Indexing %d Announcements Failed", len(data))
+            return
+        if added > 0:
+            self.log.info("Indexed %d New Announcements", added)
+
+    async def __fetch_corporate_announcement_records(
+        self,
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        params = {"index": index}
+        from_date, to_date = NseFetchBase.get_from_to_dates(data_for, from_date, to_date)
+        if symbol is not None:
+            issuer = await self.__get_issuer(symbol)
+            if issuer is not None:
+                params.update(
+                    {
+                        "symbol": symbol,
+                        "issuer": issuer,
+                    }
+                )
+            else:
+                self.log.error("Issuer Details for Symbol: %s Not Found", symbol)
+                return
+        if (
+            from_date is not None
+            and to_date is not None
+            and self.chunk_window is not None
+            and data_for in NseFetchBase.CHUNKED_MODES
+        ):
+            windows = NseFetchBase.get_date_windows(from_date, to_date, self.chunk_window)
+            if len(windows) > 1:
+                return await self.__get_chunked_records(params, windows)
+        if from_date is not None and to_date is not None:
+            params.update({"from_date": from_date, "to_date": to_date})
+        data = await self.__get("ca", params=params)
+        if (
+            data is not None
+            and isinstance(data, list)
+            and len(data) > 0
+            and isinstance(data[0], dict)
+        ):
+            return data
+
+    async def __get_chunked_records(
+        self, params: Dict[str, str], windows: List[Tuple[str, str]]
+    ) -> Optional[List[Dict[str, Any]]]:
+        semaphore = asyncio.Semaphore(self.chunk_concurrency)
+        results: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+
+        async def fetch(window: Tuple[str, str]) -> None:
+            async with semaphore:
+                data = await self.__get(
+                    "ca",
+                    params={**params, "from_date": window[0], "to_date": window[1]},
+                )
+            if data is not None and isinstance(data, list):
+                results[window] = data
+
+        pending = windows
+        for attempt in range(self.chunk_retries + 1):
+            if attempt > 0:
+                self.log.warning(
+                    "Retrying %d Failed Date Windows, Attempt No. %d",
+                    len(pending),
+                    attempt,
+                )
+            await asyncio.gather(*(fetch(window) for window in pending))
+            pending = [window for window in windows if window not in results]
+            if len(pending) == 0:
+                break
+        if len(pending) > 0:
+            self.log.error(
+                "Failed To Fetch %d Of %d Date Windows: %s",
+                len(pending),
+                len(windows),
+                pending,
+            )
+        records: Dict[Any, Dict[str, Any]] = {}
+        for window in windows:
+            for record in results.get(window, []):
+                if isinstance(record, dict):
+                    records[AnnouncementWatermark.get_record_key(record)] = record
+        if len(records) > 0:
+            return list(records.values())
+
+    async def get_corporate_announcement(
+        self,
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> Optional[Union[pd.DataFrame, List[Announcement], str]]:
+        AsyncNseFetch.__check_output(output)
+        data = await self.__get_corporate_announcement_records(
+            index, data_for, symbol, from_date, to_date
+        )
+        if data is not None:
+            key = (
+                index,
+                data_for,
+                symbol,
+                str(from_date),
+                str(to_date),
+                tuple(columns) if columns is not None else None,
+                output,
+            )
+            frame = self.__frames.get(key)
+            if frame is not None and frame[0] is data:
+                self.log.info("Announcements Are Unchanged, Reusing Previous DataFrame")
+                df = frame[1]
+            else:
+                df = self.__build(data, columns, output)
+                self.__frames[key] = (data, df)
+                while len(self.__frames) > NseFetchBase.MAX_CACHED_FRAMES:
+                    del self.__frames[next(iter(self.__frames))]
+            return list(df) if output == "records" else df.copy()
+        else:
+            msg = (
+                "It's Likely That No Events Are There For The Selected Periods\n"
+                + "Or nseindia.com Has Not Returned Back Event Calender Data!"
+            )
+            self.log.error(msg)
+            return msg
+
+    def get_watermark(
+        self,
+        index: str = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+    ) -> AnnouncementWatermark:
+        key = (index, data_for, symbol)
+        if key not in self.__watermarks:
+            self.__watermarks[key] = AnnouncementWatermark()
+        return self.__watermarks[key]
+
+    def reset_watermark(
+        self,
+        index: Union[str, None] = None,
+        data_for: Union[str, None] = None,
+        symbol: Union[str, None] = None,
+    ) -> None:
+        for key in list(self.__watermarks):
+            if (
+                (index is None or key[0] == index)
+                and (data_for is None or key[1] == data_for)
+                and (symbol is None or key[2] == symbol)
+            ):
+                del self.__watermarks[key]
+
+    async def get_new_corporate_announcement(
+        self,
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> Optional[Union[pd.DataFrame, List[Announcement]]]:
+        AsyncNseFetch.__check_output(output)
+        data = await self.__get_corporate_announcement_records(
+            index, data_for, symbol, from_date, to_date
+        )
+        if data is None:
+            return
+        watermark = self.get_watermark(index, data_for, symbol)
+        if watermark.last_records is data:
+            self.log.info("Announcements Are Unchanged Since Last Poll")
+            return AsyncNseFetch.__empty(output)
+        watermark.last_records = data
+        new_records = watermark.filter_new(data)
+        self.log.info(
+            "Received %d Announcements, %d Of Them Are New Since Last Poll",
+            len(data),
+            len(new_records),
+        )
+        if len(new_records) > 0:
+            return self.__build(new_records, columns, output)
+        return AsyncNseFetch.__empty(output)
+
+    async def stream_new_corporate_announcement(
+        self,
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        interval: float = 3.0,
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> AsyncIterator[Union[pd.DataFrame, List[Announcement]]]:
+        while True:
+            df = await self.get_new_corporate_announcement(
+                index, data_for, symbol, from_date, to_date, columns, output
+            )
+            if df is not None and len(df) > 0:
+                yield df
+            await asyncio.sleep(interval)
+
+    async def get_corporate_announcements_many(
+        self,
+        items: List[str],
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        concurrency: int = 8,
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> Tuple[Union[pd.DataFrame, List[Announcement]], Dict[str, str]]:
+        AsyncNseFetch.__check_output(output)
+        semaphore = asyncio.Semaphore(concurrency)
+        errors: Dict[str, str] = {}
+
+        async def fetch(item: str) -> Optional[List[Dict[str, Any]]]:
+            async with semaphore:
+                try:
+                    if item in NseFetchBase.INDEXES:
+                        records = await self.__get_corporate_announcement_records(
+                            item, data_for, None, from_date, to_date
+                        )
+                    else:
+                        records = await self.__get_corporate_announcement_records(
+                            index, data_for, item, from_date, to_date
+                        )
+                except Exception as exc:
+                    self.log.exception(
+                        "Fetching Corporate Announcements For: %s Failed", item
+                    )
+                    errors[item] = repr(exc)
+                    return
+                if records is None:
+                    errors[item] = "No Corporate Announcements Returned"
+                return records
+
+        items = list(dict.fromkeys(items))
+        results = await asyncio.gather(*(fetch(item) for item in items))
+        frames = [
+            self.__build(records, columns, output)
+            for records in results
+            if records is not None
+        ]
+        self.log.info(
+            "Fetched Corporate Announcements For %d Of %d Items",
+            len(frames),
+            len(items),
+        )
+        if output == "records":
+            return Announcement.merge(frames), errors
+        return NseFetchBase.merge_dataframes(frames), errors
+
+    async def __get(
+        self, url: str, **kwargs
+    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
+        params = kwargs.get("params") or {}
+        key = ResponseCache.get_key(url, params)
+        content = (
+            await asyncio.to_thread(self.response_cache.get, key)
+            if self.response_cache is not None
+            else None
+        )
+        if content is not None:
+            try:
+                data = self.__decode(url, key, content)
+            except ValueError:
+                data = None
+            if isinstance(data, (list, dict)):
+                self.log.info(
+                    "Serving Endpoint: %s, Params: %s From Response Cache", url, params
+                )
+                return data
+            self.log.warning(
+                "Dropping Undecodable Response Cache Entry For Endpoint: %s, Params: %s",
+                url,
+                params,
+            )
+            await asyncio.to_thread(self.response_cache.delete, key)
+        if key in self.payload_fingerprints:
+            kwargs["headers"] = {
+                **(kwargs.get("headers") or {}),
+                **self.payload_fingerprints.get_conditional_headers(key),
+            }
+        response = await self.__send(
+            HTTPMethod.GET, NseFetchBase.get_route_url(url), route=url, **kwargs
+        )
+        if response is None:
+            return
+        if response.status_code == 304 and key in self.payload_fingerprints:
+            self.log.info("Endpoint: %s, Params: %s Is Not Modified", url, params)
+            return self.payload_fingerprints.get_not_modified(key)
+        data = self.__decode(
+            url,
+            key,
+            response.content,
+            response.headers.get("ETag"),
+            response.headers.get("Last-Modified"),
+        )
+        if self.response_cache is not None and isinstance(data, (list, dict)):
+            await asyncio.to_thread(
+                self.response_cache.set,
+                key,
+                response.content,
+                None
+                if NseFetchBase.is_closed_date_range(params)
+                else self.response_cache.live_ttl,
+            )
+        return data
+
+    def __decode(
+        self,
+        route: str,
+        key: str,
+        content: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
+        digest = PayloadFingerprints.digest(content)
+        unchanged, data = self.payload_fingerprints.lookup(
+            key, digest, etag, last_modified
+        )
+        if unchanged:
+            self.log.info("Response Payload Is Unchanged, Skipping Decoding")
+            return data
+        with self.metrics.timer("request", route=route, phase="json_decode"):
+            data = NseFetchBase.loads(content)
+        self.payload_fingerprints.update(key, digest, data, etag, last_modified)
+        return data
+
+    async def __post(
+        self, url: str, **kwargs
+    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
+        return await self.__request(
+            HTTPMethod.POST, NseFetchBase.get_route_url(url), **kwargs
+        )
+
+    async def __put(
+        self, url: str, **kwargs
+    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
+        return await self.__request(
+            HTTPMethod.PUT, NseFetchBase.get_route_url(url), **kwargs
+        )
+
+    async def __delete(
+        self, url: str, **kwargs
+    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
+        return await self.__request(
+            HTTPMethod.DELETE, NseFetchBase.get_route_url(url), **kwargs
+        )
+
+    async def __request(
+        self, method: HTTPMethod, url: str, **kwargs
+    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
+        response = await self.__send(method, url, **kwargs)
+        if response is not None:
+            return NseFetchBase.loads(response.content)
+
+    async def __rewarm(self) -> None:
+        if self.__rewarm_task is None or self.__rewarm_task.done():
+            remaining = self.scheduler.breaker.get_cooldown_remaining()
+            if remaining > 0:
+                self.log.warning(
+                    "Circuit Breaker Is Open, Waiting %.2f Seconds Before Rewarming",
+                    remaining,
+                )
+                await asyncio.sleep(remaining)
+            if not self.scheduler.breaker.is_open:
+                return
+            if self.__rewarm_task is None or self.__rewarm_task.done():
+                self.log.warning("Circuit Breaker Is Open, Rewarming All Sessions")
+                self.__rewarm_task = asyncio.create_task(self.session_pool.restart())
+                self.__rewarm_task.add_done_callback(
+                    lambda _: self.scheduler.breaker.half_open()
+                )
+        await asyncio.shield(self.__rewarm_task)
+
+    def __should_log_body(self) -> bool:
+        return (
+            self.log_body_limit != 0
+            and self.log.isEnabledFor(logging.INFO)
+            and (self.log_body_sample >= 1.0 or random.random() < self.log_body_sample)
+        )
+
+    async def __send(
+        self, method: HTTPMethod, url: str, route: Optional[str] = None, **kwargs
+    ) -> Optional[Response]:
+        from curl_cffi.requests import RequestsError
+
+        route = route if route is not None else url
+        retry_no, status_code, respose_text = 0, None, None
+        while retry_no < self.max_retries:
+            await self.start()
+            if self.scheduler.breaker.is_open:
+                await self.__rewarm()
+            await self.scheduler.acquire(route)
+            session = self.session_pool.acquire()
+            response, status_code, respose_text, retry_after = None, None, None, None
+            try:
+                self.log.info(
+                    "Initializing Request For Endpoint: %s, Method: %s", url, method
+                )
+                if kwargs.get("params") is not None:
+                    self.log.info("Request Params: %s", kwargs["params"])
+                if kwargs.get("data") is not None:
+                    self.log.info("Request Data: %s", kwargs["data"])
+                if kwargs.get("json") is not None:
+                    self.log.info("Request Json: %s", kwargs["json"])
+                started_at = time.perf_counter()
+                try:
+                    response = await session.request(method, url, **kwargs)
+                finally:
+                    self.metrics.observe(
+                        "request",
+                        time.perf_counter() - started_at,
+                        route=route,
+                        phase="network",
+                    )
+                status_code = response.status_code
+                self.metrics.inc("requests", route=route, status=str(status_code))
+                self.metrics.inc("bytes_received", len(response.content), route=route)
+                retry_after = RequestScheduler.parse_retry_after(
+                    response.headers.get("Retry-After")
+                )
+                response.raise_for_status()
+            except RequestsError as err:
+                if response is not None:
+                    respose_text = NseFetchBase.get_log_body(
+                        response.text, self.log_body_limit
+                    )
+                self.log.error(
+                    "Method: %s, Request For Endpoint: %s, Failed With Status Code: %s, Response Text: %s",
+                    method,
+                    url,
+                    status_code,
+                    respose_text,
+                )
+                self.log.error(
+                    "While Fetching Endpoint: %s, An Exception: %s Occured", url, err
+                )
+                opened = self.scheduler.record_failure(status_code)
+                self.metrics.inc("retries", route=route)
+                retry_no += 1
+                if retry_no == self.max_retries:
+                    self.log.critical(
+                        "Retry Limit Exahusted, Retried %d Times But Failed.", retry_no
+                    )
+                else:
+                    delay = self.scheduler.get_backoff(retry_no, retry_after)
+                    self.log.info(
+                        "Going To retry after %.2f second, Retry. no. %d", delay, retry_no
+                    )
+                    await asyncio.sleep(delay)
+                    if opened:
+                        await self.__rewarm()
+                    elif status_code is None:
+                        await self.session_pool.restart(session)
+            else:
+                self.scheduler.record_success()
+                if self.__should_log_body():
+                    self.log.info(
+                        "Method: %s, Request For Endpoint: %s Succeded With Status Code: %d, Response Text: %s",
+                        method,
+                        url,
+                        status_code,
+                        NseFetchBase.get_log_body(response.text, self.log_body_limit),
+                    )
+                else:
+                    self.log.info(
+                        "Method: %s, Request For Endpoint: %s Succeded With Status Code: %d",
+                        method,
+                        url,
+                        status_code,
+                    )
+                return response
@@ -0,0 +1,288 @@
+from __future__ import annotations
+import sys, time, signal, logging, argparse, threading
+from pathlib import Path
+from collections import deque
+from datetime import date, timedelta
+from datetime import datetime as dtdt
+from datetime import time as dttime
+from typing import Any, Deque, Dict, Iterable, List, Optional, Set, Tuple, Union
+from .base import NseFetchBase
+from .main import NseFetch
+from .alerts import AlertEngine
+from .announcement import Announcement
+from .sinks import SINKS, Sink, get_sink
+
+__all__ = ["PollSchedule", "AnnouncementDaemon", "main"]
+
+
+class PollSchedule:
+    IST = AlertEngine.IST
+    TRADING_DAY_SESSIONS: Tuple[Tuple[dttime, str], ...] = (
+        (dttime(0, 0), "closed"),
+        (dttime(8, 0), "extended"),
+        (dttime(9, 0), "market"),
+        (dttime(16, 0), "extended"),
+        (dttime(23, 0), "closed"),
+    )
+    HOLIDAY_SESSIONS: Tuple[Tuple[dttime, str], ...] = ((dttime(0, 0), "closed"),)
+    DEFAULT_INTERVALS: Dict[str, float] = {
+        "market": 3.0,
+        "extended": 10.0,
+        "closed": 60.0,
+    }
+
+    @staticmethod
+    def load_holidays(value: Union[str, Path, Iterable[Any], None]) -> Set[date]:
+        if value is None:
+            return set()
+        if isinstance(value, (str, Path)):
+            path = Path(value)
+            items: Iterable[Any] = (
+                path.read_text(encoding="utf-8").split()
+                if path.exists()
+                else str(value).split(",")
+            )
+        else:
+            items = value
+        holidays: Set[date] = set()
+        for item in items:
+            if isinstance(item, dtdt):
+                holidays.add(item.date())
+            elif isinstance(item, date):
+                holidays.add(item)
+            elif str(item).strip():
+                holidays.add(dtdt.strptime(str(item).strip(), "%Y-%m-%d").date())
+        return holidays
+
+    def __init__(
+        self,
+        intervals: Optional[Dict[str, float]] = None,
+        min_interval: float = 1.0,
+        max_interval: float = 300.0,
+        backoff: float = 1.5,
+        max_backoff: float = 4.0,
+        window: float = 300.0,
+        holidays: Union[str, Path, Iterable[Any], None] = None,
+    ) -> None:
+        self.intervals = {**PollSchedule.DEFAULT_INTERVALS, **(intervals or {})}
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.window = window
+        self.holidays = PollSchedule.load_holidays(holidays)
+        self.empty_polls = 0
+        self.failed_polls = 0
+        self.__arrivals: Deque[Tuple[float, int]] = deque()
+
+    def now(self) -> dtdt:
+        return dtdt.now(PollSchedule.IST).replace(tzinfo=None)
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays
+
+    def get_sessions(self, day: date) -> Tuple[Tuple[dttime, str], ...]:
+        return (
+            PollSchedule.TRADING_DAY_SESSIONS
+            if self.is_trading_day(day)
+            else PollSchedule.HOLIDAY_SESSIONS
+        )
+
+    def get_phase(self, now: Optional[dtdt] = None) -> str:
+        now = now if now is not None else self.now()
+        phase = "closed"
+        for start, name in self.get_sessions(now.date()):
+            if now.time() >= start:
+                phase = name
+        return phase
+
+    def get_next_change(self, now: Optional[dtdt] = None) -> float:
+        now = now if now is not None else self.now()
+        for start, _ in self.get_sessions(now.date()):
+            if now.time() < start:
+                return (dtdt.combine(now.date(), start) - now).total_seconds()
+        return (
+            dtdt.combine(now.date() + timedelta(days=1), dttime(0, 0)) - now
+        ).total_seconds()
+
+    def get_rate(self, at: Optional[float] = None) -> float:
+        at = at if at is not None else time.monotonic()
+        while len(self.__arrivals) > 0 and self.__arrivals[0][0] < at - self.window:
+            self.__arrivals.popleft()
+        return sum(count for _, count in self.__arrivals) / self.window
+
+    def observe(self, count: Optional[int], at: Optional[float] = None) -> None:
+        if count is None:
+            self.failed_polls += 1
+            return
+        self.failed_polls = 0
+        if count > 0:
+            self.empty_polls = 0
+            self.__arrivals.append(
+                (at if at is not None else time.monotonic(), count)
+            )
+        else:
+            self.empty_polls += 1
+
+    def next_interval(self, now: Optional[dtdt] = None) -> float:
+        now = now if now is not None else self.now()
+        interval = min(
+            self.intervals[self.get_phase(now)]
+            * min(
+                self.backoff ** min(self.empty_polls + self.failed_polls, 32),
+                self.max_backoff,
+            ),
+            self.max_interval,
+        )
+        rate = self.get_rate()
+        if rate > 0:
+            interval = min(interval, 1.0 / rate)
+        interval = min(interval, self.get_next_change(now))
+        return max(self.min_interval, interval)
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        return {
+            "phase": self.get_phase(),
+            "rate": self.get_rate(),
+            "empty_polls": self.empty_polls,
+            "failed_polls": self.failed_polls,
+            "next_interval": self.next_interval(),
+        }
+
+
+class AnnouncementDaemon:
+    def __init__(
+        self,
+        nsefetch: Optional[NseFetch] = None,
+        sinks: Optional[List[Sink]] = None,
+        index: str = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        schedule: Optional[PollSchedule] = None,
+    ) -> None:
+        self.nsefetch = nsefetch if nsefetch is not None else NseFetch(debug=False)
+        self.sinks = sinks if sinks is not None else [get_sink("jsonl")]
+        self.index = index
+        self.data_for = data_for
+        self.symbol = symbol
+        self.schedule = schedule if schedule is not None else PollSchedule()
+        self.log = self.nsefetch.log
+        self.polls = 0
+        self.written = 0
+        self.sink_errors = 0
+        self.__stopped = threading.Event()
+        self.nsefetch.client.register_collector("daemon", self.stats)
+
+    def stop(self, *args: Any) -> None:
+        self.__stopped.set()
+
+    def poll(self) -> Optional[List[Announcement]]:
+        announcements = self.nsefetch.get_new_corporate_announcement(
+            self.index, self.data_for, self.symbol, output="records"
+        )
+        self.polls += 1
+        if announcements:
+            for sink in self.sinks:
+                try:
+                    sink.write(announcements)
+                except Exception:
+                    self.sink_errors += 1
+                    self.log.exception("Writing To Sink: %r Failed", sink)
+            self.written += len(announcements)
+        return announcements
+
+    def run(self) -> None:
+        self.log.info(
+            "Polling %s Corporate Announcements Into %d Sinks", self.index, len(self.sinks)
+        )
+        try:
+            if self.poll() is None:
+                self.schedule.observe(None)
+            while not self.__stopped.is_set():
+                interval = self.schedule.next_interval()
+                self.log.info(
+                    "Next Poll In %.2f Seconds, Phase: %s, Rate: %.4f/s",
+                    interval,
+                    self.schedule.get_phase(),
+                    self.schedule.get_rate(),
+                )
+                if self.__stopped.wait(interval):
+                    break
+                announcements = self.poll()
+                self.schedule.observe(
+                    None if announcements is None else len(announcements)
+                )
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        for sink in self.sinks:
+            try:
+                sink.close()
+            except Exception:
+                self.log.exception("Closing Sink: %r Failed", sink)
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        return {
+            "polls": self.polls,
+            "written": self.written,
+            "sink_errors": self.sink_errors,
+            **self.schedule.stats(),
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="nse-announcements",
+        description="Poll NSE corporate announcements with a market-hours aware interval.",
+    )
+    parser.add_argument("--index", default="equities")
+    parser.add_argument("--symbol")
+    parser.add_argument(
+        "--sink",
+        action="append",
+        dest="sinks",
+        help=f"One of {', '.join(SINKS)}, optionally followed by :target, "
+        + "e.g. csv:out.csv, parquet:store, socket:unix:/tmp/nse.sock "
+        + "or socket:tcp:127.0.0.1:9000 (default: jsonl to stdout)",
+    )
+    for phase, interval in PollSchedule.DEFAULT_INTERVALS.items():
+        parser.add_argument(f"--{phase}-interval", type=float, default=interval)
+    parser.add_argument("--min-interval", type=float, default=1.0)
+    parser.add_argument("--max-interval", type=float, default=300.0)
+    parser.add_argument(
+        "--holidays", help="File or comma separated list of YYYY-MM-DD exchange holidays"
+    )
+    parser.add_argument("--metrics-port", type=int)
+    parser.add_argument("--debug", action="store_true")
+    args = parser.parse_args(argv)
+
+    nsefetch = NseFetch(debug=args.debug, warmup="background", handle_signals=False)
+    if not args.debug:
+        logging.basicConfig(format=NseFetchBase.LOGGING_FORMAT, level=logging.WARNING)
+    daemon = AnnouncementDaemon(
+        nsefetch,
+        sinks=[get_sink(spec, index=args.index) for spec in args.sinks or ["jsonl"]],
+        index=args.index,
+        symbol=args.symbol,
+        schedule=PollSchedule(
+            intervals={
+                phase: getattr(args, f"{phase}_interval")
+                for phase in PollSchedule.DEFAULT_INTERVALS
+            },
+            min_interval=args.min_interval,
+            max_interval=args.max_interval,
+            holidays=args.holidays,
+        ),
+    )
+    if args.metrics_port is not None:
+        nsefetch.serve_metrics(port=args.metrics_port)
+    for signum in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(signum, daemon.stop)
+    with nsefetch:
+        daemon.run()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
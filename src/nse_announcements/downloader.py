@@ -0,0 +1,288 @@
+from __future__ import annotations
+import os, json, time, asyncio, hashlib, logging, threading, contextlib
+from pathlib import Path
+from urllib.parse import urlparse
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+if TYPE_CHECKING:
+    from .client import AsyncNseFetch
+
+__all__ = ["AttachmentDownloader"]
+
+
+class AttachmentDownloader:
+    DEFAULT_CONCURRENCY: int = 16
+    DEFAULT_RETRIES: int = 3
+    RETRY_STATUS_CODES: Tuple[int, ...] = (429, 500, 502, 503, 504)
+    INDEX_FILE: str = "index.json"
+    WRITE_BUFFER_SIZE: int = 1024 * 1024
+
+    @staticmethod
+    def get_urls(items: Any) -> List[str]:
+        if hasattr(items, "columns"):
+            items = (
+                items["attchmntFile"].tolist() if "attchmntFile" in items.columns else []
+            )
+        elif isinstance(items, str):
+            items = [items]
+        urls: List[str] = []
+        for item in items:
+            url = (
+                item
+                if isinstance(item, str)
+                else item.get("attchmntFile")
+                if isinstance(item, dict)
+                else getattr(item, "attchmntFile", None)
+            )
+            if isinstance(url, str) and url.startswith(("http://", "https://")):
+                urls.append(url)
+        return list(dict.fromkeys(urls))
+
+    @staticmethod
+    def get_suffix(url: str) -> str:
+        suffix = os.path.splitext(urlparse(url).path)[1].lower()
+        return suffix if 1 < len(suffix) <= 8 and suffix[1:].isalnum() else ""
+
+    @staticmethod
+    def get_digest(filename: Union[str, Path]) -> str:
+        digest = hashlib.sha256()
+        with open(filename, "rb") as fp:
+            for chunk in iter(lambda: fp.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @staticmethod
+    def get_validator_path(partial: Path) -> Path:
+        return partial.with_suffix(".validator")
+
+    @staticmethod
+    def get_validator(headers: Any) -> Optional[str]:
+        etag = headers.get("ETag")
+        if etag is not None and not etag.startswith("W/"):
+            return etag
+        return headers.get("Last-Modified")
+
+    def __init__(
+        self,
+        client: AsyncNseFetch,
+        root: Union[str, Path] = "nse_attachments",
+        concurrency: int = DEFAULT_CONCURRENCY,
+        retries: int = DEFAULT_RETRIES,
+        log: Optional[logging.Logger] = None,
+    ) -> None:
+        self.client = client
+        self.root = Path(root)
+        self.concurrency = concurrency
+        self.retries = retries
+        self.log = log if log is not None else client.log
+        self.index_file = self.root.joinpath(AttachmentDownloader.INDEX_FILE)
+        self.downloaded = 0
+        self.deduplicated = 0
+        self.cached = 0
+        self.resumed = 0
+        self.failed = 0
+        self.bytes = 0
+        self.__index: Dict[str, Dict[str, Any]] = {}
+        self.__inflight: Dict[str, asyncio.Task] = {}
+        self.__lock = threading.RLock()
+        self.__dirty = False
+        self.load()
+        self.client.register_collector("attachments", self.stats)
+
+    def get_blob_path(self, digest: str, suffix: str = "") -> Path:
+        return self.root.joinpath("blobs", digest[:2], f"{digest}{suffix}")
+
+    def get_partial_path(self, url: str) -> Path:
+        return self.root.joinpath(
+            "partial", hashlib.sha256(url.encode("utf-8")).hexdigest()[:32] + ".part"
+        )
+
+    def lookup(self, url: str) -> Optional[Path]:
+        with self.__lock:
+            entry = self.__index.get(url)
+        if entry is None:
+            return None
+        path = self.root.joinpath(entry["path"])
+        return path if path.exists() else None
+
+    async def download(self, url: str) -> Path:
+        path = self.lookup(url)
+        if path is not None:
+            self.cached += 1
+            return path
+        if url not in self.__inflight:
+            task = asyncio.ensure_future(self.__download(url))
+            task.add_done_callback(lambda _: self.__inflight.pop(url, None))
+            self.__inflight[url] = task
+        return await asyncio.shield(self.__inflight[url])
+
+    async def download_many(
+        self, items: Any, concurrency: Optional[int] = None
+    ) -> Tuple[Dict[str, Path], Dict[str, str]]:
+        urls = AttachmentDownloader.get_urls(items)
+        semaphore = asyncio.Semaphore(concurrency or self.concurrency)
+        paths: Dict[str, Path] = {}
+        errors: Dict[str, str] = {}
+
+        async def fetch(url: str) -> None:
+            async with semaphore:
+                try:
+                    paths[url] = await self.download(url)
+                except Exception as exc:
+                    self.log.error("Downloading Attachment: %s Failed With: %r", url, exc)
+                    errors[url] = repr(exc)
+
+        await asyncio.gather(*(fetch(url) for url in urls))
+        with contextlib.suppress(OSError):
+            self.save()
+        self.log.info("Downloaded %d Of %d Attachments", len(paths), len(urls))
+        return paths, errors
+
+    async def __fetch(self, url: str, partial: Path) -> None:
+        from curl_cffi.requests import RequestsError
+
+        retry_no = 0
+        while True:
+            validator_path = AttachmentDownloader.get_validator_path(partial)
+            validator = None
+            with contextlib.suppress(OSError):
+                validator = validator_path.read_text(encoding="utf-8")
+            offset = partial.stat().st_size if partial.exists() else 0
+            headers = (
+                {"Range": f"bytes={offset}-", "If-Range": validator}
+                if offset > 0 and validator
+                else None
+            )
+            await self.client.scheduler.acquire("files")
+            session = self.client.session_pool.acquire()
+            status_code, received = None, 0
+            started_at = time.perf_counter()
+            try:
+                async with session.stream("GET", url, headers=headers) as response:
+                    status_code = response.status_code
+                    if status_code == 416 and headers is not None:
+                        return
+                    response.raise_for_status()
+                    if headers is not None and status_code == 206:
+                        self.resumed += 1
+                        mode = "ab"
+                    else:
+                        if offset > 0:
+                            self.log.info(
+                                "Attachment: %s Cannot Be Resumed, Restarting From Scratch",
+                                url,
+                            )
+                        mode = "wb"
+                        validator = AttachmentDownloader.get_validator(
+                            response.headers
+                        )
+                        if validator is not None:
+                            validator_path.write_text(validator, encoding="utf-8")
+                        else:
+                            with contextlib.suppress(OSError):
+                                os.remove(validator_path)
+                    buffer: List[bytes] = []
+                    buffered = 0
+                    with open(partial, mode) as fp:
+                        try:
+                            async for chunk in response.aiter_content():
+                                buffer.append(chunk)
+                                buffered += len(chunk)
+                                received += len(chunk)
+                                if buffered >= AttachmentDownloader.WRITE_BUFFER_SIZE:
+                                    await asyncio.to_thread(fp.writelines, buffer)
+                                    buffer, buffered = [], 0
+                        finally:
+                            if len(buffer) > 0:
+                                await asyncio.to_thread(fp.writelines, buffer)
+                return
+            except RequestsError as err:
+                retry_no += 1
+                if (
+                    status_code is not None
+                    and status_code >= 400
+                    and status_code not in AttachmentDownloader.RETRY_STATUS_CODES
+                ) or retry_no > self.retries:
+                    raise
+                delay = self.client.scheduler.get_backoff(retry_no)
+                self.log.warning(
+                    "Attachment: %s Failed With Status Code: %s, Error: %s, Retrying After %.2f Seconds",
+                    url,
+                    status_code,
+                    err,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+            finally:
+                self.bytes += received
+                self.client.metrics.observe(
+                    "request",
+                    time.perf_counter() - started_at,
+                    route="files",
+                    phase="download",
+                )
+                self.client.metrics.inc(
+                    "requests", route="files", status=str(status_code)
+                )
+                self.client.metrics.inc("bytes_received", received, route="files")
+
+    async def __download(self, url: str) -> Path:
+        await self.client.start()
+        partial = self.get_partial_path(url)
+        os.makedirs(partial.parent, exist_ok=True)
+        try:
+            await self.__fetch(url, partial)
+        except Exception:
+            self.failed += 1
+            raise
+        with contextlib.suppress(OSError):
+            os.remove(AttachmentDownloader.get_validator_path(partial))
+        digest = await asyncio.to_thread(AttachmentDownloader.get_digest, partial)
+        path = self.get_blob_path(digest, AttachmentDownloader.get_suffix(url))
+        if path.exists():
+            os.remove(partial)
+            self.deduplicated += 1
+        else:
+            os.makedirs(path.parent, exist_ok=True)
+            os.replace(partial, path)
+            self.downloaded += 1
+        with self.__lock:
+            self.__index[url] = {
+                "digest": digest,
+                "size": path.stat().st_size,
+                "path": path.relative_to(self.root).as_posix(),
+                "fetched_at": time.time(),
+            }
+            self.__dirty = True
+        return path
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "entries": len(self.__index),
+            "downloaded": self.downloaded,
+            "deduplicated": self.deduplicated,
+            "cached": self.cached,
+            "resumed": self.resumed,
+            "failed": self.failed,
+            "bytes": self.bytes,
+            "inflight": len(self.__inflight),
+        }
+
+    def load(self) -> None:
+        with self.__lock, contextlib.suppress(OSError, ValueError, TypeError):
+            with open(self.index_file, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+            if isinstance(data, dict):
+                self.__index.update(data)
+
+    def save(self, force: bool = False) -> None:
+        with self.__lock:
+            if not (self.__dirty or force):
+                return
+            data = dict(self.__index)
+            self.__dirty = False
+        os.makedirs(self.root, exist_ok=True)
+        tmpfile = self.index_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmpfile, "w", encoding="utf-8") as fp:
+            json.dump(data, fp)
+        os.replace(tmpfile, self.index_file)
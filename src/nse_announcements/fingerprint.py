@@ -0,0 +1,90 @@
+from __future__ import annotations
+import hashlib
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+__all__ = ["PayloadFingerprints"]
+
+
+class PayloadFingerprints:
+    DEFAULT_MAX_ENTRIES: int = 256
+
+    @staticmethod
+    def digest(content: bytes) -> bytes:
+        return hashlib.blake2b(content, digest_size=16).digest()
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+        self.unchanged = 0
+        self.changed = 0
+        self.not_modified = 0
+        self.__entries: OrderedDict[
+            str, Tuple[bytes, Any, Optional[str], Optional[str]]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.__entries
+
+    def get_conditional_headers(self, key: str) -> Dict[str, str]:
+        headers: Dict[str, str] = {}
+        entry = self.__entries.get(key)
+        if entry is not None:
+            _, _, etag, last_modified = entry
+            if etag is not None:
+                headers["If-None-Match"] = etag
+            if last_modified is not None:
+                headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def get_not_modified(self, key: str) -> Any:
+        self.__entries.move_to_end(key)
+        self.not_modified += 1
+        return self.__entries[key][1]
+
+    def lookup(
+        self,
+        key: str,
+        digest: bytes,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> Tuple[bool, Any]:
+        entry = self.__entries.get(key)
+        if entry is None or entry[0] != digest:
+            self.changed += 1
+            return False, None
+        self.__entries[key] = (
+            digest,
+            entry[1],
+            etag if etag is not None else entry[2],
+            last_modified if last_modified is not None else entry[3],
+        )
+        self.__entries.move_to_end(key)
+        self.unchanged += 1
+        return True, entry[1]
+
+    def update(
+        self,
+        key: str,
+        digest: bytes,
+        data: Any,
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> None:
+        self.__entries[key] = (digest, data, etag, last_modified)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_entries:
+            self.__entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "unchanged": self.unchanged,
+            "changed": self.changed,
+            "not_modified": self.not_modified,
+            "entries": len(self.__entries),
+        }
+
+    def clear(self) -> None:
+        self.__entries.clear()
@@ -0,0 +1,135 @@
+from __future__ import annotations
+import os, json, time, threading, contextlib
+from pathlib import Path
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+__all__ = ["IssuerCache"]
+
+
+class IssuerCache:
+    DEFAULT_MAX_SIZE: int = 4096
+    DEFAULT_TTL: float = 7 * 24 * 60 * 60.0
+    SAVE_DELAY: float = 1.0
+
+    @staticmethod
+    def get_default_cache_file() -> Path:
+        return Path.home().joinpath(".cache", "nse_announcements", "issuers.json")
+
+    def __init__(
+        self,
+        filename: Union[str, Path, None] = None,
+        max_size: int = DEFAULT_MAX_SIZE,
+        ttl: float = DEFAULT_TTL,
+        persist: bool = True,
+    ) -> None:
+        self.max_size = max_size
+        self.ttl = ttl
+        self.persist = persist
+        self.filename = (
+            Path(filename)
+            if filename is not None
+            else IssuerCache.get_default_cache_file()
+        )
+        self.__entries: OrderedDict[str, Tuple[str, float]] = OrderedDict()
+        self.__lock = threading.RLock()
+        self.__changes = 0
+        self.__saved_changes = 0
+        self.hits = 0
+        self.misses = 0
+        if self.persist:
+            self.load()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __contains__(self, symbol: str) -> bool:
+        return self.get(symbol) is not None
+
+    @property
+    def dirty(self) -> bool:
+        return self.persist and self.__changes != self.__saved_changes
+
+    def __is_expired(self, stored_at: float, now: float) -> bool:
+        return self.ttl > 0 and now - stored_at > self.ttl
+
+    def get(self, symbol: str) -> Optional[str]:
+        with self.__lock:
+            entry = self.__entries.get(symbol)
+            if entry is None:
+                self.misses += 1
+                return None
+            issuer, stored_at = entry
+            if self.__is_expired(stored_at, time.time()):
+                del self.__entries[symbol]
+                self.__changes += 1
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(symbol)
+            self.hits += 1
+            return issuer
+
+    def set(self, symbol: str, issuer: str) -> None:
+        with self.__lock:
+            self.__entries[symbol] = (issuer, time.time())
+            self.__entries.move_to_end(symbol)
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+            self.__changes += 1
+
+    def missing(self, symbols: Iterable[str]) -> Tuple[str, ...]:
+        now = time.time()
+        with self.__lock:
+            return tuple(
+                dict.fromkeys(
+                    symbol
+                    for symbol in symbols
+                    if symbol not in self.__entries
+                    or self.__is_expired(self.__entries[symbol][1], now)
+                )
+            )
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__changes += 1
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "entries": len(self.__entries),
+        }
+
+    def load(self) -> None:
+        with self.__lock, contextlib.suppress(OSError, ValueError, TypeError):
+            with open(self.filename, "r", encoding="utf-8") as fp:
+                data: Dict[str, Tuple[str, float]] = json.load(fp)
+            now = time.time()
+            for symbol, (issuer, stored_at) in sorted(
+                data.items(), key=lambda item: item[1][1]
+            ):
+                if not self.__is_expired(float(stored_at), now):
+                    self.__entries[symbol] = (issuer, float(stored_at))
+            while len(self.__entries) > self.max_size:
+                self.__entries.popitem(last=False)
+
+    def save(self, force: bool = False) -> None:
+        if not self.persist:
+            return
+        with self.__lock:
+            if not (self.dirty or force):
+                return
+            data = {symbol: list(entry) for symbol, entry in self.__entries.items()}
+            changes = self.__changes
+        os.makedirs(self.filename.parent, exist_ok=True)
+        tmpfile = self.filename.with_suffix(
+            f".{os.getpid()}.{threading.get_ident()}.tmp"
+        )
+        with open(tmpfile, "w", encoding="utf-8") as fp:
+            json.dump(data, fp)
+        os.replace(tmpfile, self.filename)
+        with self.__lock:
+            self.__saved_changes = max(self.__saved_changes, changes)
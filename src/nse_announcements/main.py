@@ -1,15 +1,38 @@
 from __future__ import annotations
-import os, sys, signal, platform, logging, asyncio, contextlib, pandas as pd
+import os, sys, signal, asyncio, contextlib
+from threading import Lock, Thread, current_thread
 from pathlib import Path
-from http import HTTPMethod
-from threading import Thread
-from curl_cffi import CurlHttpVersion
-from datetime import datetime as dtdt
 from datetime import date
-from logging.handlers import RotatingFileHandler
-from dateutil.relativedelta import relativedelta as rtd
-from typing import Any, Dict, Optional, NoReturn, Union, Tuple, Literal, List
-from curl_cffi.requests import AsyncSession, RequestsError
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    AsyncIterator,
+    Coroutine,
+    Dict,
+    Optional,
+    NoReturn,
+    Union,
+    Tuple,
+    Literal,
+    List,
+)
+from .base import NseFetchBase
+from .client import AsyncNseFetch
+from .announcement import Announcement
+from .watermark import AnnouncementWatermark
+from .issuer_cache import IssuerCache
+from .response_cache import ResponseCache
+from .fingerprint import PayloadFingerprints
+from .session_pool import SessionPool
+from .metrics import Metrics
+from .downloader import AttachmentDownloader
+from .search_index import AnnouncementIndex
+from .alerts import AlertEngine
+from .shared import SharedTransport
+
+if TYPE_CHECKING:
+    import pandas as pd
+    from curl_cffi import CurlHttpVersion
 
 if sys.platform.startswith("win"):
     from signal import SIGABRT, SIGINT, SIGTERM
@@ -30,78 +53,7 @@ class ProgramKilled(Exception):
     pass  # type: ignore
 
 
-class NseFetch:
-    LOGGING_FORMAT: str = "[%(levelname)s]|[%(asctime)s]|[%(name)s::%(module)s::%(funcName)s::%(lineno)d]|=> %(message)s"
-    TODAY: str = "Today"
-    LAST1WEEK: str = "Last1Week"
-    NEXT1WEEK: str = "Next1Week"
-    LAST15DAYS: str = "Last15Days"
-    NEXT15DAYS: str = "Next15Days"
-    LAST1MONTH: str = "Last1Month"
-    NEXT1MONTH: str = "Next1Month"
-    NEXT3MONTHS: str = "Next3Months"
-    LAST3MONTHS: str = "Last3Months"
-    LAST6MONTHS: str = "Last6Months"
-    LAST1YEAR: str = "Last1Year"
-    CUSTOM: str = "Custom"
-    ALLFORTHCOMING: str = "AllForthcoming"
-    ROOT: str = "https://www.nseindia.com"
-    APIBASE: str = "/api"
-    ROUTES: Dict[str, str] = {
-        "ca": "/corporate-announcements",
-        "search": "/search/autocomplete",
-    }
-
-    @staticmethod
-    def get_route_url(route: str) -> str:
-        if route in NseFetch.ROUTES:
-            return "".join([NseFetch.ROOT, NseFetch.APIBASE, NseFetch.ROUTES[route]])
-        else:
-            return "".join([NseFetch.ROOT, NseFetch.APIBASE, route])
-
-    @staticmethod
-    def get_now_date_time_with_microseconds_string() -> str:
-        return dtdt.now().strftime("%d_%b_%Y_%H_%M_%S_%f")
-
-    @staticmethod
-    def is_windows() -> bool:
-        return (
-            os.name == "nt"
-            and sys.platform == "win32"
-            and platform.system() == "Windows"
-        )
-
-    @staticmethod
-    def is_linux() -> bool:
-        return (
-            os.name == "posix"
-            and platform.system() == "Linux"
-            and sys.platform in {"linux", "linux2"}
-        )
-
-    @staticmethod
-    def is_mac() -> bool:
-        return (
-            os.name == "posix"
-            and sys.platform == "darwin"
-            and platform.system() == "Darwin"
-        )
-
-    @staticmethod
-    def get_logger(name, filename, level=logging.WARNING) -> logging.Logger:
-        logger = logging.getLogger(name)
-        logger.setLevel(level)
-
-        stream = logging.StreamHandler()
-        stream.setFormatter(logging.Formatter(NseFetch.LOGGING_FORMAT))
-        logger.addHandler(stream)
-
-        fh = RotatingFileHandler(filename, maxBytes=100 * 1024 * 1024, backupCount=25)
-        fh.setFormatter(logging.Formatter(NseFetch.LOGGING_FORMAT))
-        logger.addHandler(fh)
-        logger.propagate = False
-        return logger
-
+class NseFetch(NseFetchBase):
     @staticmethod
     def start_background_loop(loop: asyncio.AbstractEventLoop) -> Optional[NoReturn]:
         asyncio.set_event_loop(loop)
@@ -114,61 +66,6 @@ class NseFetch:
             if not loop.is_closed():
                 loop.close()
 
-    @staticmethod
-    def get_from_to_dates(
-        mode: str = ALLFORTHCOMING,
-        from_date: Union[date, str, None] = None,
-        to_date: Union[date, str, None] = None,
-    ) -> Tuple[Union[str, None], Union[str, None]]:
-        if mode == NseFetch.ALLFORTHCOMING:
-            return None, None
-        if (
-            mode not in {NseFetch.ALLFORTHCOMING, NseFetch.CUSTOM}
-            and from_date is None
-            and to_date is None
-        ):
-            ((from_date, to_date)) = (
-                (date.today() - rtd(days=1), date.today())
-                if mode == NseFetch.TODAY
-                else (date.today(), date.today() + rtd(weeks=1))
-                if mode == NseFetch.NEXT1WEEK
-                else (date.today() - rtd(weeks=1), date.today())
-                if mode == NseFetch.LAST1WEEK
-                else (date.today(), date.today() + rtd(days=15))
-                if mode == NseFetch.NEXT15DAYS
-                else (date.today() - rtd(days=15), date.today())
-                if mode == NseFetch.LAST15DAYS
-                else (date.today(), date.today() + rtd(months=1))
-                if mode == NseFetch.NEXT1MONTH
-                else (date.today() - rtd(months=1), date.today())
-                if mode == NseFetch.LAST1MONTH
-                else (date.today(), date.today() + rtd(months=3))
-                if mode == NseFetch.NEXT3MONTHS
-                else (date.today() - rtd(months=3), date.today())
-                if mode == NseFetch.LAST3MONTHS
-                else (date.today() - rtd(months=6), date.today())
-                if mode == NseFetch.LAST6MONTHS
-                else (date.today() - rtd(years=1), date.today())
-            )
-            return from_date.strftime("%d-%m-%Y"), to_date.strftime("%d-%m-%Y")
-        if mode == NseFetch.CUSTOM and from_date is not None and to_date is not None:
-            if isinstance(from_date, date) and isinstance(to_date, date):
-                return from_date.strftime("%d-%m-%Y"), to_date.strftime("%d-%m-%Y")
-            if isinstance(from_date, str) and isinstance(to_date, str):
-                return from_date, to_date
-            else:
-                raise Exception(
-                    "From Date and To Date Can Not Be Empty and Should be of Either Date Type or a String in `dd-mm-YYYY` Format"
-                )
-        else:
-            raise Exception(
-                "From Date and To Date Can Not Be Empty"
-                + " When Mode is Custom with `from_date` and `to_date`"
-            )
-
-    def __aenter__(self) -> "NseFetch":
-        return self
-
     def __enter__(self) -> "NseFetch":
         return self
 
@@ -186,45 +83,151 @@ class NseFetch:
         max_retries: int = 5,
         debug: bool = True,
         debug_verbose: bool = False,
-        http_version: CurlHttpVersion = CurlHttpVersion.V2_PRIOR_KNOWLEDGE,
+        http_version: Optional[CurlHttpVersion] = None,
+        warmup: Literal["lazy", "background", "eager"] = "lazy",
+        handle_signals: bool = True,
+        shared: bool = False,
+        **kwargs: Any,
     ) -> None:
+        if warmup not in NseFetchBase.WARMUPS:
+            raise ValueError(f"Warmup Should Be One Of {NseFetchBase.WARMUPS}")
+        self.handle_signals = handle_signals
+        self.shared = shared
+        self.__pid = os.getpid()
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__loop_lock = Lock()
+        self.__transport: Optional[SharedTransport] = None
+        self.__kwargs: Dict[str, Any] = dict(
+            max_retries=max_retries,
+            debug=debug,
+            debug_verbose=debug_verbose,
+            http_version=http_version,
+            **kwargs,
+        )
+        self.__client = self.__new_client()
         self.max_retries = max_retries
-        self.debug = debug
-        self.debug_verbose = debug_verbose
-        self.http_version = http_version
-        if self.debug or self.debug_verbose:
-            self.log_level = (
-                logging.INFO
-                if self.debug
-                else logging.DEBUG
-                if self.debug_verbose
-                else logging.WARNING
-            )
-            self.logfile = Path.cwd().joinpath(
-                f"logs/NseFetch_{NseFetch.get_now_date_time_with_microseconds_string()}.log"
-            )
-            os.makedirs(self.logfile.parent, exist_ok=True)
-            self.log = NseFetch.get_logger(
-                "NseFetch", filename=self.logfile, level=self.log_level
-            )
-            logging.basicConfig(format=NseFetch.LOGGING_FORMAT, level=self.log_level)
-        self.__initialize_loop()
-        self._initialize_session()
+        self.log = self.__client.log
+        if warmup == "eager":
+            self._initialize_session()
+        elif warmup == "background":
+            asyncio.run_coroutine_threadsafe(self.client.start(), self.__get_loop())
+
+    def __acquire_transport(self) -> SharedTransport:
+        self.__transport = SharedTransport.acquire(
+            http_version=self.__kwargs.get("http_version"),
+            session_pool_size=self.__kwargs.get("session_pool_size", 2),
+            session_refresh_interval=self.__kwargs.get(
+                "session_refresh_interval", SessionPool.DEFAULT_REFRESH_INTERVAL
+            ),
+            cookie_file=self.__kwargs.get("cookie_file"),
+        )
+        return self.__transport
+
+    def __new_client(self) -> AsyncNseFetch:
+        kwargs = dict(self.__kwargs)
+        if self.shared:
+            self.__acquire_transport()
+            kwargs["session_pool"] = self.__transport.session_pool
+            kwargs.setdefault("scheduler", self.__transport.scheduler)
+            kwargs.setdefault("metrics", self.__transport.metrics)
+            kwargs.setdefault("issuer_cache", self.__transport.issuer_cache)
+        return AsyncNseFetch(**kwargs)
+
+    def __after_fork(self) -> None:
+        self.__pid = os.getpid()
+        self.__loop = None
+        self.__loop_lock = Lock()
+        self.__transport = None
+        self.__client = self.__new_client()
+        self.log = self.__client.log
+        self.log.info("Reinitialized NseFetch In Forked Process: %d", self.__pid)
+
+    @property
+    def client(self) -> AsyncNseFetch:
+        if self.__pid != os.getpid():
+            self.__after_fork()
+        return self.__client
+
+    @property
+    def transport(self) -> Optional[SharedTransport]:
+        return self.__transport
+
+    @property
+    def issuer_cache(self) -> IssuerCache:
+        return self.client.issuer_cache
+
+    @property
+    def response_cache(self) -> Optional[ResponseCache]:
+        return self.client.response_cache
+
+    @property
+    def search_index(self) -> Optional[AnnouncementIndex]:
+        return self.client.search_index
+
+    @property
+    def alert_engine(self) -> Optional[AlertEngine]:
+        return self.client.alert_engine
+
+    @property
+    def payload_fingerprints(self) -> PayloadFingerprints:
+        return self.client.payload_fingerprints
+
+    @property
+    def session_pool(self) -> SessionPool:
+        return self.client.session_pool
+
+    @property
+    def metrics(self) -> Metrics:
+        return self.client.metrics
+
+    def stats(self) -> Dict[str, Any]:
+        return self.client.stats()
+
+    def serve_metrics(self, host: str = "127.0.0.1", port: int = 9464) -> Tuple[str, int]:
+        return self.client.serve_metrics(host, port)
 
     def __graceful_exit(self) -> None:
-        with contextlib.suppress(RuntimeError, RuntimeWarning):
-            if hasattr(self, "__reqsession") and self.__reqsession is not None:
-                asyncio.run_coroutine_threadsafe(
-                    asyncio.ensure_future(self.__reqsession.close()), self.__loop
-                )
-                asyncio.run_coroutine_threadsafe(asyncio.sleep(0.25), self.__loop)
-            asyncio.run_coroutine_threadsafe(
-                self.__loop.shutdown_asyncgens(), self.__loop
-            )
-            if self.__loop.is_running():
-                self.__loop.stop()
-            if not self.__loop.is_closed():
-                self.__loop.close()
+        with contextlib.suppress(RuntimeError, RuntimeWarning, AttributeError):
+            transport, self.__transport = self.__transport, None
+            if transport is not None:
+                if (
+                    transport.pid == os.getpid()
+                    and not transport.closed
+                    and current_thread() is not transport.thread
+                ):
+                    with contextlib.suppress(Exception):
+                        transport.run(
+                            self.__client.aclose(), SharedTransport.SHUTDOWN_TIMEOUT
+                        )
+                self.__client.unregister_collectors()
+                transport.release()
+                return
+            loop, self.__loop = self.__loop, None
+            if loop is None or loop.is_closed() or self.__pid != os.getpid():
+                return
+            thread = getattr(self, "_event_thread", None)
+            wait = loop.is_running() and current_thread() is not thread
+            for coro in (
+                self.__client.aclose(),
+                asyncio.sleep(0.25),
+                loop.shutdown_asyncgens(),
+            ):
+                future = asyncio.run_coroutine_threadsafe(coro, loop)
+                if wait:
+                    with contextlib.suppress(Exception):
+                        future.result(5.0)
+            if loop.is_running():
+                loop.call_soon_threadsafe(loop.stop)
+            if wait and thread is not None:
+                thread.join(1.0)
+            if not loop.is_running():
+                loop.close()
+
+    def close(self) -> None:
+        self.__graceful_exit()
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.__graceful_exit)
 
     def handle_stop_signals(self, *args, **kwargs):
         try:
@@ -234,9 +237,38 @@ class NseFetch:
         else:
             exit()
 
+    def __get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.__pid != os.getpid():
+            self.__after_fork()
+        if self.shared:
+            if self.__transport is None:
+                with self.__loop_lock:
+                    if self.__transport is None:
+                        transport = self.__acquire_transport()
+                        self.__client.bind_transport(
+                            transport.session_pool,
+                            scheduler=None
+                            if "scheduler" in self.__kwargs
+                            else transport.scheduler,
+                            metrics=None
+                            if "metrics" in self.__kwargs
+                            else transport.metrics,
+                            issuer_cache=None
+                            if "issuer_cache" in self.__kwargs
+                            else transport.issuer_cache,
+                        )
+            return self.__transport.loop
+        if self.__loop is None:
+            with self.__loop_lock:
+                if self.__loop is None:
+                    self.__initialize_loop()
+        return self.__loop
+
     def __initialize_loop(self) -> None:
         self.__loop = asyncio.new_event_loop()
-        if NseFetch.is_windows():
+        if not self.handle_signals:
+            pass
+        elif NseFetch.is_windows():
             with contextlib.suppress(ValueError):
                 for sig in SIGNALS:
                     signal.signal(sig, self.handle_stop_signals)
@@ -253,59 +285,10 @@ class NseFetch:
         self._event_thread.start()
         self.log.info("NseFetch Event Loop has been initialized.")
 
-    async def __initialize_session(self, restart: bool = False) -> None:
-        if restart and hasattr(self, "__reqsession"):
-            self.log.info("Closing Previous Requests Session")
-            await self.__reqsession.close()
-            await asyncio.sleep(0.25)
-        self.log.info("Initializing New Requests Session")
-        self.__reqsession = AsyncSession(
-            loop=self.__loop,
-            verify=True,
-            timeout=30,
-            http_version=self.http_version,
-            impersonate="chrome120",
-        )
-        retry_no, status_code, respose_text = 0, None, None
-        while retry_no < 5:
-            try:
-                response = await self.__reqsession.get(NseFetch.ROOT + "/")
-                status_code = response.status_code
-                respose_text = response.text
-                response.raise_for_status()
-            except RequestsError as err:
-                self.log.error(
-                    "NSE HomePage Request Failed With Status Code: %d, Response Text: %s",
-                    status_code,
-                    respose_text,
-                )
-                self.log.error(
-                    "While Fetching NSE Homepage, An Exception: %s Occured", err
-                )
-                retry_no = +1
-                if retry_no == 4:
-                    self.log.critical(
-                        "Retry Limit Exahusted, Retried %d Times But Failed.", retry_no
-                    )
-                    self.log.info("Exiting Program")
-                    self.__graceful_exit()
-                else:
-                    self.log.info(
-                        "Going To retry after %d second, Retry. no. %d", retry_no, retry_no
-                    )
-                    await asyncio.sleep(retry_no)
-            else:
-                self.log.info(
-                    "NSE HomePage Request Succeded With Status Code: %d, Response Text: %s...Truncated To 500 Chars.",
-                    status_code,
-                    respose_text[:500],
-                )
-                return
-
     def _initialize_session(self, restart: bool = False) -> None:
         future = asyncio.run_coroutine_threadsafe(
-            self.__initialize_session(),
-            self.__loop,
+            self.client.restart() if restart else self.client.start(),
+            self.__get_loop(),
         )
         try:
             future.result(5.0)
@@ -317,157 +300,136 @@ class NseFetch:
             error_message = f"The Initialization of Async Client Session Ended Up With An Exception: {exc!r} {future.exception(1.0)}"
             self.log.exception(error_message)
 
-    async def __get_issuer(self, query: str) -> Optional[str]:
-        data = await self.__get("search", params={"q": query})
-        if data is not None and isinstance(data, dict) and "symbols" in data:
-            return pd.DataFrame(data["symbols"]).query("symbol == @query")[
-                "symbol_info"
-            ][0]
+    def __run(self, coro: Coroutine[Any, Any, Any]) -> Any:
+        _timeout = 30.0 * float(self.max_retries + 1)
+        future = asyncio.run_coroutine_threadsafe(coro, self.__get_loop())
+        try:
+            result = future.result(_timeout)
+        except TimeoutError:
+            error_message = f"The Request Took Longer Than The Default Timeout To Wait For The Response, i.e. {_timeout:.2f} Seconds, Cancelling The Task..."
+            self.log.error(error_message)
+            future.cancel()
+        except Exception as exc:
+            error_message = f"The Request Ended Up With An Exception: {exc!r}"
+            self.log.exception(error_message)
+        else:
+            return result
+
+    def prewarm_issuers(
+        self, symbols: List[str], concurrency: int = 8
+    ) -> Optional[Dict[str, Optional[str]]]:
+        return self.__run(self.client.prewarm_issuers(list(symbols), concurrency))
+
+    def download_attachments(
+        self,
+        items: Any,
+        root: Union[str, Path] = "nse_attachments",
+        concurrency: int = AttachmentDownloader.DEFAULT_CONCURRENCY,
+    ) -> Optional[Tuple[Dict[str, Path], Dict[str, str]]]:
+        return self.__run(self.client.download_attachments(items, root, concurrency))
 
-    async def __get_corporate_announcement(
+    def get_watermark(
+        self,
+        index: str = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+    ) -> AnnouncementWatermark:
+        return self.client.get_watermark(index, data_for, symbol)
+
+    def reset_watermark(
+        self,
+        index: Union[str, None] = None,
+        data_for: Union[str, None] = None,
+        symbol: Union[str, None] = None,
+    ) -> None:
+        self.client.reset_watermark(index, data_for, symbol)
+
+    def get_corporate_announcement(
         self,
         index: Literal[
             "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
         ] = "equities",
-        data_for: str = ALLFORTHCOMING,
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
         symbol: Union[str, None] = None,
         from_date: Union[date, str, None] = None,
         to_date: Union[date, str, None] = None,
-    ) -> Optional[Union[pd.DataFrame, str]]:
-        params = {"index": index}
-        from_date, to_date = NseFetch.get_from_to_dates(data_for, from_date, to_date)
-        if symbol is not None:
-            issuer = await self.__get_issuer(symbol)
-            if issuer is not None:
-                params.update(
-                    {
-                        "symbol": symbol,
-                        "issuer": issuer,
-                    }
-                )
-            else:
-                self.log.error("Issuer Details for Symbol: %s Not Found", symbol)
-                return
-        if from_date is not None and to_date is not None:
-            params.update({"from_date": from_date, "to_date": to_date})
-        data = await self.__get("ca", params=params)
-        if data is not None and isinstance(data, list) and isinstance(data[0], dict):
-            df = pd.DataFrame.from_records(data)
-            df["an_dt"] = pd.to_datetime(df["an_dt"])
-            return df.set_index("an_dt").sort_index()
-        else:
-            msg = (
-                "It's Likely That No Events Are There For The Selected Periods\n"
-                + "Or nseindia.com Has Not Returned Back Event Calender Data!"
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> Optional[Union[pd.DataFrame, List[Announcement], str]]:
+        return self.__run(
+            self.client.get_corporate_announcement(
+                index, data_for, symbol, from_date, to_date, columns, output
             )
-            self.log.error(msg)
-            return msg
+        )
 
-    def get_corporate_announcement(
+    def get_new_corporate_announcement(
         self,
         index: Literal[
             "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
         ] = "equities",
-        data_for: str = ALLFORTHCOMING,
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
         symbol: Union[str, None] = None,
         from_date: Union[date, str, None] = None,
         to_date: Union[date, str, None] = None,
-    ) -> Optional[Union[pd.DataFrame, str]]:
-        _timeout = 30.0 * float(self.max_retries + 1)
-        future = asyncio.run_coroutine_threadsafe(
-            self.__get_corporate_announcement(),
-            self.__loop,
-        )
-        try:
-            result = future.result(_timeout)
-        except TimeoutError:
-            error_message = f"The Initialization of Async Client Session Took Longer Than The Default Timeout To Wait For The Response, i.e. {_timeout:.2f} Seconds, Cancelling The Task..."
-            self.log.error(error_message)
-            future.cancel()
-        except Exception as exc:
-            error_message = f"The Initialization of Async Client Session Ended Up With An Exception: {exc!r} {future.exception(_timeout)}"
-            self.log.exception(error_message)
-        else:
-            return result
-
-    async def __get(
-        self, url: str, **kwargs
-    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
-        return await self.__request(
-            HTTPMethod.GET, NseFetch.get_route_url(url), **kwargs
-        )
-
-    async def __post(
-        self, url: str, **kwargs
-    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
-        return await self.__request(
-            HTTPMethod.POST, NseFetch.get_route_url(url), **kwargs
-        )
-
-    async def __put(
-        self, url: str, **kwargs
-    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
-        return await self.__request(
-            HTTPMethod.PUT, NseFetch.get_route_url(url), **kwargs
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> Optional[Union[pd.DataFrame, List[Announcement]]]:
+        return self.__run(
+            self.client.get_new_corporate_announcement(
+                index, data_for, symbol, from_date, to_date, columns, output
+            )
         )
 
-    async def __delete(
-        self, url: str, **kwargs
-    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
-        return await self.__request(
-            HTTPMethod.DELETE, NseFetch.get_route_url(url), **kwargs
+    def get_corporate_announcements_many(
+        self,
+        items: List[str],
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        concurrency: int = 8,
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> Optional[
+        Tuple[Union[pd.DataFrame, List[Announcement]], Dict[str, str]]
+    ]:
+        return self.__run(
+            self.client.get_corporate_announcements_many(
+                items,
+                index,
+                data_for,
+                from_date,
+                to_date,
+                concurrency,
+                columns,
+                output,
+            )
         )
 
-    async def __request(
-        self, method: HTTPMethod, url: str, **kwargs
-    ) -> Optional[Union[Any, Dict[str, Any], List[Dict[str, Any]]]]:
-        _locals = locals()
-        retry_no, status_code, respose_text = 0, None, None
-        while retry_no < self.max_retries:
-            try:
-                self.log.info(
-                    "Initializing Request For Endpoint: %s, Method: %s", url, method
-                )
-                if "params" in _locals and _locals.get("params") is not None:
-                    self.log.info("Request Params: %s", params)
-                if "data" in _locals and _locals.get("data") is not None:
-                    self.log.info("Request Data: %s", data)
-                if "json" in _locals and _locals.get("json") is not None:
-                    self.log.info("Request Json: %s", json)
-                response = await self.__reqsession.request(method, url, **kwargs)
-                status_code = response.status_code
-                respose_text = response.text
-                response.raise_for_status()
-            except RequestsError as err:
-                self.log.error(
-                    "Method: %s, Request For Endpoint: %s, Failed With Status Code: %d, Response Text: %s",
-                    method,
-                    url,
-                    status_code,
-                    respose_text,
-                )
-                self.log.error(
-                    "While Fetching NSE Homepage, An Exception: %s Occured", err
-                )
-                retry_no = +1
-                if retry_no == 4:
-                    self.log.critical(
-                        "Retry Limit Exahusted, Retried %d Times But Failed.", retry_no
-                    )
-                    self.log.info("Exiting Program")
-                    self.__graceful_exit()
-                else:
-                    self.log.info(
-                        "Going To retry after %d second, Retry. no. %d", retry_no, retry_no
-                    )
-                    await asyncio.sleep(retry_no)
-                    await self.__initialize_session(restart=True)
-            else:
-                self.log.info(
-                    "Method: %s, Request For Endpoint: %s Succeded With Status Code: %d, Response Text: %s",
-                    method,
-                    url,
-                    status_code,
-                    respose_text,
+    async def stream_new_corporate_announcement(
+        self,
+        index: Literal[
+            "equities", "sme", "sse", "debt", "municipalBond", "invitsreits", "mf"
+        ] = "equities",
+        data_for: str = NseFetchBase.ALLFORTHCOMING,
+        symbol: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        interval: float = 3.0,
+        columns: Optional[List[str]] = None,
+        output: Literal["dataframe", "records"] = "dataframe",
+    ) -> AsyncIterator[Union[pd.DataFrame, List[Announcement]]]:
+        while True:
+            df = await asyncio.wrap_future(
+                asyncio.run_coroutine_threadsafe(
+                    self.client.get_new_corporate_announcement(
+                        index, data_for, symbol, from_date, to_date, columns, output
+                    ),
+                    self.__get_loop(),
                 )
-                return response.json()
+            )
+            if df is not None and len(df) > 0:
+                yield df
+            await asyncio.sleep(interval)
@@ -0,0 +1,250 @@
+from __future__ import annotations
+import time, bisect, threading, contextlib
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from http.server import ThreadingHTTPServer
+
+__all__ = ["Histogram", "Metrics"]
+
+Labels = Tuple[Tuple[str, str], ...]
+Collector = Callable[[], Dict[str, Union[int, float, str]]]
+
+
+class Histogram:
+    DEFAULT_BUCKETS: Tuple[float, ...] = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1.0,
+        2.5,
+        5.0,
+        10.0,
+        30.0,
+    )
+    RESERVOIR_SIZE: int = 2048
+
+    def __init__(self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets = buckets
+        self.counts: List[int] = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.__recent: Deque[float] = deque(maxlen=Histogram.RESERVOIR_SIZE)
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+        self.__recent.append(value)
+
+    def quantile(self, q: float) -> float:
+        if len(self.__recent) == 0:
+            return 0.0
+        values = sorted(self.__recent)
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def summary(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count > 0 else 0.0,
+            "p50": self.quantile(0.50),
+            "p90": self.quantile(0.90),
+            "p99": self.quantile(0.99),
+            "max": max(self.__recent) if len(self.__recent) > 0 else 0.0,
+        }
+
+
+class Metrics:
+    PREFIX: str = "nse_announcements"
+
+    @staticmethod
+    def get_labels(labels: Dict[str, str]) -> Labels:
+        return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+    @staticmethod
+    def format_labels(labels: Labels, extra: Optional[Dict[str, str]] = None) -> str:
+        items = list(labels) + list((extra or {}).items())
+        if len(items) == 0:
+            return ""
+        return (
+            "{"
+            + ",".join(
+                f'{key}="{Metrics.escape_label_value(value)}"' for key, value in items
+            )
+            + "}"
+        )
+
+    @staticmethod
+    def escape_label_value(value: str) -> str:
+        return (
+            str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        )
+
+    @staticmethod
+    def get_family_header(metric: str, kind: str, help: str) -> List[str]:
+        return [f"# HELP {metric} {help}", f"# TYPE {metric} {kind}"]
+
+    def __init__(self) -> None:
+        self.histograms: Dict[Tuple[str, Labels], Histogram] = {}
+        self.counters: Dict[Tuple[str, Labels], float] = {}
+        self.collectors: Dict[Tuple[str, Labels], Collector] = {}
+        self.__lock = threading.Lock()
+        self.__server: Optional[ThreadingHTTPServer] = None
+
+    def observe(self, name: str, value: float, **labels: str) -> None:
+        key = (name, Metrics.get_labels(labels))
+        with self.__lock:
+            if key not in self.histograms:
+                self.histograms[key] = Histogram()
+            self.histograms[key].observe(value)
+
+    def inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        key = (name, Metrics.get_labels(labels))
+        with self.__lock:
+            self.counters[key] = self.counters.get(key, 0.0) + value
+
+    @contextlib.contextmanager
+    def timer(self, name: str, **labels: str) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def register(self, name: str, collector: Collector, **labels: str) -> None:
+        with self.__lock:
+            self.collectors[(name, Metrics.get_labels(labels))] = collector
+
+    def unregister(self, name: str, **labels: str) -> None:
+        with self.__lock:
+            self.collectors.pop((name, Metrics.get_labels(labels)), None)
+
+    def is_registered(self, name: str, **labels: str) -> bool:
+        return (name, Metrics.get_labels(labels)) in self.collectors
+
+    def stats(self) -> Dict[str, Dict[str, Union[int, float, str, Dict[str, float]]]]:
+        with self.__lock:
+            histograms = {
+                name
+                + Metrics.format_labels(labels): histogram.summary()
+                for (name, labels), histogram in self.histograms.items()
+            }
+            counters = {
+                name + Metrics.format_labels(labels): value
+                for (name, labels), value in self.counters.items()
+            }
+            collectors = list(self.collectors.items())
+        stats: Dict[str, Dict[str, Union[int, float, str, Dict[str, float]]]] = {
+            "latency": histograms,
+            "counters": counters,
+        }
+        for (name, labels), collector in collectors:
+            stats[name + Metrics.format_labels(labels)] = collector()
+        return stats
+
+    def render_prometheus(self) -> str:
+        lines: List[str] = []
+        with self.__lock:
+            family = None
+            for (name, labels), histogram in sorted(self.histograms.items()):
+                metric = f"{Metrics.PREFIX}_{name}_seconds"
+                if metric != family:
+                    family = metric
+                    lines.extend(
+                        Metrics.get_family_header(
+                            metric, "histogram", f"Latency of {name} in seconds."
+                        )
+                    )
+                cumulative = 0
+                for bound, count in zip(histogram.buckets, histogram.counts):
+                    cumulative += count
+                    lines.append(
+                        f"{metric}_bucket{Metrics.format_labels(labels, {'le': str(bound)})} {cumulative}"
+                    )
+                lines.append(
+                    f"{metric}_bucket{Metrics.format_labels(labels, {'le': '+Inf'})} {histogram.count}"
+                )
+                lines.append(
+                    f"{metric}_sum{Metrics.format_labels(labels)} {histogram.sum}"
+                )
+                lines.append(
+                    f"{metric}_count{Metrics.format_labels(labels)} {histogram.count}"
+                )
+            for (name, labels), value in sorted(self.counters.items()):
+                metric = f"{Metrics.PREFIX}_{name}_total"
+                if metric != family:
+                    family = metric
+                    lines.extend(
+                        Metrics.get_family_header(metric, "counter", f"Total {name}.")
+                    )
+                lines.append(f"{metric}{Metrics.format_labels(labels)} {value}")
+            collectors = sorted(self.collectors.items(), key=lambda item: item[0])
+        gauges: Dict[str, List[str]] = {}
+        for (group, labels), collector in collectors:
+            for key, value in collector().items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    metric = f"{Metrics.PREFIX}_{group}_{key}"
+                    if metric not in gauges:
+                        gauges[metric] = Metrics.get_family_header(
+                            metric, "gauge", f"{group} {key}."
+                        )
+                    gauges[metric].append(
+                        f"{metric}{Metrics.format_labels(labels)} {value}"
+                    )
+        for family_lines in gauges.values():
+            lines.extend(family_lines)
+        return "\n".join(lines) + "\n"
+
+    def serve(self, host: str = "127.0.0.1", port: int = 9464) -> Tuple[str, int]:
+        if self.__server is not None:
+            return self.__server.server_address[:2]
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.render_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                return
+
+        self.__server = ThreadingHTTPServer((host, port), MetricsHandler)
+        threading.Thread(
+            target=self.__server.serve_forever,
+            name="NseFetch_metrics_thread",
+            daemon=True,
+        ).start()
+        return self.__server.server_address[:2]
+
+    def shutdown(self) -> None:
+        if self.__server is not None:
+            self.__server.shutdown()
+            self.__server.server_close()
+            self.__server = None
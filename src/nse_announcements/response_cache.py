@@ -0,0 +1,143 @@
+from __future__ import annotations
+import os, time, struct, hashlib, threading, contextlib
+from pathlib import Path
+from collections import OrderedDict
+from typing import Any, Dict, Mapping, Optional, Tuple, Union
+
+__all__ = ["ResponseCache"]
+
+
+class ResponseCache:
+    HEADER: struct.Struct = struct.Struct("<d")
+    SUFFIX: str = ".cache"
+    DEFAULT_MAX_BYTES: int = 512 * 1024 * 1024
+    DEFAULT_LIVE_TTL: float = 5.0
+
+    @staticmethod
+    def get_default_cache_dir() -> Path:
+        return Path.home().joinpath(".cache", "nse_announcements", "responses")
+
+    @staticmethod
+    def get_key(route: str, params: Optional[Mapping[str, Any]] = None) -> str:
+        items = "&".join(
+            f"{key}={value}" for key, value in sorted((params or {}).items())
+        )
+        return hashlib.sha256(f"{route}?{items}".encode("utf-8")).hexdigest()
+
+    def __init__(
+        self,
+        directory: Union[str, Path, None] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        live_ttl: float = DEFAULT_LIVE_TTL,
+    ) -> None:
+        self.directory = (
+            Path(directory)
+            if directory is not None
+            else ResponseCache.get_default_cache_dir()
+        )
+        self.max_bytes = max_bytes
+        self.live_ttl = live_ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.size = 0
+        self.__entries: OrderedDict[str, Tuple[int, float]] = OrderedDict()
+        self.__lock = threading.RLock()
+        os.makedirs(self.directory, exist_ok=True)
+        self.__scan()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def __get_path(self, key: str) -> Path:
+        return self.directory.joinpath(key + ResponseCache.SUFFIX)
+
+    def __scan(self) -> None:
+        entries = []
+        for path in self.directory.glob("*" + ResponseCache.SUFFIX):
+            with contextlib.suppress(OSError, struct.error):
+                with open(path, "rb") as fp:
+                    (expires_at,) = ResponseCache.HEADER.unpack(
+                        fp.read(ResponseCache.HEADER.size)
+                    )
+                stat = path.stat()
+                entries.append((stat.st_mtime, path.stem, stat.st_size, expires_at))
+        with self.__lock:
+            for _, key, size, expires_at in sorted(entries):
+                self.__entries[key] = (size, expires_at)
+                self.size += size
+            self.__evict()
+
+    def __remove(self, key: str) -> None:
+        size, _ = self.__entries.pop(key)
+        self.size -= size
+        with contextlib.suppress(OSError):
+            os.remove(self.__get_path(key))
+
+    def __evict(self) -> None:
+        while self.size > self.max_bytes and len(self.__entries) > 0:
+            self.__remove(next(iter(self.__entries)))
+            self.evictions += 1
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            if entry[1] < time.time():
+                self.__remove(key)
+                self.misses += 1
+                return None
+            try:
+                with open(self.__get_path(key), "rb") as fp:
+                    fp.seek(ResponseCache.HEADER.size)
+                    content = fp.read()
+            except OSError:
+                self.__remove(key)
+                self.misses += 1
+                return None
+            self.__entries.move_to_end(key)
+            with contextlib.suppress(OSError):
+                os.utime(self.__get_path(key))
+            self.hits += 1
+            return content
+
+    def set(self, key: str, content: bytes, ttl: Optional[float] = None) -> None:
+        expires_at = float("inf") if ttl is None else time.time() + ttl
+        size = ResponseCache.HEADER.size + len(content)
+        if size > self.max_bytes:
+            return
+        path = self.__get_path(key)
+        tmpfile = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmpfile, "wb") as fp:
+            fp.write(ResponseCache.HEADER.pack(expires_at))
+            fp.write(content)
+        with self.__lock:
+            os.replace(tmpfile, path)
+            if key in self.__entries:
+                self.size -= self.__entries.pop(key)[0]
+            self.__entries[key] = (size, expires_at)
+            self.size += size
+            self.__evict()
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            if key in self.__entries:
+                self.__remove(key)
+
+    def clear(self) -> None:
+        with self.__lock:
+            for key in list(self.__entries):
+                self.__remove(key)
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total > 0 else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self.__entries),
+            "bytes": self.size,
+        }
@@ -0,0 +1,178 @@
+from __future__ import annotations
+import time, random, asyncio, threading
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional, Tuple, Union
+
+__all__ = ["TokenBucket", "CircuitBreaker", "RequestScheduler"]
+
+
+class TokenBucket:
+    def __init__(self, rate: float, capacity: int) -> None:
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = float(capacity)
+        self.updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def __refill(self, now: float) -> None:
+        self.tokens = min(
+            float(self.capacity), self.tokens + (now - self.updated_at) * self.rate
+        )
+        self.updated_at = now
+
+    def reserve(self) -> float:
+        with self.__lock:
+            self.__refill(time.monotonic())
+            self.tokens -= 1.0
+            return 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+
+    async def acquire(self) -> float:
+        delay = self.reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+
+class CircuitBreaker:
+    CLOSED: str = "closed"
+    OPEN: str = "open"
+    HALF_OPEN: str = "half_open"
+
+    def __init__(self, threshold: int = 3, cooldown: float = 30.0) -> None:
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.state = CircuitBreaker.CLOSED
+        self.failures = 0
+        self.opens = 0
+        self.opened_at: Optional[float] = None
+        self.__lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        return self.state == CircuitBreaker.OPEN
+
+    def get_cooldown_remaining(self) -> float:
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - time.monotonic())
+
+    def record_failure(self) -> bool:
+        with self.__lock:
+            self.failures += 1
+            if self.state == CircuitBreaker.HALF_OPEN or (
+                self.state == CircuitBreaker.CLOSED and self.failures >= self.threshold
+            ):
+                self.state = CircuitBreaker.OPEN
+                self.opened_at = time.monotonic()
+                self.opens += 1
+                return True
+            return False
+
+    def record_success(self) -> None:
+        with self.__lock:
+            self.failures = 0
+            self.state = CircuitBreaker.CLOSED
+
+    def half_open(self) -> None:
+        with self.__lock:
+            self.state = CircuitBreaker.HALF_OPEN
+
+
+class RequestScheduler:
+    AUTH_STATUS_CODES: Tuple[int, ...] = (401, 403)
+    RATE_LIMIT_STATUS_CODES: Tuple[int, ...] = (429, 503)
+    DEFAULT_RATE: Tuple[float, int] = (5.0, 10)
+    DEFAULT_ROUTE_LIMITS: Dict[str, Tuple[float, int]] = {
+        "home": (1.0, 4),
+        "ca": (4.0, 8),
+        "search": (4.0, 8),
+        "files": (20.0, 40),
+    }
+    ISOLATED_ROUTES: Tuple[str, ...] = ("files",)
+
+    @staticmethod
+    def parse_retry_after(value: Union[str, None]) -> Optional[float]:
+        if value is None:
+            return None
+        try:
+            return max(0.0, float(value))
+        except ValueError:
+            pass
+        try:
+            return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return None
+
+    def __init__(
+        self,
+        rate: Tuple[float, int] = DEFAULT_RATE,
+        route_limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        backoff_base: float = 0.5,
+        backoff_cap: float = 30.0,
+        auth_failure_threshold: int = 3,
+        breaker_cooldown: float = 30.0,
+        min_rate: float = 0.2,
+    ) -> None:
+        self.max_rate = rate[0]
+        self.min_rate = min(min_rate, rate[0])
+        self.backoff_base = backoff_base
+        self.backoff_cap = backoff_cap
+        self.bucket = TokenBucket(*rate)
+        self.route_buckets: Dict[str, TokenBucket] = {
+            route: TokenBucket(*limit)
+            for route, limit in (
+                RequestScheduler.DEFAULT_ROUTE_LIMITS
+                if route_limits is None
+                else route_limits
+            ).items()
+        }
+        self.breaker = CircuitBreaker(auth_failure_threshold, breaker_cooldown)
+        self.requests = 0
+        self.retries = 0
+        self.rate_limited = 0
+        self.auth_failures = 0
+        self.throttled_seconds = 0.0
+
+    async def acquire(self, route: str) -> None:
+        self.requests += 1
+        delay = 0.0
+        if route not in RequestScheduler.ISOLATED_ROUTES:
+            delay += await self.bucket.acquire()
+        if route in self.route_buckets:
+            delay += await self.route_buckets[route].acquire()
+        self.throttled_seconds += delay
+
+    def get_backoff(self, retry_no: int, retry_after: Optional[float] = None) -> float:
+        delay = random.uniform(
+            0.0, min(self.backoff_cap, self.backoff_base * 2 ** max(0, retry_no - 1))
+        )
+        if retry_after is not None:
+            delay = max(delay, min(self.backoff_cap, retry_after))
+        return delay
+
+    def record_success(self) -> None:
+        self.breaker.record_success()
+        if self.bucket.rate < self.max_rate:
+            self.bucket.rate = min(self.max_rate, self.bucket.rate + 0.1)
+
+    def record_failure(self, status_code: Optional[int]) -> bool:
+        self.retries += 1
+        if status_code in RequestScheduler.RATE_LIMIT_STATUS_CODES:
+            self.rate_limited += 1
+            self.bucket.rate = max(self.min_rate, self.bucket.rate / 2.0)
+        if status_code in RequestScheduler.AUTH_STATUS_CODES:
+            self.auth_failures += 1
+            return self.breaker.record_failure()
+        return False
+
+    def stats(self) -> Dict[str, Union[int, float, str]]:
+        return {
+            "requests": self.requests,
+            "retries": self.retries,
+            "rate_limited": self.rate_limited,
+            "auth_failures": self.auth_failures,
+            "throttled_seconds": self.throttled_seconds,
+            "current_rate": self.bucket.rate,
+            "breaker_state": self.breaker.state,
+            "breaker_opens": self.breaker.opens,
+        }
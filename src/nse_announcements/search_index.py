@@ -0,0 +1,287 @@
+from __future__ import annotations
+import re, sqlite3, calendar, threading
+from pathlib import Path
+from datetime import date, timedelta
+from datetime import datetime as dtdt
+from typing import Any, Dict, Iterable, List, Literal, Optional, Tuple, Union
+from .announcement import Announcement
+from .store import AnnouncementStore
+
+__all__ = ["AnnouncementIndex"]
+
+
+class AnnouncementIndex:
+    DATE_FORMAT: str = "%Y-%m-%d %H:%M:%S"
+    TOKENIZER: str = "unicode61 remove_diacritics 2"
+    IDS_PER_SECOND: int = 1000
+    TEXT_FIELDS: Tuple[str, ...] = ("desc", "attchmntText")
+    TERM_PATTERN = re.compile(r"\w+\*?", re.UNICODE)
+    SCHEMA: Tuple[str, ...] = (
+        """
+        CREATE TABLE IF NOT EXISTS announcements (
+            id INTEGER PRIMARY KEY,
+            seq_id TEXT UNIQUE,
+            index_name TEXT,
+            symbol TEXT,
+            sm_name TEXT,
+            sm_isin TEXT,
+            smIndustry TEXT,
+            an_dt TEXT,
+            sort_date TEXT,
+            exchdisstime TEXT,
+            difference TEXT,
+            hasXbrl INTEGER,
+            attchmntFile TEXT,
+            desc TEXT,
+            attchmntText TEXT
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS announcements_symbol ON announcements (symbol)",
+        """
+        CREATE VIRTUAL TABLE IF NOT EXISTS announcements_fts USING fts5 (
+            desc,
+            attchmntText,
+            content='announcements',
+            content_rowid='id',
+            tokenize='{tokenizer}'
+        )
+        """,
+    )
+    COLUMNS: Tuple[str, ...] = (
+        "seq_id",
+        "index_name",
+        "symbol",
+        "sm_name",
+        "sm_isin",
+        "smIndustry",
+        "an_dt",
+        "sort_date",
+        "exchdisstime",
+        "difference",
+        "hasXbrl",
+        "attchmntFile",
+        "desc",
+        "attchmntText",
+    )
+
+    @staticmethod
+    def quote(term: str) -> str:
+        if term.endswith("*"):
+            return AnnouncementIndex.quote(term[:-1]) + "*"
+        return '"' + term.replace('"', '""') + '"'
+
+    @staticmethod
+    def get_match(
+        terms: Union[str, List[str], None] = None,
+        phrase: Union[str, None] = None,
+        match: Union[str, None] = None,
+        field: Union[str, None] = None,
+    ) -> Optional[str]:
+        parts: List[str] = []
+        if terms is not None:
+            for term in [terms] if isinstance(terms, str) else terms:
+                parts.extend(
+                    AnnouncementIndex.quote(token)
+                    for token in AnnouncementIndex.TERM_PATTERN.findall(term)
+                )
+        if phrase is not None:
+            parts.append(
+                AnnouncementIndex.quote(
+                    " ".join(AnnouncementIndex.TERM_PATTERN.findall(phrase))
+                )
+            )
+        if match is not None:
+            parts.append(f"({match})")
+        if len(parts) == 0:
+            return None
+        expression = " AND ".join(parts)
+        if field is not None:
+            if field not in AnnouncementIndex.TEXT_FIELDS:
+                raise ValueError(
+                    f"Field Should Be One Of {AnnouncementIndex.TEXT_FIELDS} Or None"
+                )
+            expression = f"{field} : ({expression})"
+        return expression
+
+    @staticmethod
+    def get_base_id(value: Union[dtdt, date, None]) -> int:
+        if value is None:
+            return 0
+        return (
+            calendar.timegm(value.timetuple()) * AnnouncementIndex.IDS_PER_SECOND
+        )
+
+    @staticmethod
+    def to_announcements(items: Any) -> Iterable[Announcement]:
+        if hasattr(items, "columns"):
+            items = items.reset_index().to_dict("records")
+        for item in items:
+            yield item if isinstance(item, Announcement) else Announcement.from_record(
+                item
+            )
+
+    def __init__(
+        self, filename: Union[str, Path] = "nse_announcements_index.sqlite3"
+    ) -> None:
+        self.filename = Path(filename)
+        if self.filename.parent != Path("."):
+            self.filename.parent.mkdir(parents=True, exist_ok=True)
+        self.__lock = threading.RLock()
+        self.__connection = sqlite3.connect(str(self.filename), check_same_thread=False)
+        self.__connection.execute("PRAGMA journal_mode=WAL")
+        self.__connection.execute("PRAGMA synchronous=NORMAL")
+        with self.__connection:
+            for statement in AnnouncementIndex.SCHEMA:
+                self.__connection.execute(
+                    statement.format(tokenizer=AnnouncementIndex.TOKENIZER)
+                )
+        self.added = 0
+        self.overflowed = 0
+        self.queries = 0
+
+    def __len__(self) -> int:
+        with self.__lock:
+            return self.__connection.execute(
+                "SELECT COUNT(*) FROM announcements"
+            ).fetchone()[0]
+
+    def __get_row(self, announcement: Announcement, index: str) -> Tuple[Any, ...]:
+        return (
+            None if announcement.seq_id in (None, "") else str(announcement.seq_id),
+            index,
+            announcement.symbol,
+            announcement.sm_name,
+            announcement.sm_isin,
+            announcement.smIndustry,
+            announcement.an_dt.strftime(AnnouncementIndex.DATE_FORMAT)
+            if announcement.an_dt is not None
+            else None,
+            None if announcement.sort_date is None else str(announcement.sort_date),
+            None if announcement.exchdisstime is None else str(announcement.exchdisstime),
+            announcement.difference,
+            None if announcement.hasXbrl is None else int(bool(announcement.hasXbrl)),
+            announcement.attchmntFile,
+            announcement.desc,
+            announcement.attchmntText,
+        )
+
+    def add(self, items: Any, index: str = "equities") -> int:
+        insert = (
+            f"INSERT INTO announcements (id, {', '.join(AnnouncementIndex.COLUMNS)}) "
+            + f"VALUES ({', '.join('?' * (len(AnnouncementIndex.COLUMNS) + 1))})"
+        )
+        added = 0
+        with self.__lock, self.__connection:
+            cursor = self.__connection.cursor()
+            for announcement in AnnouncementIndex.to_announcements(items):
+                row = self.__get_row(announcement, index)
+                if (
+                    row[0] is not None
+                    and cursor.execute(
+                        "SELECT 1 FROM announcements WHERE seq_id = ?", (row[0],)
+                    ).fetchone()
+                    is not None
+                ):
+                    continue
+                base_id = AnnouncementIndex.get_base_id(announcement.an_dt)
+                last_id = cursor.execute(
+                    "SELECT MAX(id) FROM announcements WHERE id >= ? AND id < ?",
+                    (base_id, base_id + AnnouncementIndex.IDS_PER_SECOND),
+                ).fetchone()[0]
+                row_id = base_id if last_id is None else last_id + 1
+                if row_id >= base_id + AnnouncementIndex.IDS_PER_SECOND:
+                    row_id = cursor.execute(
+                        "SELECT a.id + 1 FROM announcements a WHERE a.id >= ? AND NOT EXISTS "
+                        + "(SELECT 1 FROM announcements b WHERE b.id = a.id + 1) ORDER BY a.id LIMIT 1",
+                        (base_id,),
+                    ).fetchone()[0]
+                    self.overflowed += 1
+                cursor.execute(insert, (row_id, *row))
+                cursor.execute(
+                    "INSERT INTO announcements_fts (rowid, desc, attchmntText) VALUES (?, ?, ?)",
+                    (row_id, announcement.desc, announcement.attchmntText),
+                )
+                added += 1
+        self.added += added
+        return added
+
+    def search(
+        self,
+        terms: Union[str, List[str], None] = None,
+        phrase: Union[str, None] = None,
+        match: Union[str, None] = None,
+        symbol: Union[str, List[str], None] = None,
+        index: Union[str, None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        field: Literal["desc", "attchmntText", None] = None,
+        limit: Optional[int] = 100,
+        ranked: bool = False,
+    ) -> List[Announcement]:
+        expression = AnnouncementIndex.get_match(terms, phrase, match, field)
+        columns = ", ".join(f"a.{column}" for column in AnnouncementIndex.COLUMNS)
+        if expression is not None:
+            sql = f"SELECT {columns} FROM announcements_fts JOIN announcements a ON a.id = announcements_fts.rowid"
+            clauses, params = ["announcements_fts MATCH ?"], [expression]
+            id_column = "announcements_fts.rowid"
+        else:
+            sql = f"SELECT {columns} FROM announcements a"
+            clauses, params = [], []
+            id_column = "a.id"
+        if symbol is not None:
+            symbols = [symbol] if isinstance(symbol, str) else list(symbol)
+            clauses.append(f"a.symbol IN ({', '.join('?' * len(symbols))})")
+            params.extend(symbols)
+        if index is not None:
+            clauses.append("a.index_name = ?")
+            params.append(index)
+        from_day = AnnouncementStore.to_date(from_date)
+        if from_day is not None:
+            clauses.append(f"{id_column} >= ?")
+            params.append(AnnouncementIndex.get_base_id(from_day))
+        to_day = AnnouncementStore.to_date(to_date)
+        if to_day is not None:
+            clauses.append(f"{id_column} < ?")
+            params.append(AnnouncementIndex.get_base_id(to_day + timedelta(days=1)))
+        if len(clauses) > 0:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += (
+            f" ORDER BY bm25(announcements_fts), {id_column} DESC"
+            if ranked and expression is not None
+            else f" ORDER BY {id_column} DESC"
+        )
+        if limit is not None:
+            sql += " LIMIT ?"
+            params.append(limit)
+        with self.__lock:
+            rows = self.__connection.execute(sql, params).fetchall()
+        self.queries += 1
+        announcements: List[Announcement] = []
+        for row in rows:
+            record: Dict[str, Any] = dict(zip(AnnouncementIndex.COLUMNS, row))
+            if record["an_dt"] is not None:
+                record["an_dt"] = dtdt.strptime(
+                    record["an_dt"], AnnouncementIndex.DATE_FORMAT
+                )
+            if record["hasXbrl"] is not None:
+                record["hasXbrl"] = bool(record["hasXbrl"])
+            announcements.append(Announcement.from_record(record))
+        return announcements
+
+    def optimize(self) -> None:
+        with self.__lock, self.__connection:
+            self.__connection.execute(
+                "INSERT INTO announcements_fts (announcements_fts) VALUES ('optimize')"
+            )
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "entries": len(self),
+            "added": self.added,
+            "overflowed": self.overflowed,
+            "queries": self.queries,
+        }
+
+    def close(self) -> None:
+        with self.__lock:
+            self.__connection.close()
@@ -0,0 +1,288 @@
+from __future__ import annotations
+import os, json, time, asyncio, logging, contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Set, Union
+from .scheduler import RequestScheduler
+from .metrics import Metrics
+
+if TYPE_CHECKING:
+    from curl_cffi import CurlHttpVersion
+    from curl_cffi.requests import AsyncSession
+
+__all__ = ["SessionPool"]
+
+
+class SessionPool:
+    DEFAULT_REFRESH_INTERVAL: float = 240.0
+    RETIRE_DELAY: float = 35.0
+
+    def __init__(
+        self,
+        root: str,
+        size: int = 2,
+        http_version: Optional[CurlHttpVersion] = None,
+        refresh_interval: Optional[float] = DEFAULT_REFRESH_INTERVAL,
+        cookie_file: Union[str, Path, None] = None,
+        warm_retries: int = 5,
+        scheduler: Optional[RequestScheduler] = None,
+        metrics: Optional[Metrics] = None,
+        log: Optional[logging.Logger] = None,
+    ) -> None:
+        self.root = root
+        self.size = max(1, size)
+        self.http_version = http_version
+        self.refresh_interval = refresh_interval
+        self.cookie_file = Path(cookie_file) if cookie_file is not None else None
+        self.warm_retries = warm_retries
+        self.scheduler = scheduler
+        self.metrics = metrics
+        self.log = log if log is not None else logging.getLogger("NseFetch")
+        self.warmups = 0
+        self.restarts = 0
+        self.__sessions: List[AsyncSession] = []
+        self.__warmed_at: List[float] = []
+        self.__restarting: Dict[int, asyncio.Task] = {}
+        self.__retired: Dict[AsyncSession, asyncio.TimerHandle] = {}
+        self.__closing: Set[asyncio.Task] = set()
+        self.__next = 0
+        self.__refresher: Optional[asyncio.Task] = None
+        self.__start_lock: Optional[asyncio.Lock] = None
+
+    def __len__(self) -> int:
+        return len(self.__sessions)
+
+    def __new_session(self) -> AsyncSession:
+        from curl_cffi import CurlHttpVersion
+        from curl_cffi.requests import AsyncSession
+
+        return AsyncSession(
+            loop=asyncio.get_running_loop(),
+            verify=True,
+            timeout=30,
+            http_version=self.http_version
+            if self.http_version is not None
+            else CurlHttpVersion.V2_PRIOR_KNOWLEDGE,
+            impersonate="chrome120",
+        )
+
+    async def __warm(self, session: AsyncSession) -> bool:
+        from curl_cffi.requests import RequestsError
+
+        retry_no, status_code, respose_text = 0, None, None
+        while retry_no < self.warm_retries:
+            if self.scheduler is not None:
+                await self.scheduler.acquire("home")
+            started_at = time.perf_counter()
+            try:
+                response = await session.get(self.root + "/")
+                if self.metrics is not None:
+                    self.metrics.observe(
+                        "request",
+                        time.perf_counter() - started_at,
+                        route="home",
+                        phase="session_warmup",
+                    )
+                    self.metrics.inc(
+                        "bytes_received", len(response.content), route="home"
+                    )
+                status_code = response.status_code
+                respose_text = response.text
+                response.raise_for_status()
+            except RequestsError as err:
+                self.log.error(
+                    "NSE HomePage Request Failed With Status Code: %s, Response Text: %s",
+                    status_code,
+                    respose_text,
+                )
+                self.log.error(
+                    "While Fetching NSE Homepage, An Exception: %s Occured", err
+                )
+                retry_no += 1
+                if retry_no == self.warm_retries:
+                    self.log.critical(
+                        "Retry Limit Exahusted, Retried %d Times But Failed.", retry_no
+                    )
+                else:
+                    delay = (
+                        self.scheduler.get_backoff(retry_no)
+                        if self.scheduler is not None
+                        else float(retry_no)
+                    )
+                    self.log.info(
+                        "Going To retry after %.2f second, Retry. no. %d", delay, retry_no
+                    )
+                    await asyncio.sleep(delay)
+            else:
+                self.warmups += 1
+                self.log.info(
+                    "NSE HomePage Request Succeded With Status Code: %d, Response Text: %s...Truncated To 500 Chars.",
+                    status_code,
+                    respose_text[:500],
+                )
+                return True
+        return False
+
+    def __load_cookies(self) -> Optional[List[Dict[str, Any]]]:
+        if self.cookie_file is None:
+            return None
+        with contextlib.suppress(OSError, ValueError, TypeError, KeyError):
+            with open(self.cookie_file, "r", encoding="utf-8") as fp:
+                data = json.load(fp)
+            now = time.time()
+            if (
+                self.refresh_interval is not None
+                and now - float(data["saved_at"]) > self.refresh_interval
+            ):
+                return None
+            cookies = data["cookies"]
+            if len(cookies) == 0 or any(
+                cookie.get("expires") is not None and cookie["expires"] <= now
+                for cookie in cookies
+            ):
+                return None
+            return cookies
+        return None
+
+    def save_cookies(self, session: Optional[AsyncSession] = None) -> None:
+        if self.cookie_file is None or len(self.__sessions) == 0:
+            return
+        session = session if session is not None else self.__sessions[0]
+        cookies = [
+            {
+                "name": cookie.name,
+                "value": cookie.value,
+                "domain": cookie.domain,
+                "path": cookie.path,
+                "expires": cookie.expires,
+            }
+            for cookie in session.cookies.jar
+        ]
+        os.makedirs(self.cookie_file.parent, exist_ok=True)
+        tmpfile = self.cookie_file.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmpfile, "w", encoding="utf-8") as fp:
+            json.dump({"saved_at": time.time(), "cookies": cookies}, fp)
+        os.replace(tmpfile, self.cookie_file)
+
+    async def __create(self, cookies: Optional[List[Dict[str, Any]]] = None) -> AsyncSession:
+        session = self.__new_session()
+        if cookies is not None:
+            for cookie in cookies:
+                session.cookies.set(
+                    cookie["name"],
+                    cookie["value"],
+                    domain=cookie.get("domain") or "",
+                    path=cookie.get("path") or "/",
+                )
+            self.log.info("Reusing %d Persisted Session Cookies", len(cookies))
+        else:
+            self.log.info("Initializing New Requests Session")
+            await self.__warm(session)
+        return session
+
+    async def start(self) -> None:
+        if len(self.__sessions) > 0:
+            return
+        if self.__start_lock is None:
+            self.__start_lock = asyncio.Lock()
+        async with self.__start_lock:
+            if len(self.__sessions) == 0:
+                await self.__start()
+
+    async def __start(self) -> None:
+        cookies = self.__load_cookies()
+        self.__sessions = list(
+            await asyncio.gather(*(self.__create(cookies) for _ in range(self.size)))
+        )
+        self.__warmed_at = [
+            time.time() if cookies is None else time.time() - self.__cookie_age()
+            for _ in self.__sessions
+        ]
+        if cookies is None:
+            self.save_cookies()
+        if self.refresh_interval is not None and self.__refresher is None:
+            self.__refresher = asyncio.create_task(self.__refresh_forever())
+
+    def __cookie_age(self) -> float:
+        with contextlib.suppress(OSError, ValueError, TypeError, KeyError):
+            with open(self.cookie_file, "r", encoding="utf-8") as fp:
+                return max(0.0, time.time() - float(json.load(fp)["saved_at"]))
+        return 0.0
+
+    def acquire(self) -> AsyncSession:
+        if len(self.__sessions) == 0:
+            raise RuntimeError("Session Pool Has Not Been Started")
+        session = self.__sessions[self.__next % len(self.__sessions)]
+        self.__next = (self.__next + 1) % len(self.__sessions)
+        return session
+
+    def __retire(self, session: AsyncSession) -> None:
+        self.__retired[session] = asyncio.get_running_loop().call_later(
+            SessionPool.RETIRE_DELAY, self.__close_retired, session
+        )
+
+    def __close_retired(self, session: AsyncSession) -> None:
+        if self.__retired.pop(session, None) is None:
+            return
+        task = asyncio.get_running_loop().create_task(session.close())
+        self.__closing.add(task)
+        task.add_done_callback(self.__closing.discard)
+
+    async def __replace(self, slot: int) -> None:
+        session = await self.__create()
+        old, self.__sessions[slot] = self.__sessions[slot], session
+        self.__warmed_at[slot] = time.time()
+        self.save_cookies(session)
+        self.__retire(old)
+
+    async def restart(self, session: Optional[AsyncSession] = None) -> None:
+        if session is None:
+            slots = list(range(len(self.__sessions)))
+        elif session in self.__sessions:
+            slots = [self.__sessions.index(session)]
+        else:
+            return
+        tasks = []
+        for slot in slots:
+            if slot not in self.__restarting:
+                self.restarts += 1
+                self.log.info("Restarting Requests Session In Slot: %d", slot)
+                task = asyncio.create_task(self.__replace(slot))
+                task.add_done_callback(
+                    lambda _, slot=slot: self.__restarting.pop(slot, None)
+                )
+                self.__restarting[slot] = task
+            tasks.append(self.__restarting[slot])
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def __refresh_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self.refresh_interval / len(self.__sessions))
+            slot = min(range(len(self.__sessions)), key=self.__warmed_at.__getitem__)
+            if time.time() - self.__warmed_at[slot] < self.refresh_interval:
+                continue
+            self.log.info("Refreshing Requests Session In Slot: %d In Background", slot)
+            with contextlib.suppress(Exception):
+                await self.restart(self.__sessions[slot])
+
+    def stats(self) -> Dict[str, Union[int, float]]:
+        return {
+            "size": len(self.__sessions),
+            "warmups": self.warmups,
+            "restarts": self.restarts,
+        }
+
+    async def close(self) -> None:
+        if self.__refresher is not None:
+            self.__refresher.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self.__refresher
+            self.__refresher = None
+        for handle in self.__retired.values():
+            handle.cancel()
+        retired, self.__retired = list(self.__retired), {}
+        sessions, self.__sessions, self.__warmed_at = self.__sessions, [], []
+        for session in retired + sessions:
+            with contextlib.suppress(Exception):
+                await session.close()
+        if len(self.__closing) > 0:
+            await asyncio.gather(*self.__closing, return_exceptions=True)
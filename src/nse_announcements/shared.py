@@ -0,0 +1,148 @@
+from __future__ import annotations
+import os, asyncio, logging, threading, contextlib
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Coroutine, Dict, Optional, Tuple, Union
+from .base import NseFetchBase
+from .issuer_cache import IssuerCache
+from .session_pool import SessionPool
+from .scheduler import RequestScheduler
+from .metrics import Metrics
+
+if TYPE_CHECKING:
+    from curl_cffi import CurlHttpVersion
+
+__all__ = ["SharedTransport"]
+
+TransportKey = Tuple[Any, ...]
+
+_TRANSPORTS: Dict[TransportKey, "SharedTransport"] = {}
+_TRANSPORTS_LOCK = threading.Lock()
+
+
+class SharedTransport:
+    SHUTDOWN_TIMEOUT: float = 5.0
+
+    @staticmethod
+    def acquire(
+        http_version: Optional[CurlHttpVersion] = None,
+        session_pool_size: int = 2,
+        session_refresh_interval: Optional[
+            float
+        ] = SessionPool.DEFAULT_REFRESH_INTERVAL,
+        cookie_file: Union[str, Path, None] = None,
+    ) -> "SharedTransport":
+        key = (
+            NseFetchBase.ROOT,
+            http_version,
+            session_pool_size,
+            session_refresh_interval,
+            str(cookie_file) if cookie_file is not None else None,
+        )
+        with _TRANSPORTS_LOCK:
+            transport = _TRANSPORTS.get(key)
+            if transport is None or transport.pid != os.getpid() or transport.closed:
+                transport = SharedTransport(key, *key[1:])
+                _TRANSPORTS[key] = transport
+            transport.references += 1
+            return transport
+
+    @staticmethod
+    def reset_after_fork() -> None:
+        global _TRANSPORTS_LOCK
+        _TRANSPORTS_LOCK = threading.Lock()
+        _TRANSPORTS.clear()
+
+    def __init__(
+        self,
+        key: TransportKey,
+        http_version: Optional[CurlHttpVersion] = None,
+        session_pool_size: int = 2,
+        session_refresh_interval: Optional[float] = SessionPool.DEFAULT_REFRESH_INTERVAL,
+        cookie_file: Optional[str] = None,
+    ) -> None:
+        self.key = key
+        self.pid = os.getpid()
+        self.references = 0
+        self.closed = False
+        self.log = logging.getLogger("NseFetch")
+        self.scheduler = RequestScheduler()
+        self.metrics = Metrics()
+        self.issuer_cache = IssuerCache()
+        self.session_pool = SessionPool(
+            NseFetchBase.ROOT,
+            size=session_pool_size,
+            http_version=http_version,
+            refresh_interval=session_refresh_interval,
+            cookie_file=cookie_file,
+            scheduler=self.scheduler,
+            metrics=self.metrics,
+            log=self.log,
+        )
+        self.metrics.register("scheduler", self.scheduler.stats)
+        self.metrics.register("sessions", self.session_pool.stats)
+        self.metrics.register("issuer_cache", self.issuer_cache.stats)
+        self.loop = asyncio.new_event_loop()
+        self.thread = threading.Thread(
+            target=self.loop.run_forever,
+            name=f"{self.__class__.__name__}_event_thread",
+            daemon=True,
+        )
+        self.thread.start()
+        self.log.info("Shared Transport Event Loop Has Been Initialized")
+
+    def __repr__(self) -> str:
+        return (
+            f"SharedTransport(pid={self.pid}, references={self.references}, "
+            + f"sessions={len(self.session_pool)}, closed={self.closed})"
+        )
+
+    def submit(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Future:
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine[Any, Any, Any], timeout: Optional[float] = None) -> Any:
+        if threading.current_thread() is self.thread:
+            raise RuntimeError("SharedTransport.run Cannot Be Called From Its Own Loop")
+        return self.submit(coro).result(timeout)
+
+    def release(self) -> None:
+        with _TRANSPORTS_LOCK:
+            if self.closed or self.pid != os.getpid():
+                return
+            self.references -= 1
+            if self.references > 0:
+                return
+            self.closed = True
+            if _TRANSPORTS.get(self.key) is self:
+                del _TRANSPORTS[self.key]
+        self.close()
+
+    async def aclose(self) -> None:
+        await asyncio.to_thread(self.release)
+
+    def close(self) -> None:
+        self.closed = True
+        if self.loop.is_closed():
+            return
+        if self.loop.is_running() and threading.current_thread() is not self.thread:
+            for coro in (
+                self.session_pool.close(),
+                self.loop.shutdown_asyncgens(),
+            ):
+                with contextlib.suppress(Exception):
+                    self.run(coro, SharedTransport.SHUTDOWN_TIMEOUT)
+            with contextlib.suppress(OSError):
+                self.issuer_cache.save()
+            self.loop.call_soon_threadsafe(self.loop.stop)
+            self.thread.join(SharedTransport.SHUTDOWN_TIMEOUT)
+        elif self.loop.is_running():
+            self.loop.create_task(self.session_pool.close()).add_done_callback(
+                lambda _: self.loop.stop()
+            )
+            return
+        if not self.loop.is_running():
+            self.loop.close()
+        self.log.info("Shared Transport Has Been Closed")
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=SharedTransport.reset_after_fork)
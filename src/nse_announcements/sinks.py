@@ -0,0 +1,178 @@
+from __future__ import annotations
+import csv, sys, json, socket, logging, contextlib
+from pathlib import Path
+from typing import IO, Dict, List, Optional, Type, Union
+from .base import NseFetchBase
+from .announcement import Announcement
+from .store import AnnouncementStore
+
+__all__ = [
+    "Sink",
+    "JsonLinesSink",
+    "CsvSink",
+    "ParquetSink",
+    "SocketSink",
+    "SINKS",
+    "get_sink",
+]
+
+
+class Sink:
+    @classmethod
+    def from_spec(cls, target: str, index: str = "equities") -> "Sink":
+        return cls()
+
+    def write(self, announcements: List[Announcement]) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+class JsonLinesSink(Sink):
+    @classmethod
+    def from_spec(cls, target: str, index: str = "equities") -> "JsonLinesSink":
+        return cls(target or None)
+
+    def __init__(self, filename: Union[str, Path, None] = None) -> None:
+        self.filename = Path(filename) if filename is not None else None
+        self.__fp: IO[str] = (
+            open(self.filename, "a", encoding="utf-8")
+            if self.filename is not None
+            else sys.stdout
+        )
+
+    def write(self, announcements: List[Announcement]) -> None:
+        self.__fp.writelines(
+            json.dumps(announcement.to_dict(), default=str) + "\n"
+            for announcement in announcements
+        )
+        self.__fp.flush()
+
+    def close(self) -> None:
+        if self.filename is not None:
+            self.__fp.close()
+
+
+class CsvSink(Sink):
+    @classmethod
+    def from_spec(cls, target: str, index: str = "equities") -> "CsvSink":
+        return cls(target or "nse_announcements.csv")
+
+    def __init__(self, filename: Union[str, Path]) -> None:
+        self.filename = Path(filename)
+        header = not self.filename.exists() or self.filename.stat().st_size == 0
+        self.__fp = open(self.filename, "a", encoding="utf-8", newline="")
+        self.__writer = csv.DictWriter(
+            self.__fp, fieldnames=Announcement.FIELDS, extrasaction="ignore"
+        )
+        if header:
+            self.__writer.writeheader()
+
+    def write(self, announcements: List[Announcement]) -> None:
+        self.__writer.writerows(announcement.to_dict() for announcement in announcements)
+        self.__fp.flush()
+
+    def close(self) -> None:
+        self.__fp.close()
+
+
+class ParquetSink(Sink):
+    @classmethod
+    def from_spec(cls, target: str, index: str = "equities") -> "ParquetSink":
+        return cls(target or "nse_announcements_store", index=index)
+
+    def __init__(
+        self,
+        root: Union[str, Path] = "nse_announcements_store",
+        index: str = "equities",
+    ) -> None:
+        self.store = AnnouncementStore(root)
+        self.index = index
+
+    def write(self, announcements: List[Announcement]) -> None:
+        self.store.append(
+            NseFetchBase.records_to_dataframe(
+                [announcement.to_dict() for announcement in announcements]
+            ),
+            index=self.index,
+        )
+
+
+class SocketSink(Sink):
+    @classmethod
+    def from_spec(cls, target: str, index: str = "equities") -> "SocketSink":
+        scheme, _, address = target.partition(":")
+        if scheme == "unix" and address:
+            return cls(path=address)
+        if scheme == "tcp" and address:
+            host, _, port = address.rpartition(":")
+            return cls(host=host or "127.0.0.1", port=int(port))
+        raise ValueError(
+            f"Socket Sink Should Look Like socket:unix:/path Or socket:tcp:host:port, Got: {target}"
+        )
+
+    def __init__(
+        self,
+        path: Union[str, Path, None] = None,
+        host: str = "127.0.0.1",
+        port: Optional[int] = None,
+        timeout: float = 5.0,
+        log: Optional[logging.Logger] = None,
+    ) -> None:
+        if path is None and port is None:
+            raise ValueError("Either A Unix Socket `path` Or A TCP `port` Is Required")
+        self.path = str(path) if path is not None else None
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self.log = log if log is not None else logging.getLogger("NseFetch")
+        self.__socket: Optional[socket.socket] = None
+
+    def __connect(self) -> socket.socket:
+        if self.__socket is None:
+            if self.path is not None:
+                self.__socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+                self.__socket.settimeout(self.timeout)
+                self.__socket.connect(self.path)
+            else:
+                self.__socket = socket.create_connection(
+                    (self.host, self.port), timeout=self.timeout
+                )
+        return self.__socket
+
+    def write(self, announcements: List[Announcement]) -> None:
+        payload = "".join(
+            json.dumps(announcement.to_dict(), default=str) + "\n"
+            for announcement in announcements
+        ).encode("utf-8")
+        for attempt in range(2):
+            try:
+                self.__connect().sendall(payload)
+                return
+            except OSError as err:
+                self.close()
+                if attempt > 0:
+                    raise
+                self.log.warning("Socket Sink Failed With: %r, Reconnecting", err)
+
+    def close(self) -> None:
+        if self.__socket is not None:
+            with contextlib.suppress(OSError):
+                self.__socket.close()
+            self.__socket = None
+
+
+SINKS: Dict[str, Type[Sink]] = {
+    "jsonl": JsonLinesSink,
+    "csv": CsvSink,
+    "parquet": ParquetSink,
+    "socket": SocketSink,
+}
+
+
+def get_sink(spec: str, index: str = "equities") -> Sink:
+    name, _, target = spec.partition(":")
+    if name not in SINKS:
+        raise ValueError(f"Sink Should Be One Of {tuple(SINKS)}, Got: {spec}")
+    return SINKS[name].from_spec(target, index=index)
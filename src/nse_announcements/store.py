@@ -0,0 +1,233 @@
+from __future__ import annotations
+import os, uuid, threading
+from pathlib import Path
+from datetime import date
+from datetime import datetime as dtdt
+from typing import TYPE_CHECKING, Any, Dict, Iterable, List, Optional, Set, Union
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+__all__ = ["AnnouncementStore"]
+
+
+class AnnouncementStore:
+    DATE_FORMAT: str = "%Y-%m-%d"
+    INDEX_COLUMN: str = "an_dt"
+    KEY_COLUMN: str = "seq_id"
+
+    @staticmethod
+    def import_pyarrow() -> Any:
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError as err:
+            raise ImportError(
+                "AnnouncementStore Requires `pyarrow`, Install It With "
+                + "`pip install nse_announcements[parquet]`"
+            ) from err
+        return pa, pq
+
+    @staticmethod
+    def to_date(value: Union[date, str, None]) -> Optional[date]:
+        if value is None or isinstance(value, date):
+            return value.date() if isinstance(value, dtdt) else value
+        for fmt in ("%d-%m-%Y", AnnouncementStore.DATE_FORMAT):
+            try:
+                return dtdt.strptime(value, fmt).date()
+            except ValueError:
+                continue
+        raise ValueError(
+            f"Date: {value!r} Should Be In Either `dd-mm-YYYY` Or `YYYY-mm-dd` Format"
+        )
+
+    @staticmethod
+    def to_string(value: Any) -> Optional[str]:
+        if value is None or (isinstance(value, float) and value != value):
+            return None
+        return value if isinstance(value, str) else str(value)
+
+    def __init__(self, root: Union[str, Path] = "nse_announcements_store") -> None:
+        self.root = Path(root)
+        self.__seq_ids: Dict[Path, Set[str]] = {}
+        self.__lock = threading.RLock()
+
+    def get_partition(self, index: str, day: date) -> Path:
+        return self.root.joinpath(
+            f"index={index}", f"date={day.strftime(AnnouncementStore.DATE_FORMAT)}"
+        )
+
+    def __get_partition_seq_ids(self, partition: Path) -> Set[str]:
+        if partition not in self.__seq_ids:
+            _, pq = AnnouncementStore.import_pyarrow()
+            seq_ids: Set[str] = set()
+            for file in sorted(partition.glob("*.parquet")):
+                table = pq.read_table(file, columns=[AnnouncementStore.KEY_COLUMN])
+                seq_ids.update(
+                    value
+                    for value in table.column(AnnouncementStore.KEY_COLUMN).to_pylist()
+                    if value is not None
+                )
+            self.__seq_ids[partition] = seq_ids
+        return self.__seq_ids[partition]
+
+    def __normalize(self, df: pd.DataFrame) -> pd.DataFrame:
+        import pandas as pd
+
+        if df.index.name == AnnouncementStore.INDEX_COLUMN:
+            df = df.reset_index()
+        df = df.copy()
+        df[AnnouncementStore.INDEX_COLUMN] = pd.to_datetime(
+            df[AnnouncementStore.INDEX_COLUMN]
+        )
+        for column in df.columns:
+            if not pd.api.types.is_datetime64_any_dtype(df[column]):
+                df[column] = df[column].map(AnnouncementStore.to_string).astype(object)
+        return df
+
+    def append(self, df: pd.DataFrame, index: str = "equities") -> int:
+        if df is None or df.empty:
+            return 0
+        import pandas as pd
+
+        pa, pq = AnnouncementStore.import_pyarrow()
+        df = self.__normalize(df)
+        if AnnouncementStore.KEY_COLUMN in df.columns:
+            df = df[~df[AnnouncementStore.KEY_COLUMN].duplicated(keep="last")]
+        written = 0
+        with self.__lock:
+            for day, part in df.groupby(
+                df[AnnouncementStore.INDEX_COLUMN].dt.date, sort=True
+            ):
+                partition = self.get_partition(index, day)
+                if AnnouncementStore.KEY_COLUMN in part.columns:
+                    seq_ids = self.__get_partition_seq_ids(partition)
+                    part = part[~part[AnnouncementStore.KEY_COLUMN].isin(seq_ids)]
+                    if part.empty:
+                        continue
+                    seq_ids.update(
+                        part[AnnouncementStore.KEY_COLUMN].dropna().tolist()
+                    )
+                schema = pa.schema(
+                    [
+                        (
+                            column,
+                            pa.timestamp("ns")
+                            if pd.api.types.is_datetime64_any_dtype(part[column])
+                            else pa.string(),
+                        )
+                        for column in part.columns
+                    ]
+                )
+                table = pa.Table.from_pandas(part, schema=schema, preserve_index=False)
+                os.makedirs(partition, exist_ok=True)
+                filename = partition.joinpath(
+                    f"part-{dtdt.now().strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:8]}.parquet"
+                )
+                tmpfile = filename.with_suffix(".tmp")
+                pq.write_table(table, tmpfile)
+                os.replace(tmpfile, filename)
+                written += len(part)
+        return written
+
+    def indexes(self) -> List[str]:
+        if not self.root.exists():
+            return []
+        return sorted(
+            path.name.split("=", 1)[1]
+            for path in self.root.glob("index=*")
+            if path.is_dir()
+        )
+
+    def __get_files(
+        self,
+        indexes: Iterable[str],
+        from_date: Optional[date],
+        to_date: Optional[date],
+    ) -> List[Path]:
+        files: List[Path] = []
+        for index in indexes:
+            for partition in sorted(self.root.joinpath(f"index={index}").glob("date=*")):
+                day = dtdt.strptime(
+                    partition.name.split("=", 1)[1], AnnouncementStore.DATE_FORMAT
+                ).date()
+                if (from_date is None or day >= from_date) and (
+                    to_date is None or day <= to_date
+                ):
+                    files.extend(sorted(partition.glob("*.parquet")))
+        return files
+
+    def query(
+        self,
+        index: Union[str, List[str], None] = None,
+        symbol: Union[str, List[str], None] = None,
+        from_date: Union[date, str, None] = None,
+        to_date: Union[date, str, None] = None,
+        columns: Optional[List[str]] = None,
+    ) -> pd.DataFrame:
+        import pandas as pd
+
+        pa, pq = AnnouncementStore.import_pyarrow()
+        indexes = (
+            self.indexes()
+            if index is None
+            else [index]
+            if isinstance(index, str)
+            else list(index)
+        )
+        files = self.__get_files(
+            indexes,
+            AnnouncementStore.to_date(from_date),
+            AnnouncementStore.to_date(to_date),
+        )
+        filters = None
+        if symbol is not None:
+            filters = [
+                ("symbol", "in", [symbol] if isinstance(symbol, str) else list(symbol))
+            ]
+        read_columns = None
+        if columns is not None:
+            read_columns = list(
+                dict.fromkeys(
+                    [
+                        AnnouncementStore.INDEX_COLUMN,
+                        AnnouncementStore.KEY_COLUMN,
+                        *columns,
+                    ]
+                )
+            )
+        tables = []
+        for file in files:
+            schema = pq.read_schema(file)
+            file_columns = (
+                None
+                if read_columns is None
+                else [column for column in read_columns if column in schema.names]
+            )
+            tables.append(pq.read_table(file, columns=file_columns, filters=filters))
+        if len(tables) == 0:
+            return pd.DataFrame()
+        df = pa.concat_tables(tables, promote_options="default").to_pandas()
+        if AnnouncementStore.KEY_COLUMN in df.columns:
+            df = df[~df[AnnouncementStore.KEY_COLUMN].duplicated(keep="last")]
+        return df.set_index(AnnouncementStore.INDEX_COLUMN).sort_index(kind="stable")
+
+    def compact(self, index: str, day: Union[date, str]) -> Optional[Path]:
+        pa, pq = AnnouncementStore.import_pyarrow()
+        partition = self.get_partition(index, AnnouncementStore.to_date(day))
+        with self.__lock:
+            files = sorted(partition.glob("*.parquet"))
+            if len(files) < 2:
+                return files[0] if len(files) == 1 else None
+            table = pa.concat_tables(
+                [pq.read_table(file) for file in files], promote_options="default"
+            )
+            filename = partition.joinpath(
+                f"part-{dtdt.now().strftime('%Y%m%d%H%M%S%f')}-{uuid.uuid4().hex[:8]}.parquet"
+            )
+            tmpfile = filename.with_suffix(".tmp")
+            pq.write_table(table, tmpfile)
+            os.replace(tmpfile, filename)
+            for file in files:
+                os.remove(file)
+            return filename
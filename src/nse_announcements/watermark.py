@@ -0,0 +1,80 @@
+from __future__ import annotations
+from collections import deque
+from datetime import datetime as dtdt
+from typing import Any, Deque, Dict, Hashable, Iterable, List, Optional, Set
+
+__all__ = ["AnnouncementWatermark"]
+
+
+class AnnouncementWatermark:
+    AN_DT_FORMAT: str = "%d-%b-%Y %H:%M:%S"
+    DEFAULT_MAX_KEYS: int = 50_000
+
+    @staticmethod
+    def parse_an_dt(value: Any) -> Optional[dtdt]:
+        if isinstance(value, dtdt):
+            return value
+        if isinstance(value, str):
+            try:
+                return dtdt.strptime(value, AnnouncementWatermark.AN_DT_FORMAT)
+            except ValueError:
+                return None
+        return None
+
+    @staticmethod
+    def get_record_key(record: Dict[str, Any]) -> Hashable:
+        seq_id = record.get("seq_id")
+        if seq_id is not None and seq_id != "":
+            return ("seq_id", str(seq_id))
+        return ("an_dt", record.get("an_dt"), record.get("symbol"))
+
+    def __init__(self, max_keys: int = DEFAULT_MAX_KEYS) -> None:
+        self.max_keys = max_keys
+        self.__seen: Set[Hashable] = set()
+        self.__order: Deque[Hashable] = deque()
+        self.__seen_an_dt: Dict[Hashable, Optional[dtdt]] = {}
+        self.floor: Optional[dtdt] = None
+        self.high: Optional[dtdt] = None
+        self.last_records: Optional[List[Dict[str, Any]]] = None
+
+    def __len__(self) -> int:
+        return len(self.__seen)
+
+    def __contains__(self, record: Dict[str, Any]) -> bool:
+        return AnnouncementWatermark.get_record_key(record) in self.__seen
+
+    def reset(self) -> None:
+        self.__seen.clear()
+        self.__order.clear()
+        self.__seen_an_dt.clear()
+        self.floor = None
+        self.high = None
+        self.last_records = None
+
+    def __remember(self, key: Hashable, an_dt: Optional[dtdt]) -> None:
+        self.__seen.add(key)
+        self.__order.append(key)
+        self.__seen_an_dt[key] = an_dt
+        if an_dt is not None and (self.high is None or an_dt > self.high):
+            self.high = an_dt
+        while len(self.__order) > self.max_keys:
+            evicted = self.__order.popleft()
+            self.__seen.discard(evicted)
+            evicted_an_dt = self.__seen_an_dt.pop(evicted, None)
+            if evicted_an_dt is not None and (
+                self.floor is None or evicted_an_dt > self.floor
+            ):
+                self.floor = evicted_an_dt
+
+    def filter_new(self, records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        new_records: List[Dict[str, Any]] = []
+        for record in records:
+            key = AnnouncementWatermark.get_record_key(record)
+            if key in self.__seen:
+                continue
+            an_dt = AnnouncementWatermark.parse_an_dt(record.get("an_dt"))
+            if self.floor is not None and an_dt is not None and an_dt <= self.floor:
+                continue
+            self.__remember(key, an_dt)
+            new_records.append(record)
+        return new_records
@@ -0,0 +1,129 @@
+import re
+import pytest
+from nse_announcements import AlertEngine, AlertRule
+from nse_announcements.alerts import KeywordAutomaton
+
+
+def make_record(seq_id, symbol="INFY", desc="Updates", text=None, isin=None):
+    return {
+        "seq_id": str(seq_id),
+        "symbol": symbol,
+        "sm_isin": isin,
+        "desc": desc,
+        "attchmntText": text,
+        "an_dt": "16-Oct-2026 10:00:00",
+    }
+
+
+@pytest.mark.parametrize(
+    "pattern, literal",
+    [
+        (r"pledge", "pledge"),
+        (r"credit\s+rating", "credit"),
+        (r"buy-?back", "back"),
+        (r"divid(?:end|ends)", "divid"),
+        (r"[abc]def", "def"),
+        (r"(?:outcome) of board", "board"),
+        (r"pledge|encumbrance", None),
+        (r"x", None),
+        (r"\x41BC corp", None),
+        (r"\d{10}", None),
+        (r"\n", None),
+        (r"ab{2}cd", "cd"),
+        (r"colou?r code", "colo"),
+        (r"a{,3}bcd", "bcd"),
+        (r"foo{1,2}bar", "bar"),
+        (r"[\]a]bc de", "bc"),
+        (r"\btata\b", "tata"),
+    ],
+)
+def test_get_literal(pattern, literal):
+    assert AlertEngine.get_literal(re.compile(pattern, re.I)) == literal
+
+
+def test_get_literal_skips_verbose_patterns():
+    assert AlertEngine.get_literal(re.compile(r"pledge  # comment", re.X)) is None
+
+
+@pytest.mark.parametrize(
+    "pattern, text, found",
+    [
+        (r"\d{10}", "Phone 9876543299 disclosed", "9876543299"),
+        (r"\x41BC", "ABC Ltd", "ABC"),
+        (r"colou?r code", "Color Code Changed", "Color Code"),
+        (r"ab{2}cd", "xabbcdx", "abbcd"),
+    ],
+)
+def test_prefilter_keeps_true_matches(pattern, text, found):
+    engine = AlertEngine([AlertRule("rule", patterns=[pattern])], seed=False)
+    assert [hits for _, hits in engine.match({"desc": text})] == [(found,)]
+
+
+def test_automaton_matches_words_and_phrases():
+    automaton = KeywordAutomaton(["board meeting", "Meeting", "outcome of board meeting"])
+    assert automaton.find("Outcome of Board Meeting held today") == {0, 1, 2}
+    assert automaton.find("Outcome of the Board Meeting") == {0, 1}
+    assert automaton.find("Board meetings") == set()
+
+
+def test_automaton_follows_failure_links():
+    automaton = KeywordAutomaton(["a b c", "b c d"])
+    assert automaton.find("a b c d") == {0, 1}
+    assert automaton.find("a b d") == set()
+
+
+def test_match_requires_every_condition_of_a_rule():
+    engine = AlertEngine(
+        [
+            AlertRule("watchlist", symbols=["infy"], keywords=["buyback"]),
+            AlertRule("pledges", keywords=["pledge", "encumbrance"]),
+            AlertRule("ratings", patterns=[r"credit\s+rating"], fields=("desc",)),
+            AlertRule("isin", isins=["ine009a01021"]),
+        ]
+    )
+    matched = engine.match(make_record(1, desc="Buyback Of Shares"))
+    assert [(rule.name, hits) for rule, hits in matched] == [("watchlist", ("buyback",))]
+    assert engine.match(make_record(2, symbol="TCS", desc="Buyback Of Shares")) == []
+    names = {
+        rule.name: hits
+        for rule, hits in engine.match(
+            make_record(3, symbol="TCS", desc="Credit Rating", text="creation of pledge")
+        )
+    }
+    assert names == {"ratings": ("Credit Rating",), "pledges": ("pledge",)}
+    assert engine.match(make_record(4, symbol="TCS", text="credit rating")) == []
+    assert [rule.name for rule, _ in engine.match(make_record(5, isin="INE009A01021"))] == [
+        "isin"
+    ]
+
+
+def test_evaluate_seeds_then_fires_only_for_new_announcements():
+    fired = []
+    engine = AlertEngine([AlertRule("pledges", keywords=["pledge"])], callbacks=[fired.append])
+    history = [make_record(seq_id, desc="Pledge") for seq_id in range(3)]
+    assert engine.evaluate(history) == []
+    assert engine.stats()["seeded"] == 3
+    alerts = engine.evaluate(history + [make_record(3, desc="Pledge"), make_record(4)])
+    assert [alert.announcement.seq_id for alert in alerts] == ["3"]
+    assert fired == alerts
+    assert engine.evaluate(history + [make_record(3, desc="Pledge")]) == []
+
+
+def test_evaluate_without_seeding_fires_for_history():
+    engine = AlertEngine([AlertRule("pledges", keywords=["pledge"])], seed=False)
+    assert len(engine.evaluate([make_record(seq_id, desc="Pledge") for seq_id in range(3)])) == 3
+
+
+def test_failing_callback_is_counted():
+    engine = AlertEngine(
+        [AlertRule("all", symbols=["INFY"], callback=lambda alert: 1 / 0)], seed=False
+    )
+    assert len(engine.evaluate([make_record(1)])) == 1
+    assert engine.stats()["callback_errors"] == 1
+
+
+def test_rule_validation():
+    with pytest.raises(ValueError):
+        AlertRule("empty")
+    with pytest.raises(ValueError):
+        AlertRule("bad field", keywords=["x"], fields=("symbol",))
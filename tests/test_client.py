@@ -0,0 +1,85 @@
+import json
+import pytest
+
+pytest.importorskip("curl_cffi")
+
+from curl_cffi import CurlHttpVersion
+from benchmarks.server import NseStandInServer, generate_announcements
+from nse_announcements import AlertEngine, AlertRule, IssuerCache, NseFetch, ResponseCache
+from nse_announcements.base import NseFetchBase
+
+
+@pytest.fixture
+def server(monkeypatch):
+    with NseStandInServer(records=50) as server:
+        monkeypatch.setattr(NseFetchBase, "ROOT", server.url)
+        yield server
+
+
+def set_records(server, records):
+    server.records = records
+    server.body = json.dumps(records).encode("utf-8")
+
+
+def make_client(**kwargs):
+    return NseFetch(
+        debug=False,
+        http_version=CurlHttpVersion.V1_1,
+        issuer_cache=IssuerCache(persist=False),
+        **kwargs,
+    )
+
+
+def test_new_announcements_since_last_poll(server):
+    with make_client() as nsefetch:
+        first = nsefetch.get_new_corporate_announcement(output="records")
+        assert len(first) == 50
+        assert nsefetch.get_new_corporate_announcement(output="records") == []
+        set_records(server, generate_announcements(55))
+        new = nsefetch.get_new_corporate_announcement(output="records")
+        assert len(new) == 5
+
+
+def test_undecodable_body_is_not_cached(server, tmp_path):
+    cache = ResponseCache(tmp_path)
+    params = {"data_for": NseFetch.CUSTOM, "from_date": "01-01-2025", "to_date": "05-01-2025"}
+    good = server.body
+    server.body = b"<html>Resource not found</html>"
+    with make_client(response_cache=cache) as nsefetch:
+        assert nsefetch.get_corporate_announcement(**params) is None
+        assert len(cache) == 0
+        server.body = good
+        assert len(nsefetch.get_corporate_announcement(**params)) == 50
+        assert len(nsefetch.get_corporate_announcement(**params)) == 50
+    assert server.calls["ca"] == 2
+    assert cache.stats()["hits"] == 1
+
+
+def test_alerts_fire_only_after_the_first_response(server):
+    fired = []
+    engine = AlertEngine([AlertRule("buyback", keywords=["buyback"])], callbacks=[fired.append])
+    with make_client(alert_engine=engine) as nsefetch:
+        nsefetch.get_corporate_announcement(output="records")
+        assert fired == [] and engine.stats()["seeded"] == 50
+        set_records(server, generate_announcements(200))
+        nsefetch.get_corporate_announcement(output="records")
+    assert len(fired) > 0
+    assert all("buyback" in alert.matched for alert in fired)
+
+
+def test_shared_client_rebinds_to_a_new_transport(server):
+    nsefetch = make_client(shared=True, handle_signals=False)
+    try:
+        assert len(nsefetch.get_corporate_announcement(output="records")) == 50
+        first = nsefetch.transport
+        nsefetch.close()
+        assert first.closed and nsefetch.transport is None
+        assert len(nsefetch.get_corporate_announcement(output="records")) == 50
+        second = nsefetch.transport
+        assert second is not first
+        assert nsefetch.client.session_pool is second.session_pool
+        assert nsefetch.client.scheduler is second.scheduler
+        assert nsefetch.client.metrics is second.metrics
+        assert nsefetch.client.scheduler.requests > 0
+    finally:
+        nsefetch.close()
@@ -0,0 +1,36 @@
+import pytest
+from nse_announcements.base import NseFetchBase
+
+
+def test_month_windows_cover_the_range_without_gaps():
+    assert NseFetchBase.get_date_windows("15-01-2025", "20-03-2025", "month") == [
+        ("15-01-2025", "14-02-2025"),
+        ("15-02-2025", "14-03-2025"),
+        ("15-03-2025", "20-03-2025"),
+    ]
+
+
+def test_week_windows_end_on_the_last_day():
+    assert NseFetchBase.get_date_windows("01-01-2025", "14-01-2025", "week") == [
+        ("01-01-2025", "07-01-2025"),
+        ("08-01-2025", "14-01-2025"),
+    ]
+
+
+def test_fortnight_windows_cross_month_ends():
+    assert NseFetchBase.get_date_windows("25-02-2024", "20-03-2024", "fortnight") == [
+        ("25-02-2024", "10-03-2024"),
+        ("11-03-2024", "20-03-2024"),
+    ]
+
+
+def test_single_day_and_empty_ranges():
+    assert NseFetchBase.get_date_windows("05-01-2025", "05-01-2025") == [
+        ("05-01-2025", "05-01-2025")
+    ]
+    assert NseFetchBase.get_date_windows("06-01-2025", "05-01-2025") == []
+
+
+def test_unknown_window_is_rejected():
+    with pytest.raises(KeyError):
+        NseFetchBase.get_date_windows("01-01-2025", "31-01-2025", "year")
@@ -0,0 +1,68 @@
+from datetime import date
+from datetime import datetime as dtdt
+import pytest
+from nse_announcements.daemon import PollSchedule
+
+FRIDAY = date(2026, 10, 16)
+
+
+def at(day, hour, minute=0, second=0):
+    return dtdt(day.year, day.month, day.day, hour, minute, second)
+
+
+@pytest.mark.parametrize(
+    "hour, minute, phase",
+    [
+        (0, 0, "closed"),
+        (7, 59, "closed"),
+        (8, 0, "extended"),
+        (8, 59, "extended"),
+        (9, 0, "market"),
+        (15, 59, "market"),
+        (16, 0, "extended"),
+        (22, 59, "extended"),
+        (23, 0, "closed"),
+    ],
+)
+def test_trading_day_phase_boundaries(hour, minute, phase):
+    assert PollSchedule().get_phase(at(FRIDAY, hour, minute)) == phase
+
+
+def test_weekends_and_holidays_are_closed():
+    schedule = PollSchedule(holidays="2026-10-16")
+    assert schedule.get_phase(at(FRIDAY, 10)) == "closed"
+    assert PollSchedule().get_phase(at(date(2026, 10, 17), 10)) == "closed"
+    assert PollSchedule(holidays=[FRIDAY]).holidays == {FRIDAY}
+
+
+def test_next_change_points_at_the_next_session():
+    schedule = PollSchedule()
+    assert schedule.get_next_change(at(FRIDAY, 8, 59, 30)) == 30
+    assert schedule.get_next_change(at(FRIDAY, 23, 30)) == 30 * 60
+    assert schedule.get_next_change(at(date(2026, 10, 17), 12)) == 12 * 60 * 60
+
+
+def test_interval_is_capped_by_the_next_session():
+    schedule = PollSchedule(min_interval=0.5)
+    assert schedule.next_interval(at(FRIDAY, 12)) == 3.0
+    assert schedule.next_interval(at(FRIDAY, 2)) == 60.0
+    assert schedule.next_interval(at(FRIDAY, 8, 59, 58)) == 2.0
+    assert schedule.next_interval(at(FRIDAY, 8, 59, 59)) == 1.0
+
+
+def test_empty_and_failed_polls_back_off_up_to_the_limit():
+    schedule = PollSchedule(backoff=2.0, max_backoff=4.0)
+    schedule.observe(0)
+    assert schedule.next_interval(at(FRIDAY, 12)) == 6.0
+    schedule.observe(None)
+    schedule.observe(0)
+    assert schedule.next_interval(at(FRIDAY, 12)) == 12.0
+    schedule.observe(0)
+    assert schedule.next_interval(at(FRIDAY, 12)) == 12.0
+
+
+def test_bursts_tighten_the_interval():
+    schedule = PollSchedule(window=10.0, min_interval=0.25)
+    schedule.observe(20)
+    assert schedule.failed_polls == 0 and schedule.empty_polls == 0
+    assert schedule.next_interval(at(FRIDAY, 2)) == 0.5
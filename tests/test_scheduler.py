@@ -0,0 +1,21 @@
+from nse_announcements.scheduler import CircuitBreaker
+
+
+def test_cooldown_starts_when_the_breaker_opens():
+    breaker = CircuitBreaker(threshold=3, cooldown=30.0)
+    assert breaker.record_failure() is False
+    assert breaker.record_failure() is False
+    assert breaker.get_cooldown_remaining() == 0.0
+    assert breaker.record_failure() is True
+    assert breaker.is_open
+    assert breaker.get_cooldown_remaining() > 29.0
+
+
+def test_half_open_does_not_restart_the_cooldown():
+    breaker = CircuitBreaker(threshold=1, cooldown=30.0)
+    breaker.record_failure()
+    opened_at = breaker.opened_at
+    breaker.half_open()
+    assert breaker.opened_at == opened_at
+    assert breaker.record_failure() is True
+    assert breaker.opened_at >= opened_at
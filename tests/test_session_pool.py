@@ -0,0 +1,30 @@
+import asyncio
+import pytest
+
+pytest.importorskip("curl_cffi")
+
+from curl_cffi import CurlHttpVersion
+from benchmarks.server import NseStandInServer
+from nse_announcements.session_pool import SessionPool
+
+
+def test_close_releases_retired_sessions():
+    async def run(url):
+        pool = SessionPool(url, size=1, http_version=CurlHttpVersion.V1_1, refresh_interval=None)
+        await pool.start()
+        old = pool.acquire()
+        await pool.restart(old)
+        assert pool.acquire() is not old
+        closed = []
+        close = old.close
+
+        async def record_close():
+            closed.append(old)
+            await close()
+
+        old.close = record_close
+        await pool.close()
+        assert closed == [old]
+
+    with NseStandInServer(records=1) as server:
+        asyncio.run(run(server.url))
@@ -0,0 +1,47 @@
+from nse_announcements import AnnouncementWatermark
+
+
+def make_record(seq_id, an_dt="16-Oct-2026 10:00:00", symbol="INFY"):
+    return {"seq_id": seq_id, "an_dt": an_dt, "symbol": symbol}
+
+
+def test_filter_new_skips_seen_records():
+    watermark = AnnouncementWatermark()
+    first = [make_record("1"), make_record("2")]
+    assert watermark.filter_new(first) == first
+    assert watermark.filter_new(first + [make_record("3")]) == [make_record("3")]
+    assert watermark.filter_new(first) == []
+    assert len(watermark) == 3
+
+
+def test_records_without_seq_id_are_keyed_on_time_and_symbol():
+    watermark = AnnouncementWatermark()
+    records = [make_record(None, symbol="INFY"), make_record("", symbol="TCS")]
+    assert watermark.filter_new(records) == records
+    assert watermark.filter_new([make_record(None, symbol="INFY")]) == []
+    assert make_record("", symbol="TCS") in watermark
+
+
+def test_evicted_keys_raise_the_floor():
+    watermark = AnnouncementWatermark(max_keys=2)
+    watermark.filter_new(
+        [
+            make_record("1", "16-Oct-2026 10:00:00"),
+            make_record("2", "16-Oct-2026 10:01:00"),
+            make_record("3", "16-Oct-2026 10:02:00"),
+        ]
+    )
+    assert len(watermark) == 2
+    assert watermark.floor is not None and watermark.floor.minute == 0
+    assert watermark.filter_new([make_record("1", "16-Oct-2026 10:00:00")]) == []
+    late = make_record("4", "16-Oct-2026 10:03:00")
+    assert watermark.filter_new([late]) == [late]
+    assert watermark.high.minute == 3
+
+
+def test_reset_forgets_everything():
+    watermark = AnnouncementWatermark()
+    watermark.filter_new([make_record("1")])
+    watermark.reset()
+    assert len(watermark) == 0 and watermark.high is None
+    assert watermark.filter_new([make_record("1")]) == [make_record("1")]